@@ -1,10 +1,12 @@
 import abc
 import os
+import threading
+import time
 
 # multiprocessing.RLock is a function returning this type
 from multiprocessing.synchronize import RLock
 from threading import get_ident
-from typing import Dict, Tuple, Hashable, Optional, ContextManager, List
+from typing import Any, Dict, Tuple, Hashable, Optional, ContextManager, List
 
 import agate
 
@@ -25,6 +27,7 @@ from dbt.events.functions import fire_event
 from dbt.events.types import (
     NewConnection,
     ConnectionReused,
+    PooledConnectionReused,
     ConnectionLeftOpen,
     ConnectionLeftOpen2,
     ConnectionClosed,
@@ -35,6 +38,72 @@ from dbt.events.types import (
 from dbt import flags
 
 
+class ConnectionPool:
+    """The open handles of released connections, kept for the connections
+    of later nodes on any thread instead of opening new ones.
+
+    At most max_size handles are kept. A handle that has been idle for more
+    than max_idle seconds, or that was closed in the meantime, is closed
+    instead of handed out again.
+    """
+
+    def __init__(self, max_size: int, max_idle: float) -> None:
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.lock = threading.Lock()
+        self._idle: List[Tuple[float, Any]] = []
+        # how many handles were opened and how many were handed out again
+        self.opened = 0
+        self.reused = 0
+
+    def record_open(self) -> None:
+        with self.lock:
+            self.opened += 1
+
+    def take(self) -> Optional[Any]:
+        """Return an idle handle, or None if there are none to reuse."""
+        evicted = []
+        handle = None
+        with self.lock:
+            now = time.monotonic()
+            while self._idle:
+                released_at, candidate = self._idle.pop()
+                if now - released_at > self.max_idle or getattr(candidate, "closed", False):
+                    evicted.append(candidate)
+                else:
+                    handle = candidate
+                    self.reused += 1
+                    break
+        for candidate in evicted:
+            self._close(candidate)
+        return handle
+
+    def put(self, handle: Any) -> bool:
+        """Keep the handle for reuse. Return False if the pool is full."""
+        with self.lock:
+            if len(self._idle) >= self.max_size:
+                return False
+            self._idle.append((time.monotonic(), handle))
+            return True
+
+    def clear(self) -> None:
+        """Close all the idle handles."""
+        with self.lock:
+            idle, self._idle = self._idle, []
+        for _, handle in idle:
+            self._close(handle)
+
+    @staticmethod
+    def _close(handle: Any) -> None:
+        if not hasattr(handle, "close"):
+            return
+        try:
+            handle.close()
+        except Exception:
+            # the handle is being thrown away, a broken one may fail to close
+            pass
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -45,17 +114,24 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         - clear_transaction
         - execute
 
+    Methods to implement to reuse connections between nodes:
+        - reset
+
     You must also set the 'TYPE' class attribute with a class-unique constant
     string.
     """
 
     TYPE: str = NotImplemented
+    # seconds a released handle may sit in the pool before it is closed
+    POOL_MAX_IDLE: float = 60.0
 
     def __init__(self, profile: AdapterRequiredConfig):
         self.profile = profile
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = flags.MP_CONTEXT.RLock()
         self.query_header: Optional[MacroQueryStringSetter] = None
+        # one handle per thread, and one for the master connection
+        self.pool = ConnectionPool(profile.threads + 1, self.POOL_MAX_IDLE)
 
     def set_query_header(self, manifest: Manifest) -> None:
         self.query_header = MacroQueryStringSetter(self.profile, manifest)
@@ -154,7 +230,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         if conn.state == "open":
             fire_event(ConnectionReused(conn_name=conn_name))
         else:
-            conn.handle = LazyHandle(self.open)
+            conn.handle = LazyHandle(self._open_or_reuse)
 
         conn.name = conn_name
         return conn
@@ -178,6 +254,46 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         """
         raise dbt.exceptions.NotImplementedException("`open` is not implemented for this adapter!")
 
+    @classmethod
+    def reset(cls, connection: Connection) -> bool:
+        """Reset the session of the given open connection, so that its handle
+        can be used by another node: roll back any open transaction and
+        restore the session settings a new handle starts with.
+
+        Return True if the handle can be reused, or False to close it. Any
+        open transaction is rolled back when it is closed. Adapters opt in to
+        reusing handles by implementing this.
+        """
+        return False
+
+    def _open_or_reuse(self, connection: Connection) -> Connection:
+        """Give the connection an idle handle from the pool, or open a new
+        one.
+        """
+        handle = self.pool.take() if flags.REUSE_CONNECTIONS else None
+        if handle is None:
+            self.pool.record_open()
+            return self.open(connection)
+
+        fire_event(PooledConnectionReused(conn_name=connection.name))
+        connection.handle = handle
+        connection.state = ConnectionState.OPEN
+        return connection
+
+    def _release_to_pool(self, connection: Connection) -> bool:
+        """Reset the connection and move its handle to the pool. Return False
+        if the handle can't be reused.
+        """
+        if not flags.REUSE_CONNECTIONS or connection.state != ConnectionState.OPEN:
+            return False
+        if not self.reset(connection) or not self.pool.put(connection.handle):
+            return False
+
+        connection.handle = None
+        connection.transaction_open = False
+        connection.state = ConnectionState.CLOSED
+        return True
+
     def release(self) -> None:
         with self.lock:
             conn = self.get_if_exists()
@@ -185,9 +301,11 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                 return
 
         try:
-            # always close the connection. close() calls _rollback() if there
-            # is an open transaction
-            self.close(conn)
+            # hand the connection on to the next node if the adapter can reset
+            # it, or else close it. close() calls _rollback() if there is an
+            # open transaction
+            if not self._release_to_pool(conn):
+                self.close(conn)
         except Exception:
             # if rollback or close failed, remove our busted connection
             self.clear_thread_connection()
@@ -204,6 +322,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
             # garbage collect these connections
             self.thread_connections.clear()
+        self.pool.clear()
 
     @abc.abstractmethod
     def begin(self) -> None:
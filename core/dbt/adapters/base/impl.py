@@ -1,4 +1,5 @@
 import abc
+import threading
 from concurrent.futures import as_completed, Future
 from contextlib import contextmanager
 from datetime import datetime
@@ -42,8 +43,8 @@ from dbt.contracts.graph.manifest import Manifest, MacroManifest
 from dbt.contracts.graph.parsed import ParsedSeedNode
 from dbt.exceptions import warn_or_error
 from dbt.events.functions import fire_event
-from dbt.events.types import CacheMiss, ListRelations
-from dbt.utils import filter_null_values, executor
+from dbt.events.types import CacheMiss, CacheSchemaLazily, ListRelations
+from dbt.utils import filter_null_values, executor, lowercase
 
 from dbt.adapters.base.connections import Connection, AdapterResponse
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -54,7 +55,7 @@ from dbt.adapters.base.relation import (
     SchemaSearchMap,
 )
 from dbt.adapters.base import Column as BaseColumn
-from dbt.adapters.cache import RelationsCache, _make_key
+from dbt.adapters.cache import PartitionedRelationsCache, _make_key
 
 
 SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
@@ -62,6 +63,7 @@ SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
 
 GET_CATALOG_MACRO_NAME = "get_catalog"
 FRESHNESS_MACRO_NAME = "collect_freshness"
+FRESHNESS_BATCH_MACRO_NAME = "collect_freshness_batch"
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -114,6 +116,28 @@ def _utc(dt: Optional[datetime], source: BaseRelation, field_name: str) -> datet
         return dt.replace(tzinfo=pytz.UTC)
 
 
+def _freshness(
+    max_loaded_at: Optional[datetime],
+    snapshotted_at: Optional[datetime],
+    source: BaseRelation,
+    loaded_at_field: str,
+) -> Dict[str, Any]:
+    if max_loaded_at is None:
+        # no records in the table, so really the max_loaded_at was
+        # infinitely long ago. Just call it 0:00 January 1 year UTC
+        max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
+    else:
+        max_loaded_at = _utc(max_loaded_at, source, loaded_at_field)
+
+    snapshotted_at = _utc(snapshotted_at, source, loaded_at_field)
+    age = (snapshotted_at - max_loaded_at).total_seconds()
+    return {
+        "max_loaded_at": max_loaded_at,
+        "snapshotted_at": snapshotted_at,
+        "age": age,
+    }
+
+
 def _relation_name(rel: Optional[BaseRelation]) -> str:
     if rel is None:
         return "null relation"
@@ -168,9 +192,14 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     def __init__(self, config):
         self.config = config
-        self.cache = RelationsCache()
+        self.cache = PartitionedRelationsCache()
         self.connections = self.ConnectionManager(config)
         self._macro_manifest_lazy: Optional[MacroManifest] = None
+        # when the cache is populated lazily: the schemas that are cached on
+        # their first lookup, and the lookups of them that are under way
+        self._lazy_cache_schemas: Dict[Tuple[Optional[str], str], BaseRelation] = {}
+        self._lazy_cache_lookups: Dict[Tuple[Optional[str], str], threading.Event] = {}
+        self._lazy_cache_lock = threading.Lock()
 
     ###
     # Methods that pass through to the connection manager
@@ -373,16 +402,96 @@ class BaseAdapter(metaclass=AdapterMeta):
             cache_update.add((relation.database, relation.schema))
         self.cache.update_schemas(cache_update)
 
+    def _defer_relations_cache_for_schemas(
+        self, manifest: Manifest, cache_schemas: Set[BaseRelation] = None
+    ) -> None:
+        """Record the schemas the relations cache should hold without querying
+        them. Each one is populated by the first lookup of a relation in it.
+        """
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(manifest)
+        with self._lazy_cache_lock:
+            self._lazy_cache_schemas = {
+                (lowercase(relation.database), relation.schema.lower()): relation
+                for relation in cache_schemas
+                if relation.schema is not None
+                and (relation.database, relation.schema) not in self.cache
+            }
+
+    def _cache_schema_lazily(self, schema_relation: BaseRelation) -> List[BaseRelation]:
+        """Populate the relations cache for a single schema, and return the
+        relations in it.
+        """
+        relations = self.list_relations_without_caching(schema_relation)
+        for relation in relations:
+            self.cache.add(relation)
+        self.cache.update_schemas([(schema_relation.database, schema_relation.schema)])
+        fire_event(
+            CacheSchemaLazily(
+                conn_name=self.nice_connection_name(),
+                database=schema_relation.database,
+                schema=schema_relation.schema,
+                num_relations=len(relations),
+            )
+        )
+        return relations
+
+    def _populate_schema_lazily(self, database: Optional[str], schema: Optional[str]) -> None:
+        """If the schema is waiting to be cached, cache it. When several
+        threads look up the same schema at once, one of them queries the
+        database and the others wait for it.
+        """
+        if not self._lazy_cache_schemas or schema is None:
+            return
+        key = (lowercase(database), schema.lower())
+        with self._lazy_cache_lock:
+            schema_relation = self._lazy_cache_schemas.get(key)
+            if schema_relation is None:
+                return
+            lookup = self._lazy_cache_lookups.get(key)
+            if lookup is None:
+                lookup = self._lazy_cache_lookups[key] = threading.Event()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            # if the other thread failed, the schema is still waiting and
+            # list_relations falls back to an uncached query
+            lookup.wait()
+            return
+
+        try:
+            self._cache_schema_lazily(schema_relation)
+            with self._lazy_cache_lock:
+                del self._lazy_cache_schemas[key]
+        finally:
+            with self._lazy_cache_lock:
+                del self._lazy_cache_lookups[key]
+            lookup.set()
+
     def set_relations_cache(
-        self, manifest: Manifest, clear: bool = False, required_schemas: Set[BaseRelation] = None
+        self,
+        manifest: Manifest,
+        clear: bool = False,
+        required_schemas: Set[BaseRelation] = None,
+        lazy: bool = False,
     ) -> None:
         """Run a query that gets a populated cache of the relations in the
         database and set the cache on this adapter.
+
+        If lazy is set, no query is run up front: each schema is cached the
+        first time a relation in it is looked up.
         """
         with self.cache.lock:
             if clear:
                 self.cache.clear()
-            self._relations_cache_for_schemas(manifest, required_schemas)
+            if lazy:
+                self._defer_relations_cache_for_schemas(manifest, required_schemas)
+            else:
+                with self._lazy_cache_lock:
+                    self._lazy_cache_schemas = {}
+                self._relations_cache_for_schemas(manifest, required_schemas)
 
     @available
     def cache_added(self, relation: Optional[BaseRelation]) -> str:
@@ -390,6 +499,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         if relation is None:
             name = self.nice_connection_name()
             raise_compiler_error("Attempted to cache a null relation for {}".format(name))
+        self._populate_schema_lazily(relation.database, relation.schema)
         self.cache.add(relation)
         # so jinja doesn't render things
         return ""
@@ -402,6 +512,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         if relation is None:
             name = self.nice_connection_name()
             raise_compiler_error("Attempted to drop a null relation for {}".format(name))
+        self._populate_schema_lazily(relation.database, relation.schema)
         self.cache.drop(relation)
         return ""
 
@@ -422,6 +533,8 @@ class BaseAdapter(metaclass=AdapterMeta):
                 "Attempted to rename {} to {} for {}".format(src_name, dst_name, name)
             )
 
+        self._populate_schema_lazily(from_relation.database, from_relation.schema)
+        self._populate_schema_lazily(to_relation.database, to_relation.schema)
         self.cache.rename(from_relation, to_relation)
         return ""
 
@@ -630,6 +743,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         self.expand_column_types(from_relation, to_relation)
 
     def list_relations(self, database: Optional[str], schema: str) -> List[BaseRelation]:
+        self._populate_schema_lazily(database, schema)
         if self._schema_is_cached(database, schema):
             return self.cache.get_relations(database, schema)
 
@@ -967,7 +1081,24 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     def get_catalog(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
         schema_map = self._get_catalog_schemas(manifest)
-
+        return self._get_catalogs(schema_map, manifest)
+
+    def get_catalog_for_schemas(
+        self, manifest: Manifest, schemas: Set[Tuple[Optional[str], str]]
+    ) -> Tuple[agate.Table, List[Exception]]:
+        """Like get_catalog, but only query the catalog schemas whose
+        lowercased (database, schema) pair is in schemas. It isn't used for
+        adapters that override get_catalog, unless they override this too.
+        """
+        schema_map = self._get_catalog_schemas(manifest)
+        for info, info_schemas in schema_map.items():
+            database = lowercase(info.database)
+            schema_map[info] = {s for s in info_schemas if (database, s) in schemas}
+        return self._get_catalogs(schema_map, manifest)
+
+    def _get_catalogs(
+        self, schema_map: SchemaSearchMap, manifest: Manifest
+    ) -> Tuple[agate.Table, List[Exception]]:
         with executor(self.config) as tpe:
             futures: List[Future[agate.Table]] = []
             for info, schemas in schema_map.items():
@@ -1012,21 +1143,41 @@ class BaseAdapter(metaclass=AdapterMeta):
                     FRESHNESS_MACRO_NAME, [tuple(r) for r in table]
                 )
             )
-        if table[0][0] is None:
-            # no records in the table, so really the max_loaded_at was
-            # infinitely long ago. Just call it 0:00 January 1 year UTC
-            max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
-        else:
-            max_loaded_at = _utc(table[0][0], source, loaded_at_field)
+        return _freshness(table[0][0], table[0][1], source, loaded_at_field)
 
-        snapshotted_at = _utc(table[0][1], source, loaded_at_field)
-        age = (snapshotted_at - max_loaded_at).total_seconds()
-        return {
-            "max_loaded_at": max_loaded_at,
-            "snapshotted_at": snapshotted_at,
-            "age": age,
+    def calculate_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        manifest: Optional[Manifest] = None,
+    ) -> List[Dict[str, Any]]:
+        """Calculate the freshness of several sources in one query. Each
+        source is given as its relation, loaded_at_field and filter, and the
+        freshness of each is returned in the same order.
+        """
+        kwargs: Dict[str, Any] = {
+            "sources": [
+                {"relation": source, "loaded_at_field": loaded_at_field, "filter": filter}
+                for source, loaded_at_field, filter in sources
+            ],
         }
 
+        # run the macro
+        table = self.execute_macro(FRESHNESS_BATCH_MACRO_NAME, kwargs=kwargs, manifest=manifest)
+        # now we have one row for every source: its index in sources, the
+        # maximum `loaded_at_field` value and the current time according to
+        # the db.
+        rows = {int(row[0]): row for row in table if len(row) == 3 and row[0] is not None}
+        if len(table) != len(sources) or sorted(rows) != list(range(len(sources))):
+            raise_compiler_error(
+                'Got an invalid result from "{}" macro: {}'.format(
+                    FRESHNESS_BATCH_MACRO_NAME, [tuple(r) for r in table]
+                )
+            )
+        return [
+            _freshness(rows[index][1], rows[index][2], source, loaded_at_field)
+            for index, (source, loaded_at_field, _) in enumerate(sources)
+        ]
+
     def pre_model_hook(self, config: Mapping[str, Any]) -> Any:
         """A hook for running some operation before the model materialization
         runs. The hook can assume it has a connection available.
@@ -1,6 +1,7 @@
 import threading
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from dbt.adapters.reference_keys import _make_key, _ReferenceKey
 import dbt.exceptions
@@ -169,13 +170,14 @@ class RelationsCache:
 
     :attr Dict[_ReferenceKey, _CachedRelation] relations: The known relations.
     :attr threading.RLock lock: The lock around relations, held during updates.
-        The adapters also hold this lock while filling the cache.
+        The adapters also hold this lock while filling the cache. A
+        PartitionedRelationsCache uses a _SharedExclusiveLock instead.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
     """
 
     def __init__(self) -> None:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
-        self.lock = threading.RLock()
+        self.lock: Union[threading.RLock, "_SharedExclusiveLock"] = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
 
     def add_schema(
@@ -499,3 +501,279 @@ class RelationsCache:
             drop_key = _make_key(relation)
             if drop_key in self.relations:
                 self.drop(drop_key)
+
+
+SchemaKey = Tuple[Optional[str], Optional[str]]
+
+
+def _schema_of(key: _ReferenceKey) -> SchemaKey:
+    return (key.database, key.schema)
+
+
+class _SharedExclusiveLock:
+    """A lock that's either held exclusively by one thread, or shared by any
+    number of threads. Both modes are reentrant, and a thread that holds the
+    lock exclusively can also take it shared. Threads waiting to take it
+    exclusively go first, so a stream of shared holders can't starve them.
+
+    Used as a context manager, it's taken exclusively, like an RLock.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._shared: Dict[int, int] = {}
+        self._waiting = 0
+
+    def acquire(self) -> bool:
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return True
+            self._waiting += 1
+            try:
+                while self._owner is not None or self._shared:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            self._owner = me
+            self._depth = 1
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("cannot release un-acquired lock")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._cond.notify_all()
+
+    def acquire_shared(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner != me and me not in self._shared:
+                while self._owner is not None or self._waiting:
+                    self._cond.wait()
+            self._shared[me] = self._shared.get(me, 0) + 1
+
+    def release_shared(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            self._shared[me] -= 1
+            if self._shared[me] == 0:
+                del self._shared[me]
+                if not self._shared:
+                    self._cond.notify_all()
+
+    def __enter__(self) -> "_SharedExclusiveLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+
+class PartitionedRelationsCache(RelationsCache):
+    """A RelationsCache that's partitioned by schema, so threads that add,
+    drop and rename relations in different schemas don't wait on each other.
+
+    An update that only touches the relations of one schema holds that
+    schema's lock, and `lock` shared. Adding links, dropping or renaming a
+    relation with links to other schemas, and renaming a relation to another
+    schema hold `lock` exclusively instead, as does everything that reads the
+    whole cache. The adapters also hold `lock` while filling the cache, as
+    with a RelationsCache.
+
+    :attr Dict[SchemaKey, Dict[_ReferenceKey, _CachedRelation]] partitions:
+        The known relations, by schema.
+    """
+
+    lock: _SharedExclusiveLock
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lock = _SharedExclusiveLock()
+        self.partitions: Dict[SchemaKey, Dict[_ReferenceKey, _CachedRelation]] = {}
+        # the keys of the relations that each relation refers to, the reverse
+        # of their referenced_by, so no update has to look at every relation
+        self._references: Dict[_ReferenceKey, Set[_ReferenceKey]] = {}
+        self._schema_locks: Dict[SchemaKey, threading.RLock] = {}
+        self._schema_locks_lock = threading.Lock()
+
+    @contextmanager
+    def _schema_lock(self, schema: SchemaKey) -> Iterator[None]:
+        with self._schema_locks_lock:
+            lock = self._schema_locks.setdefault(schema, threading.RLock())
+        self.lock.acquire_shared()
+        try:
+            with lock:
+                yield
+        finally:
+            self.lock.release_shared()
+
+    def _in_schema(self, keys: Iterable[_ReferenceKey], schema: SchemaKey) -> bool:
+        return all(_schema_of(key) == schema for key in keys)
+
+    def _links_in_schema(self, key: _ReferenceKey) -> bool:
+        """Return whether every relation that the relation refers to, or that
+        refers to it, is in the same schema. The caller must hold the lock of
+        the relation's schema.
+        """
+        schema = _schema_of(key)
+        return self._in_schema(self.relations[key].referenced_by, schema) and self._in_schema(
+            self._references.get(key, ()), schema
+        )
+
+    def _local_consequences(self, dropped_key: _ReferenceKey) -> Optional[Set[_ReferenceKey]]:
+        """Return the relations that would be dropped with dropped_key if none
+        of them has links to another schema, otherwise None.
+        """
+        consequences: Set[_ReferenceKey] = set()
+        pending = [dropped_key]
+        while pending:
+            key = pending.pop()
+            if key in consequences:
+                continue
+            if key not in self.relations or not self._links_in_schema(key):
+                return None
+            consequences.add(key)
+            pending.extend(self.relations[key].referenced_by)
+        return consequences
+
+    def _setdefault(self, relation: _CachedRelation):
+        self.add_schema(relation.database, relation.schema)
+        key = relation.key()
+        cached = self.relations.setdefault(key, relation)
+        self.partitions.setdefault(_schema_of(key), {}).setdefault(key, cached)
+        return cached
+
+    def _add_link(self, referenced_key, dependent_key):
+        super()._add_link(referenced_key, dependent_key)
+        if referenced_key in self.relations:
+            self._references.setdefault(dependent_key, set()).add(referenced_key)
+
+    def add(self, relation):
+        cached = _CachedRelation(relation)
+        fire_event(AddRelation(relation=_make_key(cached)))
+        fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
+        with self._schema_lock(_schema_of(cached.key())):
+            self._setdefault(cached)
+        fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
+    def _remove_refs(self, keys):
+        for key in keys:
+            del self.relations[key]
+            self.partitions[_schema_of(key)].pop(key)
+        # the relations that referred to the removed relations are dropped
+        # with them, so only the relations they referred to need updating
+        for key in keys:
+            for referenced_key in self._references.pop(key, ()):
+                referenced = self.relations.get(referenced_key)
+                if referenced is not None:
+                    referenced.release_references(keys)
+
+    def drop(self, relation):
+        dropped_key = _make_key(relation)
+        fire_event(DropRelation(dropped=dropped_key))
+        with self._schema_lock(_schema_of(dropped_key)):
+            if dropped_key not in self.relations:
+                fire_event(DropMissingRelation(relation=dropped_key))
+                return
+            consequences = self._local_consequences(dropped_key)
+            if consequences is not None:
+                fire_event(DropCascade(dropped=dropped_key, consequences=consequences))
+                self._remove_refs(consequences)
+                return
+        with self.lock:
+            self._drop_cascade_relation(dropped_key)
+
+    def _rename_relation(self, old_key, new_relation):
+        relation = self.relations.pop(old_key)
+        self.partitions[_schema_of(old_key)].pop(old_key)
+        new_key = new_relation.key()
+
+        relation.rename(new_relation)
+        # update the relations that refer to it, and that it refers to
+        referenced_keys = self._references.pop(old_key, set())
+        for referenced_key in referenced_keys:
+            cached = self.relations[referenced_key]
+            fire_event(UpdateReference(old_key=old_key, new_key=new_key, cached_key=cached.key()))
+            cached.rename_key(old_key, new_key)
+        if referenced_keys:
+            self._references[new_key] = referenced_keys
+        for dependent_key in relation.referenced_by:
+            references = self._references[dependent_key]
+            references.discard(old_key)
+            references.add(new_key)
+
+        self.relations[new_key] = relation
+        self.partitions.setdefault(_schema_of(new_key), {})[new_key] = relation
+        self.add_schema(new_key.database, new_key.schema)
+
+        return True
+
+    def _check_rename_constraints(self, old_key, new_key):
+        if new_key in self.relations:
+            dbt.exceptions.raise_cache_inconsistent(
+                "in rename, new key {} already in cache: {}".format(
+                    new_key, list(self.partitions.get(_schema_of(new_key), {}))
+                )
+            )
+
+        if old_key not in self.relations:
+            fire_event(TemporaryRelation(key=old_key))
+            return False
+        return True
+
+    def rename(self, old, new):
+        old_key = _make_key(old)
+        new_key = _make_key(new)
+        fire_event(RenameSchema(old_key=old_key, new_key=new_key))
+
+        fire_event(DumpBeforeRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
+
+        schema = _schema_of(old_key)
+        renamed = False
+        if _schema_of(new_key) == schema:
+            with self._schema_lock(schema):
+                if old_key not in self.relations or self._links_in_schema(old_key):
+                    if self._check_rename_constraints(old_key, new_key):
+                        self._rename_relation(old_key, _CachedRelation(new))
+                    else:
+                        self._setdefault(_CachedRelation(new))
+                    renamed = True
+        if not renamed:
+            with self.lock:
+                if self._check_rename_constraints(old_key, new_key):
+                    self._rename_relation(old_key, _CachedRelation(new))
+                else:
+                    self._setdefault(_CachedRelation(new))
+
+        fire_event(DumpAfterRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
+
+    def get_relations(self, database: Optional[str], schema: Optional[str]) -> List[Any]:
+        key = (lowercase(database), lowercase(schema))
+        with self._schema_lock(key):
+            results = [r.inner for r in self.partitions.get(key, {}).values()]
+
+        if None in results:
+            dbt.exceptions.raise_cache_inconsistent(
+                "in get_relations, a None relation was found in the cache!"
+            )
+        return results
+
+    def clear(self):
+        with self.lock:
+            super().clear()
+            self.partitions.clear()
+            self._references.clear()
+
+    def _list_relations_in_schema(
+        self, database: Optional[str], schema: Optional[str]
+    ) -> List[_CachedRelation]:
+        key = (lowercase(database), lowercase(schema))
+        return list(self.partitions.get(key, {}).values())
@@ -1,3 +1,5 @@
+import time
+
 import agate
 from typing import Any, Optional, Tuple, Type, List
 
@@ -8,7 +10,14 @@ from dbt.adapters.base import BaseAdapter, available
 from dbt.adapters.cache import _make_key
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.events.functions import fire_event
-from dbt.events.types import ColTypeChange, SchemaCreation, SchemaDrop
+from dbt.events.types import (
+    ColTypeChange,
+    ConnectionUsed,
+    SchemaCreation,
+    SchemaDrop,
+    SQLQuery,
+    SQLQueryStatus,
+)
 
 
 from dbt.adapters.base.relation import BaseRelation
@@ -65,6 +74,59 @@ class SQLAdapter(BaseAdapter):
         """
         return self.connections.add_query(sql, auto_begin, bindings, abridge_sql_log)
 
+    def _csv_bulk_load_sql(
+        self, relation: BaseRelation, column_names_sql: str, binding_char: str, num_columns: int
+    ) -> str:
+        bindings = ", ".join([binding_char] * num_columns)
+        return f"insert into {relation} ({column_names_sql}) values ({bindings})"
+
+    def _load_csv_chunk(self, cursor: Any, sql: str, rows: List[List[Any]]) -> None:
+        cursor.executemany(sql, rows)
+
+    @available
+    def load_csv_bulk(
+        self,
+        relation: BaseRelation,
+        agate_table: agate.Table,
+        seed_path: str,
+        column_names_sql: str,
+        binding_char: str,
+        batch_size: int,
+    ) -> Tuple[str, int]:
+        """Load all the rows of the seed file at seed_path, which agate_table
+        was read from, into the relation, batch_size rows at a time, without
+        reading the whole file into memory. The values are cast to the types of
+        agate_table's columns.
+
+        Return the SQL used to load the rows and the number of rows loaded.
+        """
+        sql = self._csv_bulk_load_sql(
+            relation, column_names_sql, binding_char, len(agate_table.column_names)
+        )
+        connection = self.connections.get_thread_connection()
+        if connection.transaction_open is False:
+            self.connections.begin()
+        fire_event(ConnectionUsed(conn_type=self.type(), conn_name=connection.name))
+        fire_event(SQLQuery(conn_name=connection.name, sql=sql))
+
+        pre = time.time()
+        rows_loaded = 0
+        chunks = dbt.clients.agate_helper.read_csv_chunks(
+            seed_path, agate_table.column_types, batch_size
+        )
+        with self.connections.exception_handler(sql):
+            cursor = connection.handle.cursor()
+            for chunk in chunks:
+                self._load_csv_chunk(cursor, sql, chunk)
+                rows_loaded += len(chunk)
+
+        fire_event(
+            SQLQueryStatus(
+                status=f"{rows_loaded} rows loaded", elapsed=round((time.time() - pre), 2)
+            )
+        )
+        return sql, rows_loaded
+
     @classmethod
     def convert_text_type(cls, agate_table: agate.Table, col_idx: int) -> str:
         return "text"
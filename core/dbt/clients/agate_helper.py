@@ -3,9 +3,23 @@ from codecs import BOM_UTF8
 import agate
 import datetime
 import isodate
+import itertools
 import json
+import warnings
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from dbt.exceptions import RuntimeException
 
@@ -43,9 +57,103 @@ class ISODateTime(agate.data_types.DateTime):
         raise agate.exceptions.CastError('Can not parse value "%s" as datetime.' % d)
 
 
+class ColumnarTypeTester(agate.TypeTester):
+    """A TypeTester that infers the same types as agate's, in a single pass
+    over any iterable of rows.
+
+    Each column keeps the types that every value so far could be cast to, in
+    order of preference, and a value is only tested once per column. A column
+    is no longer tested once a single type is left, and the rows stop being
+    read once that is true of every column. A column that no type fits is
+    text.
+    """
+
+    # how many distinct values of a column to remember as tested
+    MAX_SEEN_VALUES = 10000
+
+    def __init__(
+        self,
+        force: Mapping[str, agate.data_types.DataType],
+        types: Sequence[agate.data_types.DataType],
+        limit: Optional[int] = None,
+    ) -> None:
+        # agate.TypeTester's attributes are private, so they aren't set here
+        self.force = force
+        self.types = types
+        self.limit = limit
+
+    def run(
+        self, rows: Iterable[Sequence[Any]], column_names: Sequence[str]
+    ) -> Tuple[agate.data_types.DataType, ...]:
+        column_names = list(column_names)
+        num_columns = len(column_names)
+        if self.limit == 0:
+            text = agate.data_types.Text()
+            return tuple([text] * num_columns)
+        if self.limit:
+            rows = itertools.islice(rows, self.limit)
+
+        force_indices: Set[int] = set()
+        for name in self.force.keys():
+            try:
+                force_indices.add(column_names.index(name))
+            except ValueError:
+                warnings.warn(
+                    '"%s" does not match the name of any column in this table.' % name,
+                    RuntimeWarning,
+                )
+
+        possible_types = list(self.types)
+        candidates = [list(possible_types) for _ in range(num_columns)]
+        seen: List[Set[Tuple[type, Any]]] = [set() for _ in range(num_columns)]
+        active = [i for i in range(num_columns) if i not in force_indices]
+        if len(possible_types) <= 1:
+            active = []
+
+        for row in rows if active else ():
+            resolved = False
+            for i in active:
+                if i >= len(row):
+                    continue
+                value = row[i]
+                # True == 1, so the type is part of the key
+                key = (type(value), value)
+                try:
+                    if key in seen[i]:
+                        continue
+                    if len(seen[i]) < self.MAX_SEEN_VALUES:
+                        seen[i].add(key)
+                except TypeError:
+                    # unhashable values are always tested
+                    pass
+                types = candidates[i]
+                remaining = [column_type for column_type in types if column_type.test(value)]
+                if len(remaining) < len(types):
+                    candidates[i] = remaining
+                    resolved = resolved or len(remaining) <= 1
+            if resolved:
+                active = [i for i in active if len(candidates[i]) > 1]
+                if not active:
+                    break
+
+        column_types = []
+        for i in range(num_columns):
+            if i in force_indices:
+                column_types.append(self.force[column_names[i]])
+                continue
+            # select in order of preference
+            for column_type in possible_types:
+                if column_type in candidates[i]:
+                    column_types.append(column_type)
+                    break
+            else:
+                column_types.append(agate.data_types.Text())
+        return tuple(column_types)
+
+
 def build_type_tester(
     text_columns: Iterable[str], string_null_values: Optional[Iterable[str]] = ("null", "")
-) -> agate.TypeTester:
+) -> ColumnarTypeTester:
 
     types = [
         Number(null_values=("null", "")),
@@ -58,7 +166,7 @@ def build_type_tester(
         agate.data_types.Text(null_values=string_null_values),
     ]
     force = {k: agate.data_types.Text(null_values=string_null_values) for k in text_columns}
-    return agate.TypeTester(force=force, types=types)
+    return ColumnarTypeTester(force=force, types=types)
 
 
 DEFAULT_TYPE_TESTER = build_type_tester(())
@@ -135,12 +243,78 @@ def as_matrix(table):
     return [r.values() for r in table.rows.values()]
 
 
-def from_csv(abspath, text_columns):
+def _open_csv(abspath):
+    fp = open(abspath, encoding="utf-8")
+    if fp.read(1) != BOM:
+        fp.seek(0)
+    return fp
+
+
+def from_csv(abspath, text_columns, sample_size: Optional[int] = None):
+    """Read a CSV file into an agate table, inferring the column types.
+
+    If sample_size is set, only that many rows after the header are read into
+    the table. Their types are still inferred from every row of the file, so
+    that the rest of it can be read with read_csv_chunks.
+    """
+    column_types = infer_csv_column_types(abspath, text_columns)
+    with _open_csv(abspath) as fp:
+        if sample_size is None:
+            return agate.Table.from_csv(fp, column_types=column_types)
+        # agate's from_csv reads the whole file even with a row_limit
+        reader = agate.csv.reader(fp)
+        column_names: List[str] = next(reader, [])
+        rows = list(itertools.islice(reader, sample_size))
+        return agate.Table(rows, column_names, column_types=column_types)
+
+
+def infer_csv_column_types(abspath, text_columns) -> Tuple[agate.data_types.DataType, ...]:
+    """Infer the types of the columns of a CSV file, as from_csv does,
+    reading its rows one at a time and only as far as needed.
+    """
     type_tester = build_type_tester(text_columns=text_columns)
-    with open(abspath, encoding="utf-8") as fp:
-        if fp.read(1) != BOM:
-            fp.seek(0)
-        return agate.Table.from_csv(fp, column_types=type_tester)
+    with _open_csv(abspath) as fp:
+        reader = agate.csv.reader(fp)
+        header: List[str] = next(reader, [])
+        # name the columns as agate.Table does, for matching text_columns
+        column_names = agate.utils.deduplicate(header, column_names=True) if header else ()
+        return type_tester.run(reader, column_names)
+
+
+def read_csv_chunks(
+    abspath, column_types: Iterable[agate.data_types.DataType], chunk_size: int
+) -> Iterator[List[List[Any]]]:
+    """Read the rows after the header of a CSV file, cast to column_types,
+    chunk_size rows at a time, without building an agate table of them.
+    """
+    column_types = list(column_types)
+    width = len(column_types)
+    with _open_csv(abspath) as fp:
+        reader = agate.csv.reader(fp)
+        next(reader, None)
+        chunk: List[List[Any]] = []
+        for index, row in enumerate(reader, start=1):
+            if len(row) > width:
+                raise RuntimeException(
+                    f'Row {index} of "{abspath}" has {len(row)} values, but the header has '
+                    f"{width} columns"
+                )
+            # like agate.Table, fill in short rows with nulls
+            values: List[Optional[str]] = [*row, *([None] * (width - len(row)))]
+            try:
+                chunk.append(
+                    [column_type.cast(value) for column_type, value in zip(column_types, values)]
+                )
+            except agate.exceptions.CastError as exc:
+                raise RuntimeException(
+                    f'Row {index} of "{abspath}" does not match the column types inferred from '
+                    f"the file: {exc} Was it changed while it was being loaded?"
+                )
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
 
 class _NullMarker:
@@ -193,7 +367,7 @@ def _merged_column_types(tables: List[agate.Table]) -> Dict[str, agate.data_type
             column_name: str = table.column_names[i]
             column_type: NullableAgateType = table.column_types[i]
             # avoid over-sensitive type inference
-            if all(x is None for x in table.columns[column_name]):
+            if all(row[i] is None for row in table.rows):
                 column_type = _NullMarker()
             new_columns[column_name] = column_type
 
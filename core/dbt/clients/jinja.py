@@ -1,4 +1,5 @@
 import codecs
+import hashlib
 import linecache
 import os
 import re
@@ -10,6 +11,7 @@ from itertools import chain, islice
 from typing import List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple, Callable
 
 import jinja2
+import jinja2.bccache
 import jinja2.ext
 import jinja2.nativetypes  # type: ignore
 import jinja2.nodes
@@ -37,6 +39,7 @@ from dbt.exceptions import (
     UndefinedMacroException,
 )
 from dbt import flags
+from dbt.version import __version__ as dbt_version
 
 
 def _linecache_inject(source, write):
@@ -97,6 +100,35 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
 
         return super()._compile(source, filename)  # type: ignore
 
+    def compile(self, source, name=None, filename=None, raw=False, defer_init=False):
+        """Use the compiled code of templates from the bytecode cache, if
+        there is one. Only templates from source strings are cached.
+        """
+        cache = self.bytecode_cache
+        if (
+            cache is None
+            or not isinstance(source, str)
+            or name is not None
+            or raw
+            or defer_init
+            or flags.MACRO_DEBUGGING
+        ):
+            return super().compile(source, name, filename, raw, defer_init)
+
+        bucket = cache.get_bucket(self, self.bytecode_cache_key(source), None, source)
+        if bucket.code is None:
+            bucket.code = super().compile(source, name, filename, raw, defer_init)
+            cache.set_bucket(bucket)
+        return bucket.code
+
+    def bytecode_cache_key(self, source: str) -> str:
+        # The compiled code also depends on the environment's code generator
+        # and extensions, which change with the environment class and the
+        # dbt version. The bytecode itself is checked against the jinja and
+        # python versions when it's loaded.
+        key = f"{dbt_version}\0{type(self).__name__}\0{source}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
 
 class NativeSandboxEnvironment(MacroFuzzEnvironment):
     code_generator_class = jinja2.nativetypes.NativeCodeGenerator
@@ -207,6 +239,115 @@ class TemplateCache:
 template_cache = TemplateCache()
 
 
+class TemplateBytecodeCache(jinja2.bccache.FileSystemBytecodeCache):
+    """A cache of compiled template code in a directory, which is shared by
+    dbt invocations. Once it grows beyond max_size bytes, the least recently
+    used entries are removed until it's below EVICT_TO of max_size again.
+    """
+
+    EVICT_TO = 0.8
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        super().__init__(directory, "%s.cache")
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # the size of the directory isn't known until something is written
+        self._size: Optional[int] = None
+
+    def get_cache_key(self, name, filename=None):
+        # name is already a hash of the template source, see
+        # MacroFuzzEnvironment.bytecode_cache_key
+        return name
+
+    def load_bytecode(self, bucket):
+        filename = self._get_cache_filename(bucket)
+        try:
+            fp = open(filename, "rb")
+        except OSError:
+            return
+        with fp:
+            bucket.load_bytecode(fp)
+        if bucket.code is not None:
+            # mark the entry as recently used
+            try:
+                os.utime(filename)
+            except OSError:
+                pass
+
+    def dump_bytecode(self, bucket):
+        filename = self._get_cache_filename(bucket)
+        data = bucket.bytecode_to_string()
+        # write to a temporary file first, so that other threads and
+        # processes never read a partially written entry
+        tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if self._size is None:
+                os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_filename, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_filename, filename)
+        except OSError:
+            # caching is best effort
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = self._entries_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".cache"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _entries_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = self.max_size * self.EVICT_TO
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+# The bytecode cache used by environments from get_environment, if any.
+_bytecode_cache: Optional[TemplateBytecodeCache] = None
+
+# The directory under the target path with the bytecode cache, and the
+# default maximum size of the cache.
+BYTECODE_CACHE_DIR = "jinja_bytecode"
+BYTECODE_CACHE_MAX_SIZE = 128 * 2**20
+
+
+def set_bytecode_cache_path(target_path: Optional[str], max_size: int = BYTECODE_CACHE_MAX_SIZE):
+    """Keep compiled templates in a cache under the target path, or stop
+    caching them if target_path is None."""
+    global _bytecode_cache
+    if target_path is None:
+        _bytecode_cache = None
+    else:
+        directory = os.path.join(target_path, BYTECODE_CACHE_DIR)
+        if _bytecode_cache is None or _bytecode_cache.directory != directory:
+            _bytecode_cache = TemplateBytecodeCache(directory, max_size)
+
+
 class BaseMacroGenerator:
     def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
         self.context: Optional[Dict[str, Any]] = context
@@ -482,7 +623,7 @@ def get_environment(
         env_cls = MacroFuzzEnvironment
         filters = TEXT_FILTERS
 
-    env = env_cls(**args)
+    env = env_cls(bytecode_cache=_bytecode_cache, **args)
     env.filters.update(filters)
 
     return env
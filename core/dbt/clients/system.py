@@ -11,7 +11,7 @@ import sys
 import tarfile
 import requests
 import stat
-from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union
+from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union, Iterable
 
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -46,10 +46,16 @@ def find_matching(
 
       [ { 'absolute_path': '/root/path/models/model_one.sql',
           'relative_path': 'model_one.sql',
-          'searched_path': 'models' },
+          'searched_path': 'models',
+          'modification_time': 1650000000.0,
+          'file_size': 120,
+          'inode': 1234 },
         { 'absolute_path': '/root/path/models/subdirectory/model_two.sql',
           'relative_path': 'subdirectory/model_two.sql',
-          'searched_path': 'models' } ]
+          'searched_path': 'models',
+          'modification_time': 1650000000.0,
+          'file_size': 240,
+          'inode': 1235 } ]
     """
     matching = []
     root_path = os.path.normpath(root_path)
@@ -62,22 +68,30 @@ def find_matching(
 
         for current_path, subdirectories, local_files in walk_results:
             for local_file in local_files:
+                if not reobj.match(local_file):
+                    continue
                 absolute_path = os.path.join(current_path, local_file)
                 relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
                 modification_time = 0.0
+                file_size = 0
+                inode = 0
                 try:
-                    modification_time = os.path.getmtime(absolute_path)
+                    stat_result = os.stat(absolute_path)
+                    modification_time = stat_result.st_mtime
+                    file_size = stat_result.st_size
+                    inode = stat_result.st_ino
                 except OSError:
                     fire_event(SystemErrorRetrievingModTime(path=absolute_path))
-                if reobj.match(local_file):
-                    matching.append(
-                        {
-                            "searched_path": relative_path_to_search,
-                            "absolute_path": absolute_path,
-                            "relative_path": relative_path,
-                            "modification_time": modification_time,
-                        }
-                    )
+                matching.append(
+                    {
+                        "searched_path": relative_path_to_search,
+                        "absolute_path": absolute_path,
+                        "relative_path": relative_path,
+                        "modification_time": modification_time,
+                        "file_size": file_size,
+                        "inode": inode,
+                    }
+                )
 
     return matching
 
@@ -147,29 +161,56 @@ def write_file(path: str, contents: str = "") -> bool:
         with open(path, "w", encoding="utf-8") as f:
             f.write(str(contents))
     except Exception as exc:
-        # note that you can't just catch FileNotFound, because sometimes
-        # windows apparently raises something else.
-        # It's also not sufficient to look at the path length, because
-        # sometimes windows fails to write paths that are less than the length
-        # limit. So on windows, suppress all errors that happen from writing
-        # to disk.
-        if os.name == "nt":
-            # sometimes we get a winerror of 3 which means the path was
-            # definitely too long, but other times we don't and it means the
-            # path was just probably too long. This is probably based on the
-            # windows/python version.
-            if getattr(exc, "winerror", 0) == 3:
-                reason = "Path was too long"
-            else:
-                reason = "Path was possibly too long"
-            # all our hard work and the path was still too long. Log and
-            # continue.
-            fire_event(SystemCouldNotWrite(path=path, reason=reason, exc=exc))
-        else:
-            raise
+        _handle_write_error(path, exc)
+    return True
+
+
+def write_file_chunks(path: str, chunks: Iterable[str]) -> bool:
+    """Write contents that are produced a piece at a time, without joining
+    them first. They're written to a temporary file that replaces the file at
+    path once it's complete, so that a failure while producing them doesn't
+    leave a partial file behind.
+    """
+    path = convert_path(path)
+    tmp_path = f"{path}.tmp"
+    try:
+        make_directory(os.path.dirname(path))
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except Exception as exc:
+        _handle_write_error(path, exc)
     return True
 
 
+def _handle_write_error(path: str, exc: Exception) -> None:
+    # note that you can't just catch FileNotFound, because sometimes
+    # windows apparently raises something else.
+    # It's also not sufficient to look at the path length, because
+    # sometimes windows fails to write paths that are less than the length
+    # limit. So on windows, suppress all errors that happen from writing
+    # to disk.
+    if os.name == "nt":
+        # sometimes we get a winerror of 3 which means the path was
+        # definitely too long, but other times we don't and it means the
+        # path was just probably too long. This is probably based on the
+        # windows/python version.
+        if getattr(exc, "winerror", 0) == 3:
+            reason = "Path was too long"
+        else:
+            reason = "Path was possibly too long"
+        # all our hard work and the path was still too long. Log and
+        # continue.
+        fire_event(SystemCouldNotWrite(path=path, reason=reason, exc=exc))
+    else:
+        raise
+
+
 def read_json(path: str) -> Dict[str, Any]:
     return json.loads(load_file_contents(path))
 
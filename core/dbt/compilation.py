@@ -1,6 +1,6 @@
 import os
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, cast, Optional
+from typing import List, Dict, Any, Iterator, Tuple, cast, Optional
 
 import networkx as nx  # type: ignore
 import pickle
@@ -26,7 +26,7 @@ from dbt.exceptions import (
     InternalException,
     RuntimeException,
 )
-from dbt.graph import Graph
+from dbt.graph import Graph, CompactGraph
 from dbt.events.functions import fire_event
 from dbt.events.types import FoundStats, CompilingNode, WritingInjectedSQLForNode
 from dbt.node_types import NodeType
@@ -122,6 +122,15 @@ def _get_tests_for_node(manifest: Manifest, unique_id: UniqueID) -> List[UniqueI
     return tests
 
 
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits in an integer, lowest first."""
+    binary = bin(bits)[:1:-1]
+    position = binary.find("1")
+    while position != -1:
+        yield position
+        position = binary.find("1", position + 1)
+
+
 class Linker:
     def __init__(self, data=None):
         if data is None:
@@ -439,37 +448,76 @@ class Compiler:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
+        # Rather than walking everything upstream of every node, this makes a
+        # single pass over the graph in topological order. Each node inherits
+        # from its parents the set of tests attached to any of its ancestors
+        # ("reached" tests) and, for tests with several dependencies, the set
+        # of its ancestors. Both sets are stored as bits in python integers.
+        tests_by_index: List[UniqueID] = []
+        test_indexes: Dict[UniqueID, int] = {}
+        # the tests that are direct children of each node
+        child_tests: Dict[UniqueID, int] = {}
+        # the nodes whose children include each test
+        test_parents: Dict[int, List[UniqueID]] = defaultdict(list)
         for node_id in linker.graph:
+            for test_id in _get_tests_for_node(manifest, node_id):
+                if test_id not in test_indexes:
+                    test_indexes[test_id] = len(tests_by_index)
+                    tests_by_index.append(test_id)
+                test_index = test_indexes[test_id]
+                child_tests[node_id] = child_tests.get(node_id, 0) | (1 << test_index)
+                test_parents[test_index].append(node_id)
+
+        # Only nodes with children can be upstream of anything
+        ancestor_indexes: Dict[UniqueID, int] = {}
+        for node_id, out_degree in linker.graph.out_degree():
+            if out_degree > 0:
+                ancestor_indexes[node_id] = len(ancestor_indexes)
+
+        # A test that hangs off exactly the one node it depends on is
+        # satisfied as soon as it is reached. Any other test (ex: relationship
+        # tests) also needs every node it depends on to be upstream.
+        simple_tests = 0
+        complex_tests = 0
+        depends_on_masks: Dict[int, int] = {}
+        for test_id, test_index in test_indexes.items():
+            test_depends_on = set(manifest.nodes[test_id].depends_on_nodes)
+            if test_depends_on == set(test_parents[test_index]) and len(test_depends_on) == 1:
+                simple_tests |= 1 << test_index
+            elif all(dep in ancestor_indexes for dep in test_depends_on):
+                complex_tests |= 1 << test_index
+                depends_on_masks[test_index] = sum(
+                    1 << ancestor_indexes[dep] for dep in test_depends_on
+                )
+
+        reached: Dict[UniqueID, int] = {}
+        ancestors: Dict[UniqueID, int] = {}
+        new_edges: List[Tuple[UniqueID, UniqueID]] = []
+        for node_id in nx.topological_sort(linker.graph):
+            node_reached = 0
+            node_ancestors = 0
+            for parent in linker.graph.predecessors(node_id):
+                node_reached |= reached[parent] | child_tests.get(parent, 0)
+                if complex_tests:
+                    node_ancestors |= ancestors[parent] | (1 << ancestor_indexes[parent])
+            reached[node_id] = node_reached
+            ancestors[node_id] = node_ancestors
+
             # If node is executable (in manifest.nodes) and does _not_
-            # represent a test, continue.
+            # represent a test, add an edge from each satisfied upstream test.
             if (
                 node_id in manifest.nodes
                 and manifest.nodes[node_id].resource_type != NodeType.Test
             ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
-
-                # Get all tests that depend on any upstream nodes.
-                upstream_tests = []
-                for upstream_node in upstream_nodes:
-                    upstream_tests += _get_tests_for_node(manifest, upstream_node)
-
-                for upstream_test in upstream_tests:
-                    # Get the set of all nodes that the test depends on
-                    # including the upstream_node itself. This is necessary
-                    # because tests can depend on multiple nodes (ex:
-                    # relationship tests). Test nodes do not distinguish
-                    # between what node the test is "testing" and what
-                    # node(s) it depends on.
-                    test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
-
-                    # If the set of nodes that an upstream test depends on
-                    # is a subset of all upstream nodes of the current node,
-                    # add an edge from the upstream test to the current node.
-                    if test_depends_on.issubset(upstream_nodes):
-                        linker.graph.add_edge(upstream_test, node_id)
+                satisfied = node_reached & simple_tests
+                for test_index in _iter_bits(node_reached & complex_tests):
+                    mask = depends_on_masks[test_index]
+                    if node_ancestors & mask == mask:
+                        satisfied |= 1 << test_index
+                for test_index in _iter_bits(satisfied):
+                    new_edges.append((tests_by_index[test_index], node_id))
+
+        linker.graph.add_edges_from(new_edges)
 
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
@@ -483,6 +531,8 @@ class Compiler:
             self.write_graph_file(linker, manifest)
         print_compile_stats(stats)
 
+        if flags.USE_COMPACT_GRAPH:
+            return Graph(CompactGraph.from_networkx(linker.graph))
         return Graph(linker.graph)
 
     # writes the "compiled_sql" into the target/compiled directory
@@ -1,13 +1,21 @@
-from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set
+from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set, Tuple
+
+import jinja2
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.parsed import ParsedMacro
 from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
-from dbt.exceptions import raise_duplicate_macro_name, raise_compiler_error
+from dbt.exceptions import (
+    InternalException,
+    raise_duplicate_macro_name,
+    raise_compiler_error,
+)
 
 
-FlatNamespace = Dict[str, MacroGenerator]
-NamespaceMember = Union[FlatNamespace, MacroGenerator]
+# What a namespace holds for each macro. SharedMacros are defined below.
+MacroFunc = Union[MacroGenerator, "SharedMacro"]
+FlatNamespace = Dict[str, MacroFunc]
+NamespaceMember = Union[FlatNamespace, MacroFunc]
 FullNamespace = Dict[str, NamespaceMember]
 
 
@@ -66,7 +74,7 @@ class MacroNamespace(Mapping):
                 return dct[key]
         raise KeyError(key)
 
-    def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroGenerator]:
+    def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroFunc]:
         pkg: FlatNamespace
         if package_name is None:
             return self.get(name)
@@ -113,7 +121,7 @@ class MacroNamespaceBuilder:
         self,
         hierarchy: Dict[str, FlatNamespace],
         macro: ParsedMacro,
-        macro_func: MacroGenerator,
+        macro_func: MacroFunc,
     ):
         if macro.package_name in hierarchy:
             namespace = hierarchy[macro.package_name]
@@ -125,13 +133,15 @@ class MacroNamespaceBuilder:
             raise_duplicate_macro_name(macro_func.macro, macro, macro.package_name)
         hierarchy[macro.package_name][macro.name] = macro_func
 
-    def add_macro(self, macro: ParsedMacro, ctx: Dict[str, Any]):
-        macro_name: str = macro.name
-
+    def _make_macro_func(self, macro: ParsedMacro, ctx: Dict[str, Any]) -> MacroFunc:
         # MacroGenerator is in clients/jinja.py
         # a MacroGenerator object is a callable object that will
         # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
+        return MacroGenerator(macro, ctx, self.node, self.thread_ctx)
+
+    def add_macro(self, macro: ParsedMacro, ctx: Dict[str, Any]):
+        macro_name: str = macro.name
+        macro_func: MacroFunc = self._make_macro_func(macro, ctx)
 
         # internal macros (from plugins) will be processed separately from
         # project macros, so store them in a different place
@@ -170,3 +180,149 @@ class MacroNamespaceBuilder:
             global_project_namespace=global_project_namespace,  # internal packages
             packages=self.packages,  # non internal_packages
         )
+
+
+# A SharedMacro stands in for a macro in every context that uses the same
+# SharedMacroNamespace. It's not bound to any of them: when jinja calls it,
+# it finds the context dictionary of the template it was called from, and
+# calls that context's MacroGenerator for the macro instead.
+class SharedMacro:
+    def __init__(self, macro: ParsedMacro) -> None:
+        self.macro = macro
+
+    @jinja2.contextfunction
+    def __call__(self, jinja_context, *args, **kwargs):
+        ctx = jinja_context.parent.get("context")
+        namespace = getattr(ctx, "macro_namespace", None)
+        if namespace is None:
+            raise InternalException(
+                f"Macro {self.macro.unique_id} was called outside of a dbt context"
+            )
+        return namespace.bind(self)(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<SharedMacro {self.macro.unique_id}>"
+
+
+class SharedMacroNamespaceBuilder(MacroNamespaceBuilder):
+    def __init__(self, root_package: str, search_package: str, internal_packages: List[str]):
+        # the namespace isn't bound to a context, so it has no stack or node
+        super().__init__(root_package, search_package, None, internal_packages)  # type: ignore
+
+    def _make_macro_func(self, macro: ParsedMacro, ctx: Dict[str, Any]) -> SharedMacro:
+        return SharedMacro(macro)
+
+
+# The macros that the contexts of every node in a package can see, and the
+# names they're flattened to in the context dictionary, only depend on the
+# manifest's macros and the package. This resolves them once, so that
+# building a context doesn't need to touch every macro in the manifest.
+class SharedMacroNamespace:
+    def __init__(
+        self,
+        macros: Iterable[ParsedMacro],
+        root_package: str,
+        search_package: str,
+        internal_packages: List[str],
+    ) -> None:
+        builder = SharedMacroNamespaceBuilder(root_package, search_package, internal_packages)
+        self.namespace: MacroNamespace = builder.build_namespace(macros, {})
+        # the top level keys of a context dictionary, as in dict(namespace)
+        self.flat: Dict[str, Any] = dict(self.namespace)
+
+    def bind(
+        self,
+        macros: Mapping[str, ParsedMacro],
+        ctx: "ContextDict",
+        node: Optional[Any],
+        thread_ctx: MacroStack,
+    ) -> "BoundMacroNamespace":
+        namespace = BoundMacroNamespace(self, macros, ctx, node, thread_ctx)
+        ctx.macro_namespace = namespace
+        return namespace
+
+
+# The shared namespaces are cached on the manifest. Adding a macro to the
+# manifest clears the cache, and a cached namespace is only used while the
+# number of macros is the same as when it was built.
+NamespaceKey = Tuple[str, str, Tuple[str, ...]]
+
+
+def get_shared_namespace(
+    manifest: Any,
+    root_package: str,
+    search_package: str,
+    internal_packages: List[str],
+) -> SharedMacroNamespace:
+    key: NamespaceKey = (root_package, search_package, tuple(internal_packages))
+    cache = getattr(manifest, "_macro_namespaces", None)
+    if isinstance(cache, dict):
+        cached = cache.get(key)
+        if cached is not None and cached[0] == len(manifest.macros):
+            return cached[1]
+    namespace = SharedMacroNamespace(
+        manifest.macros.values(), root_package, search_package, internal_packages
+    )
+    if isinstance(cache, dict):
+        cache[key] = (len(manifest.macros), namespace)
+    return namespace
+
+
+class ContextDict(dict):
+    """The dictionary of a ManifestContext. The SharedMacros in it are bound
+    through its macro_namespace when they're called.
+    """
+
+    macro_namespace: Optional["BoundMacroNamespace"] = None
+
+
+# A SharedMacroNamespace bound to one context. MacroGenerators for the
+# context are only created for the macros that are actually looked up or
+# called.
+class BoundMacroNamespace(Mapping):
+    def __init__(
+        self,
+        shared: SharedMacroNamespace,
+        macros: Mapping[str, ParsedMacro],
+        ctx: Dict[str, Any],
+        node: Optional[Any],
+        thread_ctx: MacroStack,
+    ) -> None:
+        self.shared = shared
+        self.macros = macros
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        self._bound: Dict[str, MacroGenerator] = {}
+
+    def bind(self, shared_macro: SharedMacro) -> MacroGenerator:
+        unique_id = shared_macro.macro.unique_id
+        macro_func = self._bound.get(unique_id)
+        if macro_func is None:
+            # use the manifest's current version of the macro, in case it
+            # was replaced since the shared namespace was built
+            macro = self.macros.get(unique_id, shared_macro.macro)
+            macro_func = MacroGenerator(macro, self.ctx, self.node, self.thread_ctx)
+            self._bound[unique_id] = macro_func
+        return macro_func
+
+    def _bind_member(self, member: Any) -> NamespaceMember:
+        if isinstance(member, SharedMacro):
+            return self.bind(member)
+        return {name: self.bind(shared_macro) for name, shared_macro in member.items()}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.shared.flat)
+
+    def __len__(self):
+        return len(self.shared.flat)
+
+    def __getitem__(self, key: str) -> NamespaceMember:
+        return self._bind_member(self.shared.flat[key])
+
+    def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroGenerator]:
+        member = self.shared.namespace.get_from_package(package_name, name)
+        if member is None:
+            return None
+        assert isinstance(member, SharedMacro)
+        return self.bind(member)
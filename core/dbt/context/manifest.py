@@ -7,7 +7,7 @@ from dbt.context.macro_resolver import TestMacroNamespace
 
 
 from .configured import ConfiguredContext
-from .macros import MacroNamespaceBuilder
+from .macros import ContextDict, SharedMacroNamespace, get_shared_namespace
 
 
 class ManifestContext(ConfiguredContext):
@@ -30,28 +30,29 @@ class ManifestContext(ConfiguredContext):
         # this is the package of the node for which this context was built
         self.search_package = search_package
         self.macro_stack = MacroStack()
+        self._ctx = ContextDict()
         # This namespace is used by the BaseDatabaseWrapper in jinja rendering.
         # The namespace is passed to it when it's constructed. It expects
         # to be able to do: namespace.get_from_package(..)
         self.namespace = self._build_namespace()
 
     def _build_namespace(self):
-        # this takes all the macros in the manifest and adds them
-        # to the MacroNamespaceBuilder stored in self.namespace
-        builder = self._get_namespace_builder()
-        return builder.build_namespace(self.manifest.macros.values(), self._ctx)
+        # the macros in the manifest are resolved once per package, and only
+        # bound to this context when they're looked up or called
+        return self._get_shared_namespace().bind(
+            self.manifest.macros, self._ctx, None, self.macro_stack
+        )
 
-    def _get_namespace_builder(self) -> MacroNamespaceBuilder:
+    def _get_shared_namespace(self) -> SharedMacroNamespace:
         # avoid an import loop
         from dbt.adapters.factory import get_adapter_package_names
 
         internal_packages: List[str] = get_adapter_package_names(self.config.credentials.type)
-        return MacroNamespaceBuilder(
+        return get_shared_namespace(
+            self.manifest,
             self.config.project_name,
             self.search_package,
-            self.macro_stack,
             internal_packages,
-            None,
         )
 
     # This does not use the Mashumaro code
@@ -63,7 +64,7 @@ class ManifestContext(ConfiguredContext):
             dct.update(self.namespace.local_namespace)
             dct.update(self.namespace.project_namespace)
         else:
-            dct.update(self.namespace)
+            dct.update(self.namespace.shared.flat)
         return dct
 
 
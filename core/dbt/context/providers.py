@@ -11,11 +11,12 @@ from typing import (
     Type,
     Iterable,
     Mapping,
+    cast,
 )
 from typing_extensions import Protocol
 
 from dbt.adapters.base.column import Column
-from dbt.adapters.factory import get_adapter, get_adapter_package_names, get_adapter_type_names
+from dbt.adapters.factory import get_adapter, get_adapter_type_names
 from dbt.clients import agate_helper
 from dbt.clients.jinja import get_rendered, MacroGenerator, MacroStack
 from dbt.config import RuntimeConfig, Project
@@ -24,7 +25,7 @@ from .configured import FQNLookup
 from .context_config import ContextConfig
 from dbt.logger import SECRET_ENV_PREFIX
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
-from .macros import MacroNamespaceBuilder, MacroNamespace
+from .macros import MacroNamespace
 from .manifest import ManifestContext
 from dbt.contracts.connection import AdapterResponse
 from dbt.contracts.graph.manifest import Manifest, Disabled
@@ -176,7 +177,9 @@ class BaseDatabaseWrapper:
                     attempts.append(f"{package_name}.{search_name}")
 
                 if macro is not None:
-                    return macro
+                    # the SharedMacros of a shared namespace are only handed
+                    # out bound to a context, as MacroGenerators
+                    return cast(MacroGenerator, macro)
 
         searched = ", ".join(repr(a) for a in attempts)
         msg = f"In dispatch: No macro named '{macro_name}' found\n" f"    Searched for: {searched}"
@@ -629,15 +632,10 @@ class ProviderContext(ManifestContext):
         self.db_wrapper = self.provider.DatabaseWrapper(self.adapter, self.namespace)
 
     # This overrides the method in ManifestContext, and provides
-    # a model, which the ManifestContext builder does not
-    def _get_namespace_builder(self):
-        internal_packages = get_adapter_package_names(self.config.credentials.type)
-        return MacroNamespaceBuilder(
-            self.config.project_name,
-            self.search_package,
-            self.macro_stack,
-            internal_packages,
-            self.model,
+    # a model, which the ManifestContext namespace does not
+    def _build_namespace(self):
+        return self._get_shared_namespace().bind(
+            self.manifest.macros, self._ctx, self.model, self.macro_stack
         )
 
     @contextproperty
@@ -719,7 +717,7 @@ class ProviderContext(ManifestContext):
             raise_compiler_error(message_if_exception, self.model)
 
     @contextmember
-    def load_agate_table(self) -> agate.Table:
+    def load_agate_table(self, sample_size: Optional[int] = None) -> agate.Table:
         if not isinstance(self.model, (ParsedSeedNode, CompiledSeedNode)):
             raise_compiler_error(
                 "can only load_agate_table for seeds (got a {})".format(self.model.resource_type)
@@ -727,7 +725,7 @@ class ProviderContext(ManifestContext):
         path = os.path.join(self.model.root_path, self.model.original_file_path)
         column_types = self.model.config.column_types
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types)
+            table = agate_helper.from_csv(path, text_columns=column_types, sample_size=sample_size)
         except ValueError as e:
             raise_compiler_error(str(e))
         table.original_abspath = os.path.abspath(path)
@@ -1261,8 +1259,8 @@ def generate_parser_model_context(
     context_config: ContextConfig,
 ) -> Dict[str, Any]:
     # The __init__ method of ModelContext also initializes
-    # a ManifestContext object which creates a MacroNamespaceBuilder
-    # which adds every macro in the Manifest.
+    # a ManifestContext object which binds the shared macro namespace
+    # for the model's package to the context.
     ctx = ModelContext(model, config, manifest, ParseProvider(), context_config)
     # The 'to_dict' method in ManifestContext moves all of the macro names
     # in the macro 'namespace' up to top level keys
@@ -46,6 +46,8 @@ class FilePath(dbtClassMixin):
     relative_path: str
     modification_time: float
     project_root: str
+    file_size: int = 0
+    inode: int = 0
 
     @property
     def search_key(self) -> str:
@@ -67,6 +69,17 @@ class FilePath(dbtClassMixin):
         # name, should it?
         return os.path.join(self.searched_path, self.relative_path)
 
+    def stat_matches(self, other: "FilePath") -> bool:
+        """Return whether the file this represents has the same modification
+        time, size and inode as `other`, which means its contents can be
+        assumed to be unchanged."""
+        return (
+            self.modification_time != 0.0
+            and self.modification_time == other.modification_time
+            and self.file_size == other.file_size
+            and self.inode == other.inode
+        )
+
     def seed_too_large(self) -> bool:
         """Return whether the file this represents is over the seed size limit"""
         return os.stat(self.full_path).st_size > MAXIMUM_SEED_SIZE
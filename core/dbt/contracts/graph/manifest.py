@@ -19,6 +19,7 @@ from typing import (
     cast,
     AbstractSet,
     ClassVar,
+    Type,
 )
 from typing_extensions import Protocol
 from uuid import UUID
@@ -609,6 +610,12 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=flags.MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    # The shared macro namespaces of the contexts built from this manifest,
+    # see dbt.context.macros.get_shared_namespace
+    _macro_namespaces: Dict[Any, Any] = field(
+        default_factory=dict,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -619,6 +626,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     @classmethod
     def __post_deserialize__(cls, obj):
         obj._lock = flags.MP_CONTEXT.Lock()
+        obj._macro_namespaces = {}
         return obj
 
     def sync_update_node(self, new_node: NonSourceCompiledNode) -> NonSourceCompiledNode:
@@ -942,12 +950,16 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         """
         refables = set(NodeType.refable())
         merged = set()
-        for unique_id, node in other.nodes.items():
+        for unique_id in other.nodes:
             current = self.nodes.get(unique_id)
-            if current and (
+            # check the selection first, so the other node is only
+            # deserialized if it could be merged
+            if not current or unique_id in selected:
+                continue
+            node = other.nodes[unique_id]
+            if (
                 node.resource_type in refables
                 and not node.is_ephemeral
-                and unique_id not in selected
                 and not adapter.get_relation(current.database, current.schema, current.identifier)
             ):
                 merged.add(unique_id)
@@ -984,6 +996,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             raise_compiler_error(msg)
 
         self.macros[macro.unique_id] = macro
+        self._macro_namespaces.clear()
         source_file.macros.append(macro.unique_id)
 
     def has_file(self, source_file: SourceFile) -> bool:
@@ -1082,6 +1095,7 @@ class MacroManifest(MacroMethods):
     def __init__(self, macros):
         self.macros = macros
         self.metadata = ManifestMetadata()
+        self._macro_namespaces: Dict[Any, Any] = {}
         # This is returned by the 'graph' context property
         # in the ProviderContext class.
         self.flat_graph = {}
@@ -1090,6 +1104,54 @@ class MacroManifest(MacroMethods):
 AnyManifest = Union[Manifest, MacroManifest]
 
 
+# These wrap a single manifest value so that it's serialized and
+# deserialized exactly as it would be as part of the Manifest.
+@dataclass
+class _NodeEntry(dbtClassMixin):
+    value: ManifestNode
+
+
+@dataclass
+class _SourceEntry(dbtClassMixin):
+    value: ParsedSourceDefinition
+
+
+@dataclass
+class _MacroEntry(dbtClassMixin):
+    value: ParsedMacro
+
+
+@dataclass
+class _DocEntry(dbtClassMixin):
+    value: ParsedDocumentation
+
+
+@dataclass
+class _ExposureEntry(dbtClassMixin):
+    value: ParsedExposure
+
+
+@dataclass
+class _MetricEntry(dbtClassMixin):
+    value: ParsedMetric
+
+
+@dataclass
+class _DisabledEntry(dbtClassMixin):
+    value: List[CompileResultNode]
+
+
+MANIFEST_ENTRY_TYPES: Dict[str, Type[dbtClassMixin]] = {
+    "nodes": _NodeEntry,
+    "sources": _SourceEntry,
+    "macros": _MacroEntry,
+    "docs": _DocEntry,
+    "exposures": _ExposureEntry,
+    "metrics": _MetricEntry,
+    "disabled": _DisabledEntry,
+}
+
+
 @dataclass
 @schema_version("manifest", 5)
 class WritableManifest(ArtifactMixin):
@@ -1135,12 +1197,30 @@ class WritableManifest(ArtifactMixin):
         )
     )
 
+    _streamed_fields = (
+        "nodes",
+        "sources",
+        "macros",
+        "docs",
+        "exposures",
+        "metrics",
+        "disabled",
+        "parent_map",
+        "child_map",
+    )
+
     def __post_serialize__(self, dct):
         for unique_id, node in dct["nodes"].items():
             if "config_call_dict" in node:
                 del node["config_call_dict"]
         return dct
 
+    def _serialize_streamed(self, name, value):
+        dct = super()._serialize_streamed(name, value)
+        if name == "nodes" and "config_call_dict" in dct:
+            del dct["config_call_dict"]
+        return dct
+
 
 def _check_duplicates(value: HasUniqueID, src: Mapping[str, HasUniqueID]):
     if value.unique_id in src:
@@ -243,6 +243,8 @@ class UserConfig(ExtensibleDbtClassMixin, Replaceable, UserConfigContract):
     send_anonymous_usage_stats: bool = DEFAULT_SEND_ANONYMOUS_USAGE_STATS
     use_colors: Optional[bool] = None
     partial_parse: Optional[bool] = None
+    partial_parse_file_stat: Optional[bool] = None
+    parse_workers: Optional[int] = None
     printer_width: Optional[int] = None
     write_json: Optional[bool] = None
     warn_error: Optional[bool] = None
@@ -254,6 +256,11 @@ class UserConfig(ExtensibleDbtClassMixin, Replaceable, UserConfigContract):
     static_parser: Optional[bool] = None
     indirect_selection: Optional[str] = None
     cache_selected_only: Optional[bool] = None
+    lazy_relation_cache: Optional[bool] = None
+    reuse_connections: Optional[bool] = None
+    batch_source_freshness: Optional[bool] = None
+    prioritize_critical_path: Optional[bool] = None
+    async_logging: Optional[bool] = None
 
 
 @dataclass
@@ -32,8 +32,6 @@ from typing import (
     Sequence,
 )
 
-from dbt.clients.system import write_json
-
 
 @dataclass
 class TimingInfo(dbtClassMixin):
@@ -200,6 +198,8 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
     results: Sequence[RunResultOutput]
     args: Dict[str, Any] = field(default_factory=dict)
 
+    _streamed_fields = ("results",)
+
     @classmethod
     def from_execution_results(
         cls,
@@ -215,9 +215,6 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
         )
         return cls(metadata=meta, results=processed_results, elapsed_time=elapsed_time, args=args)
 
-    def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))
-
 
 @dataclass
 class RunOperationResult(ExecutionResult):
@@ -469,6 +466,8 @@ class CatalogResults(dbtClassMixin):
 class CatalogArtifact(CatalogResults, ArtifactMixin):
     metadata: CatalogMetadata
 
+    _streamed_fields = ("nodes", "sources")
+
     @classmethod
     def from_results(
         cls,
@@ -1,52 +1,160 @@
+import time
 from pathlib import Path
-from .graph.manifest import WritableManifest
-from .results import RunResultsArtifact
+from .graph.manifest import MANIFEST_ENTRY_TYPES, ManifestMetadata, WritableManifest
+from .results import CatalogArtifact, RunResultsArtifact
 from .results import FreshnessExecutionResultArtifact
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Type, TypeVar
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.events.functions import fire_event
+from dbt.events.types import StateArtifactLoaded
 from dbt.exceptions import IncompatibleSchemaException
 
+T = TypeVar("T")
+
+_NOT_LOADED: Any = object()
+
+
+class HydratingMapping(Mapping[str, T]):
+    """A collection of a manifest artifact, kept as the dicts read from its
+    json. Each entry is deserialized the first time it's looked up, so
+    comparing against a large manifest only builds the entries that are
+    compared.
+    """
+
+    def __init__(self, entry_cls: Type[dbtClassMixin], raw: Dict[str, Any]) -> None:
+        self.entry_cls = entry_cls
+        self.raw = raw
+        self._values: Dict[str, T] = {}
+
+    def __getitem__(self, key: str) -> T:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = self.entry_cls.from_dict({"value": self.raw[key]}).value  # type: ignore
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def peek(self, key: str, name: str) -> Any:
+        """Get one field of an entry without deserializing the entry."""
+        if key in self._values:
+            return getattr(self._values[key], name)
+        return self.raw[key][name]
+
+
+def read_manifest_lazily(path: str) -> WritableManifest:
+    """Read a manifest artifact, deserializing only its metadata. Its nodes,
+    sources and other collections are deserialized entry by entry as they're
+    used.
+    """
+    data = WritableManifest.read_versioned_dict(path)
+    collections: Dict[str, Any] = {
+        name: HydratingMapping(entry_cls, data.get(name) or {})
+        for name, entry_cls in MANIFEST_ENTRY_TYPES.items()
+    }
+    if data.get("disabled") is None:
+        collections["disabled"] = None
+    return WritableManifest(
+        metadata=ManifestMetadata.from_dict(data["metadata"]),
+        selectors=data.get("selectors") or {},
+        parent_map=data.get("parent_map"),
+        child_map=data.get("child_map"),
+        **collections,
+    )
+
 
 class PreviousState:
+    """The artifacts of a previous invocation in the --state directory. Each
+    artifact is only read the first time it's used.
+    """
+
     def __init__(self, path: Path, current_path: Path):
         self.path: Path = path
         self.current_path: Path = current_path
-        self.manifest: Optional[WritableManifest] = None
-        self.results: Optional[RunResultsArtifact] = None
-        self.sources: Optional[FreshnessExecutionResultArtifact] = None
-        self.sources_current: Optional[FreshnessExecutionResultArtifact] = None
-
-        manifest_path = self.path / "manifest.json"
-        if manifest_path.exists() and manifest_path.is_file():
-            try:
-                self.manifest = WritableManifest.read_and_check_versions(str(manifest_path))
-            except IncompatibleSchemaException as exc:
-                exc.add_filename(str(manifest_path))
-                raise
-
-        results_path = self.path / "run_results.json"
-        if results_path.exists() and results_path.is_file():
-            try:
-                self.results = RunResultsArtifact.read_and_check_versions(str(results_path))
-            except IncompatibleSchemaException as exc:
-                exc.add_filename(str(results_path))
-                raise
-
-        sources_path = self.path / "sources.json"
-        if sources_path.exists() and sources_path.is_file():
-            try:
-                self.sources = FreshnessExecutionResultArtifact.read_and_check_versions(
-                    str(sources_path)
-                )
-            except IncompatibleSchemaException as exc:
-                exc.add_filename(str(sources_path))
-                raise
-
-        sources_current_path = self.current_path / "sources.json"
-        if sources_current_path.exists() and sources_current_path.is_file():
-            try:
-                self.sources_current = FreshnessExecutionResultArtifact.read_and_check_versions(
-                    str(sources_current_path)
-                )
-            except IncompatibleSchemaException as exc:
-                exc.add_filename(str(sources_current_path))
-                raise
+        self._manifest: Optional[WritableManifest] = _NOT_LOADED
+        self._results: Optional[RunResultsArtifact] = _NOT_LOADED
+        self._sources: Optional[FreshnessExecutionResultArtifact] = _NOT_LOADED
+        self._sources_current: Optional[FreshnessExecutionResultArtifact] = _NOT_LOADED
+        self._catalog: Optional[CatalogArtifact] = _NOT_LOADED
+
+    def _load(self, path: Path, read: Callable[[str], T]) -> Optional[T]:
+        if not (path.exists() and path.is_file()):
+            return None
+        start = time.perf_counter()
+        try:
+            artifact = read(str(path))
+        except IncompatibleSchemaException as exc:
+            exc.add_filename(str(path))
+            raise
+        elapsed = time.perf_counter() - start
+        fire_event(StateArtifactLoaded(path=str(path), elapsed=elapsed))
+        return artifact
+
+    @property
+    def manifest(self) -> Optional[WritableManifest]:
+        if self._manifest is _NOT_LOADED:
+            self._manifest = self._load(self.path / "manifest.json", read_manifest_lazily)
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, value: Optional[WritableManifest]) -> None:
+        self._manifest = value
+
+    @property
+    def results(self) -> Optional[RunResultsArtifact]:
+        if self._results is _NOT_LOADED:
+            self._results = self._load(
+                self.path / "run_results.json", RunResultsArtifact.read_and_check_versions
+            )
+        return self._results
+
+    @results.setter
+    def results(self, value: Optional[RunResultsArtifact]) -> None:
+        self._results = value
+
+    @property
+    def sources(self) -> Optional[FreshnessExecutionResultArtifact]:
+        if self._sources is _NOT_LOADED:
+            self._sources = self._load(
+                self.path / "sources.json",
+                FreshnessExecutionResultArtifact.read_and_check_versions,
+            )
+        return self._sources
+
+    @sources.setter
+    def sources(self, value: Optional[FreshnessExecutionResultArtifact]) -> None:
+        self._sources = value
+
+    @property
+    def sources_current(self) -> Optional[FreshnessExecutionResultArtifact]:
+        if self._sources_current is _NOT_LOADED:
+            self._sources_current = self._load(
+                self.current_path / "sources.json",
+                FreshnessExecutionResultArtifact.read_and_check_versions,
+            )
+        return self._sources_current
+
+    @sources_current.setter
+    def sources_current(self, value: Optional[FreshnessExecutionResultArtifact]) -> None:
+        self._sources_current = value
+
+    @property
+    def catalog(self) -> Optional[CatalogArtifact]:
+        if self._catalog is _NOT_LOADED:
+            self._catalog = self._load(
+                self.path / "catalog.json", CatalogArtifact.read_and_check_versions
+            )
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, value: Optional[CatalogArtifact]) -> None:
+        self._catalog = value
@@ -1,13 +1,15 @@
+import copy
 import dataclasses
 import os
 from datetime import datetime
-from typing import List, Tuple, ClassVar, Type, TypeVar, Dict, Any, Optional
+from typing import List, Tuple, ClassVar, Type, TypeVar, Dict, Any, Optional, Iterator, Mapping
 
-from dbt.clients.system import write_json, read_json
+from dbt.clients.system import write_json, read_json, write_file_chunks
 from dbt.exceptions import InternalException, RuntimeException, IncompatibleSchemaException
 from dbt.version import __version__
 from dbt.events.functions import get_invocation_id
 from dbt.dataclass_schema import dbtClassMixin
+from dbt.utils import JSONEncoder
 
 SourceKey = Tuple[str, str]
 
@@ -49,9 +51,65 @@ class Mergeable(Replaceable):
         return self.replace(**replacements)
 
 
+def _serialize(value: Any) -> Any:
+    if hasattr(value, "to_dict"):
+        return value.to_dict(omit_none=False)
+    if isinstance(value, (list, tuple)):
+        return [_serialize(v) for v in value]
+    return value
+
+
 class Writable:
+    # Fields of large artifacts that are serialized one entry at a time while
+    # the file is written, so that the whole artifact is never held in memory
+    # as one dict or string. The file is the same as the one write_json would
+    # write.
+    _streamed_fields: ClassVar[Tuple[str, ...]] = ()
+
     def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))  # type: ignore
+        if self._streamed_fields:
+            write_file_chunks(path, self._iter_json())
+        else:
+            write_json(path, self.to_dict(omit_none=False))  # type: ignore
+
+    def _serialize_streamed(self, name: str, value: Any) -> Any:
+        # the serialized form of an entry of a streamed field. Subclasses that
+        # change those entries in __post_serialize__ do the same here.
+        return _serialize(value)
+
+    def _iter_json(self) -> Iterator[str]:
+        # everything but the streamed fields is serialized as usual, which
+        # also gives the order of the keys
+        shallow = copy.copy(self)
+        for name in self._streamed_fields:
+            value = getattr(self, name)
+            if value is not None:
+                setattr(shallow, name, {} if isinstance(value, Mapping) else [])
+        dct = shallow.to_dict(omit_none=False)  # type: ignore
+
+        encode = JSONEncoder().encode
+        separator = "{"
+        for key, value in dct.items():
+            yield f"{separator}{encode(key)}: "
+            separator = ", "
+            streamed = getattr(self, key) if key in self._streamed_fields else None
+            if streamed is None:
+                yield encode(value)
+            elif isinstance(streamed, Mapping):
+                item_separator = "{"
+                for item_key, item in streamed.items():
+                    yield f"{item_separator}{encode(item_key)}: "
+                    item_separator = ", "
+                    yield encode(self._serialize_streamed(key, item))
+                yield "}" if item_separator == ", " else "{}"
+            else:
+                item_separator = "["
+                for item in streamed:
+                    yield item_separator
+                    item_separator = ", "
+                    yield encode(self._serialize_streamed(key, item))
+                yield "]" if item_separator == ", " else "[]"
+        yield "}" if separator == ", " else "{}"
 
 
 class AdditionalPropertiesMixin:
@@ -203,6 +261,13 @@ class VersionedSchema(dbtClassMixin):
 
     @classmethod
     def read_and_check_versions(cls, path: str):
+        return cls.from_dict(cls.read_versioned_dict(path))  # type: ignore
+
+    @classmethod
+    def read_versioned_dict(cls, path: str) -> Dict[str, Any]:
+        """Read the json artifact at path without deserializing it, checking
+        that it has this class's schema version.
+        """
         try:
             data = read_json(path)
         except (EnvironmentError, ValueError) as exc:
@@ -222,7 +287,7 @@ class VersionedSchema(dbtClassMixin):
                         expected=str(cls.dbt_schema_version), found=previous_schema_version
                     )
 
-        return cls.from_dict(data)  # type: ignore
+        return data
 
 
 T = TypeVar("T", bound="ArtifactMixin")
@@ -2,11 +2,13 @@ import colorama
 from colorama import Style
 import dbt.events.functions as this  # don't worry I hate it too.
 from dbt.events.base_types import NoStdOut, Event, NoFile, ShowException, Cache
+from dbt.events.history import EVENT_HISTORY_FILE_NAME, EventHistory
 from dbt.events.types import EventBufferFull, T_Event, MainReportVersion, EmptyLine
 import dbt.flags as flags
 
 # TODO this will need to move eventually
 from dbt.logger import SECRET_ENV_PREFIX, make_log_dir_if_missing, GLOBAL_LOGGER
+import atexit
 from datetime import datetime
 import json
 import io
@@ -17,19 +19,35 @@ from logging import Logger
 import sys
 from logging.handlers import RotatingFileHandler
 import os
+import queue
+import re
 import uuid
 import threading
-from typing import Any, Dict, List, Optional, Union
-from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 global LOG_VERSION
 LOG_VERSION = 2
 
-# create the global event history buffer with the default max size (10k)
-# python 3.7 doesn't support type hints on globals, but mypy requires them. hence the ignore.
+
+# Events are serialized for the history on its own thread. It fires
+# EventBufferFull the first time it has to drop an event.
+def _new_event_history(
+    scrub: Optional[Callable[[str], str]] = None, path: Optional[str] = None
+) -> EventHistory:
+    return EventHistory(
+        flags.EVENT_BUFFER_SIZE,
+        flags.EVENT_BUFFER_BYTES,
+        scrub,
+        path,
+        serialize=lambda e, ts, thread_name: event_to_serializable_dict(e, ts, thread_name),
+        on_full=lambda: fire_event(EventBufferFull()),
+    )
+
+
+# create the global event history buffer with the default max size (100k events)
 # TODO the flags module has not yet been resolved when this is created
 global EVENT_HISTORY
-EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+EVENT_HISTORY = _new_event_history()
 
 # create the global file logger with no configuration
 global FILE_LOG
@@ -50,6 +68,10 @@ format_color = True
 format_json = False
 invocation_id: Optional[str] = None
 
+# set by setup_event_logger when the file log is written on a background thread
+global EVENT_LOG_WRITER
+EVENT_LOG_WRITER: Optional["EventLogWriter"] = None
+
 # Colorama needs some help on windows because we're using logger.info
 # intead of print(). If the Windows env doesn't have a TERM var set,
 # then we should override the logging stream to use the colorama
@@ -59,10 +81,17 @@ if sys.platform == "win32":
     colorama.init(wrap=False)
 
 
-def setup_event_logger(log_path, level_override=None):
+def setup_event_logger(log_path, level_override=None, target_path=None):
     # flags have been resolved, and log_path is known
+    # secrets are read from the environment once, for the history and the
+    # EventLogWriter
+    scrubber = SecretScrubber(env_secrets())
+    history_path = None
+    if flags.WRITE_EVENT_HISTORY and target_path is not None:
+        history_path = os.path.join(target_path, EVENT_HISTORY_FILE_NAME)
     global EVENT_HISTORY
-    EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+    EVENT_HISTORY.close()
+    EVENT_HISTORY = _new_event_history(scrubber, history_path)
 
     make_log_dir_if_missing(log_path)
     this.format_json = flags.LOG_FORMAT == "json"
@@ -105,6 +134,11 @@ def setup_event_logger(log_path, level_override=None):
     this.FILE_LOG.handlers.clear()
     this.FILE_LOG.addHandler(file_handler)
 
+    # lines queued for the previous file log are written before it's replaced
+    close_event_log_writer()
+    if flags.ASYNC_LOGGING:
+        this.EVENT_LOG_WRITER = EventLogWriter(this.FILE_LOG, scrubber)
+
 
 # used for integration tests
 def capture_stdout_logs() -> StringIO:
@@ -137,10 +171,27 @@ def scrub_secrets(msg: str, secrets: List[str]) -> str:
     return scrubbed
 
 
+class SecretScrubber:
+    """Scrub a fixed set of secrets from messages with a single compiled
+    pattern, rather than with one pass over the message per secret.
+    """
+
+    def __init__(self, secrets: List[str]) -> None:
+        # longer secrets first, so that a secret that contains another one is
+        # replaced as a whole
+        ordered = sorted({secret for secret in secrets if secret}, key=len, reverse=True)
+        self.pattern = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+
+    def __call__(self, msg: str) -> str:
+        if self.pattern is None:
+            return msg
+        return self.pattern.sub("*****", msg)
+
+
 # returns a dictionary representation of the event fields.
 # the message may contain secrets which must be scrubbed at the usage site.
 def event_to_serializable_dict(
-    e: T_Event,
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
 ) -> Dict[str, Any]:
 
     log_line = dict()
@@ -160,13 +211,13 @@ def event_to_serializable_dict(
     event_dict = {
         "type": "log_line",
         "log_version": LOG_VERSION,
-        "ts": get_ts_rfc3339(),
+        "ts": get_ts_rfc3339(ts),
         "pid": e.get_pid(),
         "msg": e.message(),
         "level": e.level_tag(),
         "data": log_line,
         "invocation_id": e.get_invocation_id(),
-        "thread_name": e.get_thread_name(),
+        "thread_name": e.get_thread_name() if thread_name is None else thread_name,
         "code": e.code,
     }
 
@@ -183,19 +234,32 @@ def create_info_text_log_line(e: T_Event) -> str:
     return log_line
 
 
-def create_debug_text_log_line(e: T_Event) -> str:
+# the timestamp, thread name and scrubber are passed in when the line is written
+# by the EventLogWriter, rather than by the thread that fired the event
+def create_debug_text_log_line(
+    e: T_Event,
+    event_ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> str:
+    if event_ts is None:
+        event_ts = get_ts()
+    if thread_name is None:
+        thread_name = threading.current_thread().name
     log_line: str = ""
     # Create a separator if this is the beginning of an invocation
     if type(e) == MainReportVersion:
         separator = 30 * "="
-        log_line = f"\n\n{separator} {get_ts()} | {get_invocation_id()} {separator}\n"
+        log_line = f"\n\n{separator} {event_ts} | {get_invocation_id()} {separator}\n"
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S.%f")
-    scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
+    ts: str = event_ts.strftime("%H:%M:%S.%f")
+    if scrubber is None:
+        scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
+    else:
+        scrubbed_msg = scrubber(e.message())
     level: str = e.level_tag() if len(e.level_tag()) == 5 else f"{e.level_tag()} "
     thread = ""
-    if threading.current_thread().name:
-        thread_name = threading.current_thread().name
+    if thread_name:
         thread_name = thread_name[:10]
         thread_name = thread_name.ljust(10, " ")
         thread = f" [{thread_name}]:"
@@ -204,21 +268,36 @@ def create_debug_text_log_line(e: T_Event) -> str:
 
 
 # translates an Event to a completely formatted json log line
-def create_json_log_line(e: T_Event) -> Optional[str]:
+def create_json_log_line(
+    e: T_Event,
+    event_ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> Optional[str]:
     if type(e) == EmptyLine:
         return None  # will not be sent to logger
     # using preformatted ts string instead of formatting it here to be extra careful about timezone
-    values = event_to_serializable_dict(e)
+    values = event_to_serializable_dict(e, event_ts, thread_name)
     raw_log_line = json.dumps(values, sort_keys=True)
-    return scrub_secrets(raw_log_line, env_secrets())
+    if scrubber is None:
+        return scrub_secrets(raw_log_line, env_secrets())
+    return scrubber(raw_log_line)
 
 
 # calls create_stdout_text_log_line() or create_json_log_line() according to logger config
-def create_log_line(e: T_Event, file_output=False) -> Optional[str]:
+def create_log_line(
+    e: T_Event,
+    file_output=False,
+    event_ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> Optional[str]:
     if this.format_json:
-        return create_json_log_line(e)  # json output, both console and file
+        # json output, both console and file
+        return create_json_log_line(e, event_ts, thread_name, scrubber)
     elif file_output is True or flags.DEBUG:
-        return create_debug_text_log_line(e)  # default file output
+        # default file output
+        return create_debug_text_log_line(e, event_ts, thread_name, scrubber)
     else:
         return create_info_text_log_line(e)  # console output
 
@@ -265,6 +344,126 @@ def send_exc_to_logger(
         )
 
 
+class QueuedEvent(NamedTuple):
+    event: Event
+    ts: datetime
+    thread_name: str
+
+
+class EventLogWriter:
+    """Write the file log on a single background thread.
+
+    Threads that fire events only put them on a queue, along with the time
+    and the thread they were fired on. The writer thread formats and scrubs
+    everything that has been queued since its last write, and hands it to the
+    file handler as a single record.
+    """
+
+    # the most events formatted before they're written
+    BATCH_SIZE = 1000
+
+    def __init__(self, logger: Logger, scrubber: SecretScrubber) -> None:
+        self.logger = logger
+        self.scrubber = scrubber
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="EventLogWriter", daemon=True)
+        self._thread.start()
+
+    def put(self, e: Event) -> None:
+        if isinstance(e, Cache):
+            # cache events render the cache lazily, which is only safe while
+            # the thread that fired them still holds the cache lock
+            log_line = create_log_line(e, file_output=True, scrubber=self.scrubber)
+            if log_line:
+                self._queue.put(log_line)
+        else:
+            self._queue.put(QueuedEvent(e, get_ts(), threading.current_thread().name))
+
+    def flush(self) -> None:
+        # wait until everything queued so far has been written
+        written = threading.Event()
+        self._queue.put(written)
+        written.wait()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        closed = False
+        while not closed:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            log_lines: List[str] = []
+            written: List[threading.Event] = []
+            for item in batch:
+                if item is None:
+                    closed = True
+                elif isinstance(item, threading.Event):
+                    written.append(item)
+                elif isinstance(item, str):
+                    log_lines.append(item)
+                else:
+                    log_line = self._format(item)
+                    if log_line:
+                        log_lines.append(log_line)
+            if log_lines:
+                self.logger.debug("\n".join(log_lines))
+            for event in written:
+                event.set()
+
+    def _format(self, item: QueuedEvent) -> Optional[str]:
+        try:
+            return create_log_line(
+                item.event,
+                file_output=True,
+                event_ts=item.ts,
+                thread_name=item.thread_name,
+                scrubber=self.scrubber,
+            )
+        except Exception as exc:
+            # there's no caller to raise this to, and the writer must keep going
+            return f"Failed to format {type(item.event).__name__} for the log file: {exc}"
+
+
+def flush_event_log() -> None:
+    if this.EVENT_LOG_WRITER is not None:
+        this.EVENT_LOG_WRITER.flush()
+
+
+def close_event_log_writer() -> None:
+    writer = this.EVENT_LOG_WRITER
+    if writer is not None:
+        this.EVENT_LOG_WRITER = None
+        writer.close()
+
+
+def _forget_event_log_writer() -> None:
+    # a forked process doesn't inherit the writer thread, so it writes its own
+    # events synchronously
+    this.EVENT_LOG_WRITER = None
+
+
+def close_event_history() -> None:
+    this.EVENT_HISTORY.close()
+
+
+def _reset_event_history_thread() -> None:
+    this.EVENT_HISTORY.after_fork()
+
+
+atexit.register(close_event_log_writer)
+atexit.register(close_event_history)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_event_log_writer)
+    os.register_at_fork(after_in_child=_reset_event_history_thread)
+
+
 # top-level method for accessing the new eventing system
 # this is where all the side effects happen branched by event type
 # (i.e. - mutating the event history, printing to stdout, logging
@@ -274,14 +473,12 @@ def fire_event(e: Event) -> None:
     if isinstance(e, Cache) and not flags.LOG_CACHE_EVENTS:
         return
 
-    # if and only if the event history deque will be completely filled by this event
-    # fire warning that old events are now being dropped
-    global EVENT_HISTORY
-    if len(EVENT_HISTORY) == (flags.EVENT_BUFFER_SIZE - 1):
-        EVENT_HISTORY.append(e)
-        fire_event(EventBufferFull())
+    if isinstance(e, Cache):
+        # cache events render the cache lazily, which is only safe while the
+        # thread that fired them still holds the cache lock
+        EVENT_HISTORY.append(event_to_serializable_dict(e))
     else:
-        EVENT_HISTORY.append(e)
+        EVENT_HISTORY.append_event(e, get_ts(), threading.current_thread().name)
 
     # backwards compatibility for plugins that require old logger (dbt-rpc)
     if flags.ENABLE_LEGACY_LOGGER:
@@ -294,10 +491,18 @@ def fire_event(e: Event) -> None:
 
     # always logs debug level regardless of user input
     if not isinstance(e, NoFile):
-        log_line = create_log_line(e, file_output=True)
-        # doesn't send exceptions to exception logger
-        if log_line:
-            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
+        writer = this.EVENT_LOG_WRITER
+        if writer is not None:
+            writer.put(e)
+            # errors are written before they're shown, in case the process
+            # doesn't get to exit cleanly
+            if e.level_tag() == "error" or isinstance(e, ShowException):
+                writer.flush()
+        else:
+            log_line = create_log_line(e, file_output=True)
+            # doesn't send exceptions to exception logger
+            if log_line:
+                send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
 
     if not isinstance(e, NoStdOut):
         # explicitly checking the debug flag here so that potentially expensive-to-construct
@@ -343,7 +548,8 @@ def get_ts() -> datetime:
 
 
 # preformatted time stamp
-def get_ts_rfc3339() -> str:
-    ts = get_ts()
+def get_ts_rfc3339(ts: Optional[datetime] = None) -> str:
+    if ts is None:
+        ts = get_ts()
     ts_rfc3339 = ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     return ts_rfc3339
@@ -0,0 +1,244 @@
+import json
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, IO, Iterator, Optional, Tuple
+
+EVENT_HISTORY_FILE_NAME = "event_history.jsonl"
+
+
+class EventRecord:
+    """An event in the event history, kept as the json document it was
+    serialized to when it was fired. Its fields are decoded on access.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: bytes) -> None:
+        self.raw = raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        return json.loads(self.raw)
+
+    @property
+    def code(self) -> str:
+        return self.to_dict()["code"]
+
+    @property
+    def level(self) -> str:
+        return self.to_dict()["level"]
+
+    @property
+    def msg(self) -> str:
+        return self.to_dict()["msg"]
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return self.to_dict()["data"]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, EventRecord) and self.raw == other.raw
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+    def __repr__(self) -> str:
+        return f"EventRecord({self.raw.decode('utf-8')})"
+
+
+class EventHistory:
+    """The events fired during this invocation, most recent last.
+
+    Events are stored serialized, and scrubbed of secrets if a scrub function
+    is given, so the history doesn't keep the objects they reference alive.
+    When it holds more than max_events events or max_bytes of serialized
+    events, the oldest events are dropped, and on_full is called the first
+    time that happens. If a path is given, every event is also appended to
+    that file, one json document per line, so the whole history can be read
+    with read_event_history after the run.
+
+    Threads that fire events only queue them with append_event. They are
+    serialized on a background thread, and reading the history waits until
+    everything queued so far has been added. At most MAX_QUEUED_EVENTS are
+    queued, so the events waiting don't keep what they reference alive: when
+    the queue is full, the firing thread serializes its event itself and
+    waits for room for the result.
+    """
+
+    MAX_QUEUED_EVENTS = 1000
+
+    def __init__(
+        self,
+        max_events: int,
+        max_bytes: int,
+        scrub: Optional[Callable[[str], str]] = None,
+        path: Optional[str] = None,
+        serialize: Optional[Callable[[Any, datetime, str], Dict[str, Any]]] = None,
+        on_full: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.scrub = scrub
+        self.path = path
+        self.serialize = serialize
+        self.on_full = on_full
+        self.size = 0
+        self.full = False
+        self._records: Deque[bytes] = deque()
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        if path is not None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "wb")
+        self._queue: queue.Queue = queue.Queue(self.MAX_QUEUED_EVENTS)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def append(self, values: Dict[str, Any]) -> None:
+        """Add the serializable dict of an event to the history."""
+        self._put(values)
+
+    def append_event(self, event: Any, ts: datetime, thread_name: str) -> None:
+        """Add an event to the history, to be serialized with the time and
+        the thread it was fired on."""
+        self._put((event, ts, thread_name))
+
+    def _put(self, item: Any) -> None:
+        thread = self._thread
+        if thread is None:
+            thread = self._start()
+        if threading.current_thread() is thread:
+            # fired while adding another event, e.g. by on_full, so it's
+            # added right after that one
+            self._add(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if not isinstance(item, dict):
+                item = self._serialize(item)
+            self._queue.put(item)
+
+    def _start(self) -> threading.Thread:
+        with self._thread_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="EventHistory", daemon=True)
+                thread.start()
+                self._thread = thread
+            return self._thread
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            elif isinstance(item, threading.Event):
+                item.set()
+            else:
+                self._add(item)
+
+    def _serialize(self, item: Tuple[Any, datetime, str]) -> Dict[str, Any]:
+        assert self.serialize is not None, "EventHistory needs serialize to add events"
+        try:
+            return self.serialize(*item)
+        except Exception as exc:
+            # there's no caller to raise this to, and the history must keep going
+            event = item[0]
+            return {
+                "code": getattr(event, "code", ""),
+                "level": "error",
+                "msg": f"Failed to serialize {type(event).__name__} for the history: {exc}",
+                "data": {},
+            }
+
+    def _add(self, item: Any) -> None:
+        values = item if isinstance(item, dict) else self._serialize(item)
+        serialized = json.dumps(values, separators=(",", ":"), default=str)
+        if self.scrub is not None:
+            serialized = self.scrub(serialized)
+        raw = serialized.encode("utf-8")
+        with self._lock:
+            if self._file is not None:
+                self._file.write(raw + b"\n")
+            self._records.append(raw)
+            self.size += len(raw)
+            dropped = False
+            while len(self._records) > self.max_events or (
+                self.size > self.max_bytes and len(self._records) > 1
+            ):
+                self.size -= len(self._records.popleft())
+                dropped = True
+            if self.full:
+                return
+            # the buffer is full once the next event will drop one
+            self.full = (
+                dropped or len(self._records) >= self.max_events or self.size >= self.max_bytes
+            )
+            became_full = self.full
+        if became_full and self.on_full is not None:
+            self.on_full()
+
+    def flush(self) -> None:
+        """Wait until everything queued so far has been added."""
+        thread = self._thread
+        if thread is None or threading.current_thread() is thread:
+            return
+        added = threading.Event()
+        self._queue.put(added)
+        added.wait()
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is not None and threading.current_thread() is not thread:
+            self._queue.put(None)
+            thread.join()
+            self._thread = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def after_fork(self) -> None:
+        # a forked process doesn't inherit the background thread, nor anything
+        # its parent queued for it
+        self._queue = queue.Queue(self.MAX_QUEUED_EVENTS)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        self.flush()
+        with self._lock:
+            self._records.clear()
+            self.size = 0
+            self.full = False
+
+    def count(self, record: Any) -> int:
+        return sum(1 for r in self if r == record)
+
+    def __len__(self) -> int:
+        self.flush()
+        return len(self._records)
+
+    def __getitem__(self, index: int) -> EventRecord:
+        self.flush()
+        return EventRecord(self._records[index])
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        self.flush()
+        with self._lock:
+            records = list(self._records)
+        return (EventRecord(raw) for raw in records)
+
+
+def read_event_history(path: str) -> Iterator[EventRecord]:
+    """Read the events written to a history file by EventHistory, oldest
+    first. An incomplete last line, from a process that didn't exit cleanly,
+    is skipped.
+    """
+    with open(path, "rb") as fp:
+        for line in fp:
+            if line.endswith(b"\n"):
+                yield EventRecord(line[:-1])
@@ -479,6 +479,15 @@ class ConnectionReused(DebugLevel):
         return f"Re-using an available connection from the pool (formerly {self.conn_name})"
 
 
+@dataclass
+class PooledConnectionReused(DebugLevel):
+    conn_name: Optional[str]
+    code: str = "E050"
+
+    def message(self) -> str:
+        return f'Using an idle handle from the connection pool for "{self.conn_name}"'
+
+
 @dataclass
 class ConnectionLeftOpen(DebugLevel):
     conn_name: Optional[str]
@@ -560,6 +569,34 @@ class ListRelations(DebugLevel):
         return f"with database={self.database}, schema={self.schema}, relations={self.relations}"
 
 
+@dataclass
+class CacheSchemaLazily(DebugLevel):
+    conn_name: str
+    database: Optional[str]
+    schema: Optional[str]
+    num_relations: int
+    code: str = "E045"
+
+    def message(self) -> str:
+        return (
+            f'On "{self.conn_name}": cached {self.num_relations} relations in schema '
+            f'"{self.database}.{self.schema}" on first lookup'
+        )
+
+
+@dataclass
+class ConnectionCounts(InfoLevel):
+    opened: int
+    reused: int
+    code: str = "E046"
+
+    def message(self) -> str:
+        return (
+            f"Opened {self.opened} database connection{(self.opened != 1) * 's'}, "
+            f"reused {self.reused} time{(self.reused != 1) * 's'}"
+        )
+
+
 @dataclass
 class ConnectionUsed(DebugLevel):
     conn_type: str
@@ -1201,6 +1238,28 @@ class InvalidRefInTestNode(DebugLevel):
         return self.msg
 
 
+@dataclass
+class ParseWorkersFallback(DebugLevel):
+    parser: str
+    reason: str
+    code: str = "I052"
+
+    def message(self) -> str:
+        return (
+            f"Parsing {self.parser} files serially instead of in worker processes: {self.reason}"
+        )
+
+
+@dataclass
+class StateArtifactLoaded(DebugLevel):
+    path: str
+    elapsed: float
+    code: str = "I053"
+
+    def message(self) -> str:
+        return f"Loaded state artifact {self.path} in {self.elapsed:0.2f}s"
+
+
 @dataclass
 class RunningOperationCaughtError(ErrorLevel):
     exc: Exception
@@ -1544,6 +1603,42 @@ class BuildingCatalog(InfoLevel):
         return "Building catalog"
 
 
+@dataclass
+class BuildingCatalogIncrementally(InfoLevel):
+    num_schemas: int
+    num_reused: int
+    code: str = "E047"
+
+    def message(self) -> str:
+        return (
+            f"Building catalog incrementally: querying {self.num_schemas} "
+            f"schema{(self.num_schemas != 1) * 's'}, reusing {self.num_reused} "
+            f"relation{(self.num_reused != 1) * 's'} from the previous catalog"
+        )
+
+
+@dataclass
+class IncrementalCatalogFallback(InfoLevel):
+    reason: str
+    code: str = "E048"
+
+    def message(self) -> str:
+        return f"Building the full catalog instead of incrementally: {self.reason}"
+
+
+@dataclass
+class FreshnessBatchFailed(DebugLevel):
+    num_sources: int
+    exc: str
+    code: str = "E049"
+
+    def message(self) -> str:
+        return (
+            f"Could not check the freshness of {self.num_sources} sources in one query, "
+            f"checking them one by one: {self.exc}"
+        )
+
+
 @dataclass
 class CompileComplete(InfoLevel):
     code: str = "Q002"
@@ -2165,6 +2260,23 @@ class ConcurrencyLine(InfoLevel):
         return f"Concurrency: {self.num_threads} threads (target='{self.target_name}')"
 
 
+@dataclass
+class CriticalPathMakespan(InfoLevel):
+    predicted: float
+    actual: float
+    untimed_nodes: int
+    code: str = "Q036"
+
+    def message(self) -> str:
+        msg = (
+            f"Critical path scheduling: predicted {self.predicted:0.2f}s, "
+            f"actual {self.actual:0.2f}s"
+        )
+        if self.untimed_nodes:
+            msg += f" ({self.untimed_nodes} nodes had no timing history)"
+        return msg
+
+
 @dataclass
 class NodeCompiling(DebugLevel, NodeInfo):
     unique_id: str
@@ -2501,6 +2613,7 @@ if 1 == 0:
     MacroEventDebug(msg="")
     NewConnection(conn_type="", conn_name="")
     ConnectionReused(conn_name="")
+    PooledConnectionReused(conn_name="")
     ConnectionLeftOpen(conn_name="")
     ConnectionClosed(conn_name="")
     RollbackFailed(conn_name="")
@@ -2509,6 +2622,8 @@ if 1 == 0:
     Rollback(conn_name="")
     CacheMiss(conn_name="", database="", schema="")
     ListRelations(database="", schema="", relations=[])
+    CacheSchemaLazily(conn_name="", database="", schema="", num_relations=0)
+    ConnectionCounts(opened=0, reused=0)
     ConnectionUsed(conn_type="", conn_name="")
     SQLQuery(conn_name="", sql="")
     SQLQueryStatus(status="", elapsed=0.1)
@@ -2592,6 +2707,8 @@ if 1 == 0:
     PartialParsingDeletedExposure(unique_id="")
     InvalidDisabledSourceInTestNode(msg="")
     InvalidRefInTestNode(msg="")
+    ParseWorkersFallback(parser="", reason="")
+    StateArtifactLoaded(path="", elapsed=0.0)
     RunningOperationCaughtError(exc=Exception(""))
     RunningOperationUncaughtError(exc=Exception(""))
     DbtProjectError()
@@ -2625,6 +2742,9 @@ if 1 == 0:
     CatalogWritten(path="")
     CannotGenerateDocs()
     BuildingCatalog()
+    BuildingCatalogIncrementally(num_schemas=0, num_reused=0)
+    IncrementalCatalogFallback(reason="")
+    FreshnessBatchFailed(num_sources=0, exc="")
     CompileComplete()
     FreshnessCheckComplete()
     ServingDocsPort(address="", port=0)
@@ -2786,6 +2906,7 @@ if 1 == 0:
     NodeFinished(node_info={}, unique_id="", run_result={})
     QueryCancelationUnsupported(type="")
     ConcurrencyLine(num_threads=0, target_name="")
+    CriticalPathMakespan(predicted=0.0, actual=0.0, untimed_nodes=0)
     NodeCompiling(node_info={}, unique_id="")
     NodeExecuting(node_info={}, unique_id="")
     StarterProjectPath(dir="")
@@ -23,6 +23,7 @@ STATIC_PARSER = None
 WARN_ERROR = None
 WRITE_JSON = None
 PARTIAL_PARSE = None
+PARTIAL_PARSE_FILE_STAT = None
 USE_COLORS = None
 DEBUG = None
 LOG_FORMAT = None
@@ -34,9 +35,17 @@ WHICH = None
 INDIRECT_SELECTION = None
 LOG_CACHE_EVENTS = None
 EVENT_BUFFER_SIZE = 100000
+EVENT_BUFFER_BYTES = 64 * 1024 * 1024
+WRITE_EVENT_HISTORY = None
 QUIET = None
 NO_PRINT = None
 CACHE_SELECTED_ONLY = None
+LAZY_RELATION_CACHE = None
+REUSE_CONNECTIONS = None
+BATCH_SOURCE_FRESHNESS = None
+PRIORITIZE_CRITICAL_PATH = None
+PARSE_WORKERS = 0
+ASYNC_LOGGING = None
 
 _NON_BOOLEAN_FLAGS = [
     "LOG_FORMAT",
@@ -44,6 +53,8 @@ _NON_BOOLEAN_FLAGS = [
     "PROFILES_DIR",
     "INDIRECT_SELECTION",
     "EVENT_BUFFER_SIZE",
+    "EVENT_BUFFER_BYTES",
+    "PARSE_WORKERS",
 ]
 
 _NON_DBT_ENV_FLAGS = ["DO_NOT_TRACK"]
@@ -57,6 +68,7 @@ flag_defaults = {
     "WARN_ERROR": False,
     "WRITE_JSON": True,
     "PARTIAL_PARSE": True,
+    "PARTIAL_PARSE_FILE_STAT": True,
     "USE_COLORS": True,
     "PROFILES_DIR": DEFAULT_PROFILES_DIR,
     "DEBUG": False,
@@ -68,9 +80,17 @@ flag_defaults = {
     "INDIRECT_SELECTION": "eager",
     "LOG_CACHE_EVENTS": False,
     "EVENT_BUFFER_SIZE": 100000,
+    "EVENT_BUFFER_BYTES": 64 * 1024 * 1024,
+    "WRITE_EVENT_HISTORY": False,
     "QUIET": False,
     "NO_PRINT": False,
     "CACHE_SELECTED_ONLY": False,
+    "LAZY_RELATION_CACHE": False,
+    "REUSE_CONNECTIONS": True,
+    "BATCH_SOURCE_FRESHNESS": False,
+    "PRIORITIZE_CRITICAL_PATH": False,
+    "PARSE_WORKERS": 0,
+    "ASYNC_LOGGING": False,
 }
 
 
@@ -102,6 +122,7 @@ MACRO_DEBUGGING = env_set_truthy("DBT_MACRO_DEBUGGING")
 DEFER_MODE = env_set_truthy("DBT_DEFER_TO_STATE")
 ARTIFACT_STATE_PATH = env_set_path("DBT_ARTIFACT_STATE_PATH")
 ENABLE_LEGACY_LOGGER = env_set_truthy("DBT_ENABLE_LEGACY_LOGGER")
+USE_COMPACT_GRAPH = env_set_truthy("DBT_USE_COMPACT_GRAPH")
 
 
 def _get_context():
@@ -121,6 +142,9 @@ def set_from_args(args, user_config):
     global WRITE_JSON, PARTIAL_PARSE, USE_COLORS, STORE_FAILURES, PROFILES_DIR, DEBUG, LOG_FORMAT
     global INDIRECT_SELECTION, VERSION_CHECK, FAIL_FAST, SEND_ANONYMOUS_USAGE_STATS
     global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET, NO_PRINT, CACHE_SELECTED_ONLY
+    global PRIORITIZE_CRITICAL_PATH, PARTIAL_PARSE_FILE_STAT, PARSE_WORKERS, ASYNC_LOGGING
+    global EVENT_BUFFER_BYTES, WRITE_EVENT_HISTORY, LAZY_RELATION_CACHE, REUSE_CONNECTIONS
+    global BATCH_SOURCE_FRESHNESS
 
     STRICT_MODE = False  # backwards compatibility
     # cli args without user_config or env var option
@@ -134,6 +158,7 @@ def set_from_args(args, user_config):
     WARN_ERROR = get_flag_value("WARN_ERROR", args, user_config)
     WRITE_JSON = get_flag_value("WRITE_JSON", args, user_config)
     PARTIAL_PARSE = get_flag_value("PARTIAL_PARSE", args, user_config)
+    PARTIAL_PARSE_FILE_STAT = get_flag_value("PARTIAL_PARSE_FILE_STAT", args, user_config)
     USE_COLORS = get_flag_value("USE_COLORS", args, user_config)
     PROFILES_DIR = get_flag_value("PROFILES_DIR", args, user_config)
     DEBUG = get_flag_value("DEBUG", args, user_config)
@@ -145,9 +170,17 @@ def set_from_args(args, user_config):
     INDIRECT_SELECTION = get_flag_value("INDIRECT_SELECTION", args, user_config)
     LOG_CACHE_EVENTS = get_flag_value("LOG_CACHE_EVENTS", args, user_config)
     EVENT_BUFFER_SIZE = get_flag_value("EVENT_BUFFER_SIZE", args, user_config)
+    EVENT_BUFFER_BYTES = get_flag_value("EVENT_BUFFER_BYTES", args, user_config)
+    WRITE_EVENT_HISTORY = get_flag_value("WRITE_EVENT_HISTORY", args, user_config)
     QUIET = get_flag_value("QUIET", args, user_config)
     NO_PRINT = get_flag_value("NO_PRINT", args, user_config)
     CACHE_SELECTED_ONLY = get_flag_value("CACHE_SELECTED_ONLY", args, user_config)
+    LAZY_RELATION_CACHE = get_flag_value("LAZY_RELATION_CACHE", args, user_config)
+    REUSE_CONNECTIONS = get_flag_value("REUSE_CONNECTIONS", args, user_config)
+    BATCH_SOURCE_FRESHNESS = get_flag_value("BATCH_SOURCE_FRESHNESS", args, user_config)
+    PRIORITIZE_CRITICAL_PATH = get_flag_value("PRIORITIZE_CRITICAL_PATH", args, user_config)
+    PARSE_WORKERS = get_flag_value("PARSE_WORKERS", args, user_config)
+    ASYNC_LOGGING = get_flag_value("ASYNC_LOGGING", args, user_config)
 
     _set_overrides_from_env()
 
@@ -165,7 +198,8 @@ def _set_overrides_from_env():
 def get_flag_value(flag, args, user_config):
     flag_value = _load_flag_value(flag, args, user_config)
 
-    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE"]:  # must be ints
+    # must be ints
+    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE", "EVENT_BUFFER_BYTES", "PARSE_WORKERS"]:
         flag_value = int(flag_value)
     if flag == "PROFILES_DIR":
         flag_value = os.path.abspath(flag_value)
@@ -0,0 +1,202 @@
+import sys
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import networkx as nx  # type: ignore
+
+
+def _build_adjacency(num_nodes: int, edges: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """Build CSR-style adjacency arrays: the neighbors of node `i` are
+    `targets[offsets[i]:offsets[i + 1]]`.
+    """
+    offsets = array("i", bytes(4 * (num_nodes + 1)))
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for index in range(num_nodes):
+        offsets[index + 1] += offsets[index]
+
+    targets = array("i", bytes(4 * len(edges)))
+    positions = offsets[:-1]
+    for source, target in edges:
+        targets[positions[source]] = target
+        positions[source] += 1
+    return offsets, targets
+
+
+class CompactGraph:
+    """An immutable directed graph with integer node ids.
+
+    Node names (unique_ids) are interned once in a table, and edges are stored
+    as CSR-style integer arrays in both directions. This implements the subset
+    of the networkx DiGraph API that `Graph`, `NodeSelector` and `GraphQueue`
+    use, with far less memory per node and edge than networkx's nested dicts.
+    Nodes do not carry attributes.
+    """
+
+    def __init__(self, nodes: Iterable[str], edges: Iterable[Tuple[str, str]]):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for node in nodes:
+            self._intern(node)
+        # dict.fromkeys drops duplicate edges while preserving their order
+        pairs = list(
+            dict.fromkeys((self._intern(source), self._intern(target)) for source, target in edges)
+        )
+        num_nodes = len(self._names)
+        self._succ_offsets, self._succ_targets = _build_adjacency(num_nodes, pairs)
+        self._pred_offsets, self._pred_targets = _build_adjacency(
+            num_nodes, [(target, source) for source, target in pairs]
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> "CompactGraph":
+        return cls(graph.nodes(), graph.edges())
+
+    def to_networkx(self) -> nx.DiGraph:
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._names)
+        graph.add_edges_from(self.edges())
+        return graph
+
+    def _intern(self, node: str) -> int:
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = len(self._names)
+            node = sys.intern(node)
+            self._names.append(node)
+            self._ids[node] = node_id
+        return node_id
+
+    def _successor_ids(self, node_id: int) -> array:
+        return self._succ_targets[self._succ_offsets[node_id] : self._succ_offsets[node_id + 1]]
+
+    def _predecessor_ids(self, node_id: int) -> array:
+        return self._pred_targets[self._pred_offsets[node_id] : self._pred_offsets[node_id + 1]]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._ids
+
+    def has_node(self, node: str) -> bool:
+        return node in self._ids
+
+    def is_directed(self) -> bool:
+        return True
+
+    def nodes(self) -> List[str]:
+        return list(self._names)
+
+    def edges(self) -> List[Tuple[str, str]]:
+        names = self._names
+        return [
+            (names[source], names[target])
+            for source in range(len(names))
+            for target in self._successor_ids(source)
+        ]
+
+    def successors(self, node: str) -> Iterator[str]:
+        names = self._names
+        return (names[target] for target in self._successor_ids(self._ids[node]))
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        names = self._names
+        return (names[source] for source in self._predecessor_ids(self._ids[node]))
+
+    def in_degree(self) -> Iterator[Tuple[str, int]]:
+        offsets = self._pred_offsets
+        return ((name, offsets[i + 1] - offsets[i]) for i, name in enumerate(self._names))
+
+    def out_degree(self) -> Iterator[Tuple[str, int]]:
+        offsets = self._succ_offsets
+        return ((name, offsets[i + 1] - offsets[i]) for i, name in enumerate(self._names))
+
+    def _search(
+        self, node: str, offsets: array, targets: array, max_depth: Optional[int]
+    ) -> Set[str]:
+        """Breadth-first search from `node` along the given adjacency arrays,
+        stopping after `max_depth` levels if it is set.
+        """
+        start = self._ids[node]
+        seen: Set[int] = {start}
+        frontier = [start]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            next_frontier = []
+            for current in frontier:
+                for neighbor in targets[offsets[current] : offsets[current + 1]]:
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+            depth += 1
+        seen.discard(start)
+        names = self._names
+        return {names[node_id] for node_id in seen}
+
+    def ancestors(self, node: str, max_depth: Optional[int] = None) -> Set[str]:
+        """Returns all nodes having a path to `node`, optionally within
+        `max_depth` edges."""
+        return self._search(node, self._pred_offsets, self._pred_targets, max_depth)
+
+    def descendants(self, node: str, max_depth: Optional[int] = None) -> Set[str]:
+        """Returns all nodes reachable from `node`, optionally within
+        `max_depth` edges."""
+        return self._search(node, self._succ_offsets, self._succ_targets, max_depth)
+
+    def subgraph(self, nodes: Iterable[str]) -> "CompactGraph":
+        """Returns the subgraph induced by `nodes`. Nodes that are not in the
+        graph are ignored."""
+        keep = sorted({self._ids[node] for node in nodes if node in self._ids})
+        kept = set(keep)
+        names = self._names
+        edges = [
+            (names[source], names[target])
+            for source in keep
+            for target in self._successor_ids(source)
+            if target in kept
+        ]
+        return CompactGraph((names[node_id] for node_id in keep), edges)
+
+    def weakly_connected_components(self) -> Iterator[Set[str]]:
+        seen: Set[int] = set()
+        names = self._names
+        for start in range(len(names)):
+            if start in seen:
+                continue
+            seen.add(start)
+            component = [start]
+            queue: Deque[int] = deque([start])
+            while queue:
+                current = queue.popleft()
+                for neighbor in self._successor_ids(current) + self._predecessor_ids(current):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        component.append(neighbor)
+                        queue.append(neighbor)
+            yield {names[node_id] for node_id in component}
+
+    def grouped_topological_sort(self) -> Iterator[List[str]]:
+        """Topological sort that yields one list of nodes per depth level."""
+        offsets = self._pred_offsets
+        indegree = [offsets[i + 1] - offsets[i] for i in range(len(self._names))]
+        level = [node_id for node_id, degree in enumerate(indegree) if degree == 0]
+        names = self._names
+        while level:
+            yield [names[node_id] for node_id in level]
+            next_level = []
+            for node_id in level:
+                for child in self._successor_ids(node_id):
+                    indegree[child] -= 1
+                    if not indegree[child]:
+                        next_level.append(child)
+            level = next_level
+
+    def topological_sort(self) -> Iterator[str]:
+        for level in self.grouped_topological_sort():
+            yield from level
@@ -1,8 +1,9 @@
-from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
+from collections import deque
+from typing import Deque, List, Set, Iterable, Iterator, Optional, NewType
 import networkx as nx  # type: ignore
 
 from dbt.exceptions import InternalException
+from .compact import CompactGraph
 
 UniqueId = NewType("UniqueId", str)
 
@@ -10,6 +11,9 @@ UniqueId = NewType("UniqueId", str)
 class Graph:
     """A wrapper around the networkx graph that understands SelectionCriteria
     and how they interact with the graph.
+
+    The wrapped graph may also be a `CompactGraph`, which implements the same
+    operations over integer node ids.
     """
 
     def __init__(self, graph):
@@ -28,6 +32,8 @@ class Graph:
         """Returns all nodes having a path to `node` in `graph`"""
         if not self.graph.has_node(node):
             raise InternalException(f"Node {node} not found in the graph!")
+        if isinstance(self.graph, CompactGraph):
+            return {UniqueId(n) for n in self.graph.ancestors(node, max_depth)}
         # This used to use nx.utils.reversed(self.graph), but that is deprecated,
         # so changing to use self.graph.reverse(copy=False) as recommeneded
         G = self.graph.reverse(copy=False) if self.graph.is_directed() else self.graph
@@ -38,6 +44,8 @@ class Graph:
         """Returns all nodes reachable from `node` in `graph`"""
         if not self.graph.has_node(node):
             raise InternalException(f"Node {node} not found in the graph!")
+        if isinstance(self.graph, CompactGraph):
+            return {UniqueId(n) for n in self.graph.descendants(node, max_depth)}
         des = nx.single_source_shortest_path_length(
             G=self.graph, source=node, cutoff=max_depth
         ).keys()
@@ -73,34 +81,64 @@ class Graph:
         """Create and return a new graph that is a shallow copy of the graph,
         but with only the nodes in include_nodes. Transitive edges across
         removed nodes are preserved as explicit new edges.
-        """
 
-        new_graph = self.graph.copy()
+        Instead of removing every unselected node from a copy of the full
+        graph, this searches forward from each selected node, passing through
+        unselected nodes and stopping at selected ones. Apart from one pass
+        over the nodes to keep their order, the cost depends on the selected
+        nodes and the edges reachable from them, not on the size of the whole
+        graph.
+        """
         include_nodes = set(selected)
 
-        for node in self:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target) for source, target in new_edges if source != target
-                ]  # removes cyclic refs
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is " "it disabled?".format(node)
                 )
 
+        # keep the nodes in the order of the full graph, so the subset graph
+        # is the same from one run to the next
+        ordered_nodes = [node for node in self.graph if node in include_nodes]
+        new_edges = (
+            (node, target)
+            for node in ordered_nodes
+            for target in self._selected_successors(node, include_nodes)
+        )
+
+        if isinstance(self.graph, CompactGraph):
+            return Graph(CompactGraph(ordered_nodes, new_edges))
+
+        new_graph = nx.DiGraph(**self.graph.graph)
+        new_graph.add_nodes_from((node, self.graph.nodes[node]) for node in ordered_nodes)
+        new_graph.add_edges_from(new_edges)
+
         return Graph(new_graph)
 
+    def _selected_successors(self, node: UniqueId, include_nodes: Set[UniqueId]) -> List[UniqueId]:
+        """Find the selected nodes that can be reached from `node` through
+        paths whose intermediate nodes are all unselected, in the order they
+        are found.
+        """
+        found: List[UniqueId] = []
+        visited: Set[UniqueId] = {node}
+        queue: Deque[UniqueId] = deque([node])
+        while queue:
+            current = queue.popleft()
+            for successor in self.graph.successors(current):
+                if successor in visited:
+                    continue
+                visited.add(successor)
+                if successor in include_nodes:
+                    found.append(successor)
+                else:
+                    queue.append(successor)
+        return found
+
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
         return Graph(self.graph.subgraph(nodes))
 
     def get_dependent_nodes(self, node: UniqueId):
+        if isinstance(self.graph, CompactGraph):
+            return self.graph.descendants(node)
         return nx.descendants(self.graph, node)
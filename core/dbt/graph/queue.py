@@ -1,26 +1,42 @@
+import heapq
 import networkx as nx  # type: ignore
 import threading
 
 from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from typing import Dict, Set, List, Generator, Iterable, Optional, Tuple, Union, cast
 
+from .compact import CompactGraph
 from .graph import UniqueId
 from dbt.contracts.graph.parsed import ParsedSourceDefinition, ParsedExposure, ParsedMetric
 from dbt.contracts.graph.compiled import GraphMemberNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.node_types import NodeType
 
+# depth-only scores are plain ints, critical path scores are
+# (-remaining seconds, depth) tuples. Lower is higher priority.
+Score = Union[int, Tuple[float, int]]
+
 
 class GraphQueue:
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
+
+    Rather than rescanning the graph whenever a node finishes, the queue keeps
+    a count of unfinished parents for every node. Marking a node as done only
+    touches that node's successors, and any successor whose count drops to
+    zero is pushed onto the inner priority queue.
 
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]):
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        timings: Optional[Dict[str, float]] = None,
+    ):
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
@@ -33,10 +49,20 @@ class GraphQueue:
         self.queued: Set[UniqueId] = set()
         # this lock controls most things
         self.lock = threading.Lock()
-        # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        # historical execution times, in seconds, keyed by unique_id
+        self.timings = timings
+        # store the 'score' of each node. Lower is higher priority.
+        self._scores: Dict[str, Score]
+        if timings is None:
+            self._scores = self._get_scores(self.graph)
+        else:
+            self._scores = self._get_critical_path_scores(self.graph, timings)
+        # the number of unfinished parents of each node
+        self._indegree: Dict[UniqueId, int] = dict(self.graph.in_degree())
+        # the number of nodes that have not been marked as done
+        self._remaining = len(self._indegree)
         # populate the initial queue
-        self._find_new_additions()
+        self._find_new_additions(node for node, degree in self._indegree.items() if degree == 0)
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -69,6 +95,10 @@ class GraphQueue:
         Returns:
             A generator that yields lists of nodes, one list per graph depth level.
         """
+        if isinstance(graph, CompactGraph):
+            yield from graph.grouped_topological_sort()
+            return
+
         indegree_map = {v: d for v, d in graph.in_degree() if d > 0}
         zero_indegree = [v for v, d in graph.in_degree() if d == 0]
 
@@ -82,7 +112,7 @@ class GraphQueue:
                         new_zero_indegree.append(child)
             zero_indegree = new_zero_indegree
 
-    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
+    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, Score]:
         """Scoring nodes for processing order.
 
         Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
@@ -94,10 +124,14 @@ class GraphQueue:
             A dictionary consisting of `node name`:`score` pairs.
         """
         # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
+        if isinstance(graph, CompactGraph):
+            components = graph.weakly_connected_components()
+        else:
+            components = nx.connected_components(nx.Graph(graph))
+        subgraphs = (graph.subgraph(x) for x in components)
 
         # score all nodes in all subgraphs
-        scores = {}
+        scores: Dict[str, Score] = {}
         for subgraph in subgraphs:
             grouped_nodes = self._grouped_topological_sort(subgraph)
             for level, group in enumerate(grouped_nodes):
@@ -106,6 +140,64 @@ class GraphQueue:
 
         return scores
 
+    def _get_critical_path_scores(
+        self, graph: nx.DiGraph, timings: Dict[str, float]
+    ) -> Dict[str, Score]:
+        """Scoring nodes by the longest weighted path from each node to a sink.
+
+        Each node is weighted by its historical execution time, so nodes that
+        gate the most remaining work are processed first. Nodes without any
+        timing history weigh nothing, which means a subgraph with no history
+        at all is ordered by graph depth level, exactly as in `_get_scores`.
+
+        Args:
+            graph: The graph to be scored.
+            timings: Historical execution times in seconds, keyed by node name.
+
+        Returns:
+            A dictionary consisting of `node name`:`(-remaining seconds, depth)`
+            pairs.
+        """
+        depths = self._get_scores(graph)
+        if isinstance(graph, CompactGraph):
+            order = list(graph.topological_sort())
+        else:
+            order = list(nx.topological_sort(graph))
+        remaining: Dict[str, float] = {}
+        for node in reversed(order):
+            downstream = max((remaining[child] for child in graph.successors(node)), default=0.0)
+            remaining[node] = timings.get(node, 0.0) + downstream
+
+        return {node: (-remaining[node], cast(int, depths[node])) for node in graph}
+
+    def predict_makespan(self, threads: int) -> float:
+        """Simulate running the whole graph with the given number of threads,
+        using historical execution times and this queue's priority order.
+
+        Nodes without timing history are assumed to take no time. Only
+        meaningful when the queue was built with timings, and must be called
+        before any node has been handed out.
+
+        :param threads: The number of worker threads to simulate.
+        :return: The predicted wall-clock time in seconds.
+        """
+        timings = self.timings or {}
+        indegree = dict(self.graph.in_degree())
+        ready = [(self._scores[node], node) for node, degree in indegree.items() if degree == 0]
+        heapq.heapify(ready)
+        running: List[Tuple[float, str]] = []
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < max(threads, 1):
+                _, node = heapq.heappop(ready)
+                heapq.heappush(running, (now + timings.get(node, 0.0), node))
+            now, node = heapq.heappop(running)
+            for child in self.graph.successors(node):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    heapq.heappush(ready, (self._scores[child], child))
+        return now
+
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
 
@@ -131,7 +223,7 @@ class GraphQueue:
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return self._remaining - len(self.in_progress)
 
     def empty(self) -> bool:
         """The graph queue is 'empty' if it all remaining nodes in the graph
@@ -152,15 +244,32 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
-    def _find_new_additions(self) -> None:
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+    def _find_new_additions(self, candidates: Iterable[UniqueId]) -> None:
+        """Add any of the candidate nodes that have no unfinished parents to
+        the internal queue.
+
+        Callers must hold the lock.
+
+        :param candidates: The nodes whose parent counts may have reached zero.
         """
-        for node, in_degree in self.graph.in_degree():
-            if not self._already_known(node) and in_degree == 0:
+        for node in candidates:
+            if not self._already_known(node) and self._indegree[node] == 0:
                 self.inner.put((self._scores[node], node))
                 self.queued.add(node)
 
+    def _release_successors(self, node_id: UniqueId) -> List[UniqueId]:
+        """Decrement the unfinished parent count of every successor of the
+        given node, returning the successors.
+
+        Callers must hold the lock.
+
+        :param str node_id: The node ID that just finished.
+        """
+        successors = list(self.graph.successors(node_id))
+        for successor in successors:
+            self._indegree[successor] -= 1
+        return successors
+
     def mark_done(self, node_id: UniqueId) -> None:
         """Given a node's unique ID, mark it as done.
 
@@ -170,8 +279,8 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
-            self.graph.remove_node(node_id)
-            self._find_new_additions()
+            self._remaining -= 1
+            self._find_new_additions(self._release_successors(node_id))
             self.inner.task_done()
             self.some_task_done.notify_all()
 
@@ -1,7 +1,21 @@
 import abc
 from itertools import chain
 from pathlib import Path
-from typing import Set, List, Dict, Iterator, Tuple, Any, Union, Type, Optional, Callable
+from typing import (
+    Set,
+    List,
+    Dict,
+    Iterator,
+    Iterable,
+    Tuple,
+    Any,
+    Union,
+    Type,
+    Optional,
+    Callable,
+    Mapping,
+    Hashable,
+)
 
 from dbt.dataclass_schema import StrEnum
 
@@ -22,7 +36,7 @@ from dbt.contracts.graph.parsed import (
     ParsedGenericTestNode,
     ParsedSourceDefinition,
 )
-from dbt.contracts.state import PreviousState
+from dbt.contracts.state import HydratingMapping, PreviousState
 from dbt.exceptions import (
     InternalException,
     RuntimeException,
@@ -79,13 +93,135 @@ def is_selected_node(fqn: List[str], node_selector: str):
 SelectorTarget = Union[ParsedSourceDefinition, ManifestNode, ParsedExposure, ParsedMetric]
 
 
+def _flat_fqn(fqn: List[str]) -> List[str]:
+    return [item for segment in fqn for item in segment.split(".")]
+
+
+class SelectorIndex:
+    """Inverted indexes from node attributes to unique IDs, for the selector
+    methods that match nodes on a single attribute. Each index is built from
+    the whole manifest the first time a method uses it, so selecting with many
+    criteria doesn't scan every node for each of them. The unique IDs of each
+    key are in manifest order.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self._indexes: Dict[Hashable, Any] = {}
+
+    def _targets(self, *collections: Mapping[str, SelectorTarget]):
+        return chain.from_iterable(collection.items() for collection in collections)
+
+    def _all_targets(self):
+        return self._targets(
+            self.manifest.nodes,
+            self.manifest.sources,
+            self.manifest.exposures,
+            self.manifest.metrics,
+        )
+
+    def _build(
+        self, name: Hashable, targets, get_keys: Callable[[Any], Iterable[Hashable]]
+    ) -> Dict[Hashable, List[UniqueId]]:
+        if name not in self._indexes:
+            index: Dict[Hashable, List[UniqueId]] = {}
+            for unique_id, target in targets():
+                # dict.fromkeys drops repeated keys, like a tag listed twice
+                for key in dict.fromkeys(get_keys(target)):
+                    index.setdefault(key, []).append(UniqueId(unique_id))
+            self._indexes[name] = index
+        return self._indexes[name]
+
+    def tags(self) -> Dict[Hashable, List[UniqueId]]:
+        return self._build("tag", self._all_targets, lambda target: target.tags)
+
+    def packages(self) -> Dict[Hashable, List[UniqueId]]:
+        return self._build("package", self._all_targets, lambda target: [target.package_name])
+
+    def file_names(self) -> Dict[Hashable, List[UniqueId]]:
+        return self._build(
+            "file", self._all_targets, lambda target: [Path(target.original_file_path).name]
+        )
+
+    def paths(self) -> Dict[Hashable, List[UniqueId]]:
+        """Each node is indexed under its root path and its file path, and
+        under its root path and every directory that contains its file.
+        """
+
+        def get_keys(target):
+            root = Path(target.root_path)
+            ofp = Path(target.original_file_path)
+            return [(root, path) for path in chain([ofp], ofp.parents)]
+
+        return self._build("path", self._all_targets, get_keys)
+
+    def resource_types(self) -> Dict[Hashable, List[UniqueId]]:
+        return self._build(
+            "resource_type",
+            lambda: self._targets(self.manifest.nodes),
+            lambda target: [target.resource_type],
+        )
+
+    def fqn_names(self) -> Dict[Hashable, List[UniqueId]]:
+        return self._build(
+            "fqn_name", lambda: self._targets(self.manifest.nodes), lambda target: [target.fqn[-1]]
+        )
+
+    def fqn_prefixes(self) -> Dict[Tuple[str, ...], List[Tuple[UniqueId, int]]]:
+        """A trie of the dot-separated parts of each node's fqn, with and
+        without its package name, flattened into a mapping from each prefix to
+        the nodes under it and the number of parts in their fqn.
+        """
+        if "fqn_prefix" not in self._indexes:
+            index: Dict[Tuple[str, ...], List[Tuple[UniqueId, int]]] = {}
+            for unique_id, node in self.manifest.nodes.items():
+                seen = set()
+                for flat in (_flat_fqn(node.fqn), _flat_fqn(node.fqn[1:])):
+                    for size in range(len(flat) + 1):
+                        prefix = tuple(flat[:size])
+                        if prefix not in seen:
+                            seen.add(prefix)
+                            index.setdefault(prefix, []).append((UniqueId(unique_id), len(flat)))
+            self._indexes["fqn_prefix"] = index
+        return self._indexes["fqn_prefix"]
+
+    def config_values(
+        self, parts: List[str]
+    ) -> Tuple[Dict[Hashable, List[UniqueId]], List[Tuple[UniqueId, Any]]]:
+        """The nodes and sources by the value of the config at parts. Values
+        that can't be hashed, like lists, are kept separately to be compared
+        one by one.
+        """
+        name = ("config", tuple(parts))
+        if name not in self._indexes:
+            index: Dict[Hashable, List[UniqueId]] = {}
+            unhashable: List[Tuple[UniqueId, Any]] = []
+            for unique_id, node in self._targets(self.manifest.nodes, self.manifest.sources):
+                try:
+                    value = _getattr_descend(node.config, parts)
+                except AttributeError:
+                    continue
+                try:
+                    index.setdefault(value, []).append(UniqueId(unique_id))
+                except TypeError:
+                    unhashable.append((UniqueId(unique_id), value))
+            self._indexes[name] = (index, unhashable)
+        return self._indexes[name]
+
+
 class SelectorMethod(metaclass=abc.ABCMeta):
     def __init__(
-        self, manifest: Manifest, previous_state: Optional[PreviousState], arguments: List[str]
+        self,
+        manifest: Manifest,
+        previous_state: Optional[PreviousState],
+        arguments: List[str],
+        index: Optional[SelectorIndex] = None,
     ):
         self.manifest: Manifest = manifest
         self.previous_state = previous_state
         self.arguments: List[str] = arguments
+        # without an index, the methods that support one scan the manifest
+        self.index = index
 
     def parsed_nodes(
         self, included_nodes: Set[UniqueId]
@@ -152,6 +288,18 @@ class SelectorMethod(metaclass=abc.ABCMeta):
             self.metric_nodes(included_nodes),
         )
 
+    def indexed_nodes(
+        self, included_nodes: Set[UniqueId], *matches: Iterable[UniqueId]
+    ) -> Iterator[UniqueId]:
+        """Yield the included nodes among the matches from an index, once
+        each.
+        """
+        seen: Set[UniqueId] = set()
+        for unique_id in chain.from_iterable(matches):
+            if unique_id in included_nodes and unique_id not in seen:
+                seen.add(unique_id)
+                yield unique_id
+
     @abc.abstractmethod
     def search(
         self,
@@ -184,15 +332,40 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
+        if self.index is not None:
+            yield from self.indexed_search(included_nodes, self.index, selector)
+            return
         parsed_nodes = list(self.parsed_nodes(included_nodes))
         for node, real_node in parsed_nodes:
             if self.node_is_match(selector, real_node.fqn):
                 yield node
 
+    def indexed_search(
+        self, included_nodes: Set[UniqueId], index: SelectorIndex, selector: str
+    ) -> Iterator[UniqueId]:
+        # the same matches as node_is_match: the fqn's leaf is the selector,
+        # or the selector's parts up to the first glob are a prefix of the
+        # flattened fqn, with or without its package, and the fqn has at
+        # least as many parts as the selector
+        parts = selector.split(".")
+        if SELECTOR_GLOB in parts:
+            prefix = tuple(parts[: parts.index(SELECTOR_GLOB)])
+        else:
+            prefix = tuple(parts)
+        matches = [
+            unique_id
+            for unique_id, size in index.fqn_prefixes().get(prefix, ())
+            if size >= len(parts)
+        ]
+        yield from self.indexed_nodes(included_nodes, index.fqn_names().get(selector, ()), matches)
+
 
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
+        if self.index is not None:
+            yield from self.indexed_nodes(included_nodes, self.index.tags().get(selector, ()))
+            return
         for node, real_node in self.all_nodes(included_nodes):
             if selector in real_node.tags:
                 yield node
@@ -285,6 +458,12 @@ class PathSelectorMethod(SelectorMethod):
         # use '.' and not 'root' for easy comparison
         root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
+        if self.index is not None:
+            index = self.index.paths()
+            yield from self.indexed_nodes(
+                included_nodes, *(index.get((root, path), ()) for path in paths)
+            )
+            return
         for node, real_node in self.all_nodes(included_nodes):
             if Path(real_node.root_path) != root:
                 continue
@@ -298,6 +477,11 @@ class PathSelectorMethod(SelectorMethod):
 class FileSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that match the given file name."""
+        if self.index is not None:
+            yield from self.indexed_nodes(
+                included_nodes, self.index.file_names().get(selector, ())
+            )
+            return
         for node, real_node in self.all_nodes(included_nodes):
             if Path(real_node.original_file_path).name == selector:
                 yield node
@@ -306,6 +490,9 @@ class FileSelectorMethod(SelectorMethod):
 class PackageSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that have the specified package"""
+        if self.index is not None:
+            yield from self.indexed_nodes(included_nodes, self.index.packages().get(selector, ()))
+            return
         for node, real_node in self.all_nodes(included_nodes):
             if real_node.package_name == selector:
                 yield node
@@ -347,6 +534,20 @@ class ConfigSelectorMethod(SelectorMethod):
         if parts == ["severity"]:
             selector = CaseInsensitive(selector)
 
+        # case-insensitive and unhashable selectors are compared with every value
+        if self.index is not None and not isinstance(selector, CaseInsensitive):
+            try:
+                hash(selector)
+            except TypeError:
+                pass
+            else:
+                index, unhashable = self.index.config_values(parts)
+                yield from self.indexed_nodes(included_nodes, index.get(selector, ()))
+                for node, value in unhashable:
+                    if node in included_nodes and selector == value:
+                        yield node
+                return
+
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
         # add more someday, so search them anyway.
@@ -366,6 +567,11 @@ class ResourceTypeSelectorMethod(SelectorMethod):
             resource_type = NodeType(selector)
         except ValueError as exc:
             raise RuntimeException(f'Invalid resource_type selector "{selector}"') from exc
+        if self.index is not None:
+            yield from self.indexed_nodes(
+                included_nodes, self.index.resource_types().get(resource_type, ())
+            )
+            return
         for node, real_node in self.parsed_nodes(included_nodes):
             if real_node.resource_type == resource_type:
                 yield node
@@ -397,10 +603,18 @@ class TestTypeSelectorMethod(SelectorMethod):
                 yield node
 
 
+def _get_field(collection: Mapping[str, Any], key: str, name: str) -> Any:
+    # the collections of a manifest read from --state can look up one field of
+    # an entry without deserializing the whole entry
+    if isinstance(collection, HydratingMapping):
+        return collection.peek(key, name)
+    return getattr(collection[key], name)
+
+
 class StateSelectorMethod(SelectorMethod):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.modified_macros: Optional[List[str]] = None
+        self.affected_macros: Optional[Set[str]] = None
 
     def _macros_modified(self) -> List[str]:
         # we checked in the caller!
@@ -412,56 +626,38 @@ class StateSelectorMethod(SelectorMethod):
         modified = []
         for uid, macro in new_macros.items():
             if uid in old_macros:
-                old_macro = old_macros[uid]
-                if macro.macro_sql != old_macro.macro_sql:
+                if macro.macro_sql != _get_field(old_macros, uid, "macro_sql"):
                     modified.append(uid)
             else:
                 modified.append(uid)
 
-        for uid, macro in old_macros.items():
+        for uid in old_macros:
             if uid not in new_macros:
                 modified.append(uid)
 
         return modified
 
-    def recursively_check_macros_modified(self, node, visited_macros):
-        for macro_uid in node.depends_on.macros:
-            if macro_uid in visited_macros:
-                continue
-            visited_macros.append(macro_uid)
-
-            if macro_uid in self.modified_macros:
-                return True
-
-            # this macro hasn't been modified, but depends on other
-            # macros which each need to be tested for modification
-            macro_node = self.manifest.macros[macro_uid]
-            if len(macro_node.depends_on.macros) > 0:
-                upstream_macros_changed = self.recursively_check_macros_modified(
-                    macro_node, visited_macros
-                )
-                if upstream_macros_changed:
-                    return True
-                continue
-
-            # this macro hasn't been modified, but we haven't checked
-            # the other macros the node depends on, so keep looking
-            if len(node.depends_on.macros) > len(visited_macros):
-                continue
-
-        return False
+    def _macros_affected(self) -> Set[str]:
+        # the modified macros, and every macro that calls one of them directly
+        # or through other macros
+        affected = set(self._macros_modified())
+        child_map = self.manifest.build_macro_child_map()
+        pending = list(affected)
+        while pending:
+            for child in child_map.get(pending.pop(), []):
+                if child not in affected and child in self.manifest.macros:
+                    affected.add(child)
+                    pending.append(child)
+        return affected
 
     def check_macros_modified(self, node):
-        # check if there are any changes in macros the first time
-        if self.modified_macros is None:
-            self.modified_macros = self._macros_modified()
+        # find the macros affected by a change the first time
+        if self.affected_macros is None:
+            self.affected_macros = self._macros_affected()
         # no macros have been modified, skip looping entirely
-        if not self.modified_macros:
+        if not self.affected_macros:
             return False
-        # recursively loop through upstream macros to see if any is modified
-        else:
-            visited_macros = []
-            return self.recursively_check_macros_modified(node, visited_macros)
+        return any(uid in self.affected_macros for uid in node.depends_on.macros)
 
     # TODO check modifed_content and check_modified macro seems a bit redundent
     def check_modified_content(self, old: Optional[SelectorTarget], new: SelectorTarget) -> bool:
@@ -624,6 +820,7 @@ class MethodManager:
     ):
         self.manifest = manifest
         self.previous_state = previous_state
+        self.index = SelectorIndex(manifest)
 
     def get_method(self, method: MethodName, method_arguments: List[str]) -> SelectorMethod:
 
@@ -633,4 +830,4 @@ class MethodManager:
                 f"method name, but it is not handled"
             )
         cls: Type[SelectorMethod] = self.SELECTOR_METHODS[method]
-        return cls(self.manifest, self.previous_state, method_arguments)
+        return cls(self.manifest, self.previous_state, method_arguments, self.index)
@@ -24,3 +24,27 @@
   {% endcall %}
   {{ return(load_result('collect_freshness').table) }}
 {% endmacro %}
+
+
+{% macro collect_freshness_batch(sources) %}
+  {{ return(adapter.dispatch('collect_freshness_batch', 'dbt')(sources)) }}
+{% endmacro %}
+
+{% macro default__collect_freshness_batch(sources) %}
+  {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+    {% for batched in sources %}
+    select
+      {{ loop.index0 }} as source_index,
+      max({{ batched.loaded_at_field }}) as max_loaded_at,
+      {{ current_timestamp() }} as snapshotted_at
+    from {{ batched.relation }}
+    {% if batched.filter %}
+    where {{ batched.filter }}
+    {% endif %}
+    {% if not loop.last %}
+    union all
+    {% endif %}
+    {% endfor %}
+  {% endcall %}
+  {{ return(load_result('collect_freshness_batch').table) }}
+{% endmacro %}
@@ -126,3 +126,23 @@
   {# Return SQL so we can render it out into the compiled files #}
   {{ return(statements[0]) }}
 {% endmacro %}
+
+
+{% macro use_csv_bulk_load() -%}
+  {{ return(adapter.dispatch('use_csv_bulk_load', 'dbt')()) }}
+{%- endmacro %}
+
+{% macro default__use_csv_bulk_load() %}
+  {{ return(false) }}
+{% endmacro %}
+
+
+{% macro load_csv_bulk(model, agate_table) -%}
+  {{ return(adapter.dispatch('load_csv_bulk', 'dbt')(model, agate_table)) }}
+{%- endmacro %}
+
+{% macro default__load_csv_bulk(model, agate_table) %}
+  {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+  {% set seed_path = model.root_path ~ '/' ~ model.original_file_path %}
+  {{ return(adapter.load_csv_bulk(this, agate_table, seed_path, cols_sql, get_binding_char(), get_batch_size())) }}
+{% endmacro %}
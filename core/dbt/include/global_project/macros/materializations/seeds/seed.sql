@@ -8,7 +8,13 @@
   {%- set exists_as_table = (old_relation is not none and old_relation.is_table) -%}
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
-  {%- set agate_table = load_agate_table() -%}
+  {%- set bulk_load = use_csv_bulk_load() -%}
+  {%- if bulk_load -%}
+    {#-- only read the first batch of rows into the table, load_csv_bulk reads the rest --#}
+    {%- set agate_table = load_agate_table(sample_size=get_batch_size()) -%}
+  {%- else -%}
+    {%- set agate_table = load_agate_table() -%}
+  {%- endif -%}
   {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
 
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
@@ -27,8 +33,12 @@
   {% endif %}
 
   {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
-  {% set sql = load_csv_rows(model, agate_table) %}
+  {% if bulk_load %}
+    {% set sql, rows_affected = load_csv_bulk(model, agate_table) %}
+  {% else %}
+    {% set rows_affected = (agate_table.rows | length) %}
+    {% set sql = load_csv_rows(model, agate_table) %}
+  {% endif %}
 
   {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
     {{ get_csv_sql(create_table_sql, sql) }};
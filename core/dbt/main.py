@@ -224,7 +224,9 @@ def run_from_args(parsed):
     log_manager.set_path(log_path)
     # if 'list' task: set stdout to WARN instead of INFO
     level_override = parsed.cls.pre_init_hook(parsed)
-    setup_event_logger(log_path or "logs", level_override)
+    setup_event_logger(
+        log_path or "logs", level_override, getattr(task.config, "target_path", None)
+    )
 
     fire_event(MainReportVersion(v=str(dbt.version.installed)))
     fire_event(MainReportArgs(args=args_to_dict(parsed)))
@@ -561,6 +563,17 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
         Do not run "dbt compile" as part of docs generation
         """,
     )
+    generate_sub.add_argument(
+        "--incremental",
+        action="store_true",
+        help="""
+        Reuse the catalog.json in --state for the relations in schemas that
+        haven't changed since it was generated, and only query the schemas of
+        new and modified nodes and of nodes in run_results.json that ran since
+        then. The manifest.json in --state should be the one the previous
+        catalog was generated with.
+        """,
+    )
     return generate_sub
 
 
@@ -968,6 +981,16 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        help="""
+        If set to more than 1, a full parse shards model, snapshot, singular
+        test and schema files across this many worker processes. Requires a
+        platform that supports fork(); otherwise files are parsed serially.
+        """,
+    )
+
     p.add_argument(
         "--warn-error",
         action="store_true",
@@ -1002,6 +1025,18 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_optional_argument_inverse(
+        "--partial-parse-file-stat",
+        enable_help="""
+        During partial parsing, skip reading and hashing project files whose
+        modification time, size and inode have not changed.
+        """,
+        disable_help="""
+        Read and hash every project file during partial parsing. Use this on
+        filesystems with unreliable modification times.
+        """,
+    )
+
     # if set, run dbt in single-threaded mode: thread count is ignored, and
     # calls go through `map` instead of the thread pool. This is useful for
     # getting performance information about aspects of dbt that normally run in
@@ -1077,6 +1112,38 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_argument(
+        "--event-buffer-bytes",
+        dest="event_buffer_bytes",
+        help="""
+        Sets the max size in bytes of the serialized events buffered in
+        EVENT_HISTORY
+        """,
+    )
+
+    event_history_flag = p.add_mutually_exclusive_group()
+    event_history_flag.add_argument(
+        "--write-event-history",
+        action="store_const",
+        const=True,
+        default=None,
+        dest="write_event_history",
+        help="""
+        Write every event fired during the invocation to
+        event_history.jsonl in the target path, including the ones dropped
+        from EVENT_HISTORY.
+        """,
+    )
+    event_history_flag.add_argument(
+        "--no-write-event-history",
+        action="store_const",
+        const=False,
+        dest="write_event_history",
+        help="""
+        Only keep events in the EVENT_HISTORY buffer.
+        """,
+    )
+
     p.add_argument(
         "-q",
         "--quiet",
@@ -1118,6 +1185,116 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    lazy_cache_flag = p.add_mutually_exclusive_group()
+    lazy_cache_flag.add_argument(
+        "--lazy-relation-cache",
+        action="store_const",
+        const=True,
+        default=None,
+        dest="lazy_relation_cache",
+        help="""
+        Cache the relations in a schema the first time they are looked up,
+        instead of caching every schema before the run starts.
+        """,
+    )
+    lazy_cache_flag.add_argument(
+        "--no-lazy-relation-cache",
+        action="store_const",
+        const=False,
+        dest="lazy_relation_cache",
+        help="""
+        Cache the relations in every schema before the run starts.
+        """,
+    )
+
+    reuse_connections_flag = p.add_mutually_exclusive_group()
+    reuse_connections_flag.add_argument(
+        "--reuse-connections",
+        action="store_const",
+        const=True,
+        default=None,
+        dest="reuse_connections",
+        help="""
+        If the adapter supports it, hand the database connection of a node
+        that has finished on to the next node instead of opening a new one.
+        """,
+    )
+    reuse_connections_flag.add_argument(
+        "--no-reuse-connections",
+        action="store_const",
+        const=False,
+        dest="reuse_connections",
+        help="""
+        Open a new database connection for every node.
+        """,
+    )
+
+    batch_freshness_flag = p.add_mutually_exclusive_group()
+    batch_freshness_flag.add_argument(
+        "--batch-source-freshness",
+        action="store_const",
+        const=True,
+        default=None,
+        dest="batch_source_freshness",
+        help="""
+        When checking source freshness, check the sources in the same schema
+        with the same loaded_at_field in one query.
+        """,
+    )
+    batch_freshness_flag.add_argument(
+        "--no-batch-source-freshness",
+        action="store_const",
+        const=False,
+        dest="batch_source_freshness",
+        help="""
+        When checking source freshness, check each source in its own query.
+        """,
+    )
+
+    critical_path_flag = p.add_mutually_exclusive_group()
+    critical_path_flag.add_argument(
+        "--prioritize-critical-path",
+        action="store_const",
+        const=True,
+        default=None,
+        dest="prioritize_critical_path",
+        help="""
+        Schedule nodes by the longest remaining path of historical execution
+        times, read from the run_results.json in --state or the target path.
+        """,
+    )
+    critical_path_flag.add_argument(
+        "--no-prioritize-critical-path",
+        action="store_const",
+        const=False,
+        dest="prioritize_critical_path",
+        help="""
+        Schedule nodes by their depth in the graph.
+        """,
+    )
+
+    async_logging_flag = p.add_mutually_exclusive_group()
+    async_logging_flag.add_argument(
+        "--async-logging",
+        action="store_const",
+        const=True,
+        default=None,
+        dest="async_logging",
+        help="""
+        Format and write the file log on a background thread, in batches,
+        instead of on the thread that fired each event.
+        """,
+    )
+    async_logging_flag.add_argument(
+        "--no-async-logging",
+        action="store_const",
+        const=False,
+        dest="async_logging",
+        help="""
+        Write each line of the file log as its event is fired.
+        """,
+    )
+
     subs = p.add_subparsers(title="Available sub-commands")
 
     base_subparser = _build_base_subparser()
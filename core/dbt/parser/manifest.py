@@ -3,7 +3,7 @@ from dataclasses import field
 from datetime import datetime
 import os
 import traceback
-from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple
+from typing import Dict, Optional, Mapping, Callable, Any, List, Set, Type, Union, Tuple
 from itertools import chain
 import time
 
@@ -50,7 +50,7 @@ from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.configured import generate_macro_context
 from dbt.context.providers import ParseProvider
 from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
-from dbt.parser.read_files import read_files, load_source_file
+from dbt.parser.read_files import read_files, load_source_file, load_deferred_contents
 from dbt.parser.partial import PartialParsing, special_override_macros
 from dbt.contracts.graph.compiled import ManifestNode
 from dbt.contracts.graph.manifest import (
@@ -84,6 +84,8 @@ from dbt.parser.docs import DocumentationParser
 from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
+from dbt.parser.parallel import parse_files_in_processes
+from dbt.parser.partial_parse_file import PartialParseStore, build_flat_graph
 from dbt.parser.schemas import SchemaParser
 from dbt.parser.search import FileBlock
 from dbt.parser.seeds import SeedParser
@@ -96,6 +98,8 @@ from dbt.dataclass_schema import StrEnum, dbtClassMixin
 
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
 PARSING_STATE = DbtProcessState("parsing")
+# The parsers whose files can be parsed in worker processes, see --parse-workers
+PARSE_WORKER_PARSER_TYPES = (ModelParser, SnapshotParser, SingularTestParser, SchemaParser)
 
 
 class ReparseReason(StrEnum):
@@ -217,8 +221,10 @@ class ManifestLoader:
 
             manifest = loader.load()
 
-            _check_manifest(manifest, config)
-            manifest.build_flat_graph()
+            # load() checked the manifest for duplicate resources before
+            # saving it, so a saved manifest is only deserialized as needed
+            build_flat_graph(manifest)
+            _warn_for_unused_resource_config_paths(manifest, config)
 
             # This needs to happen after loading from a partial parse,
             # so that the adapter has the query headers from the macro_hook.
@@ -314,6 +320,7 @@ class ManifestLoader:
             # the other files are loaded.  Also need to parse tests, specifically
             # generic tests
             start_load_macros = time.perf_counter()
+            self.load_skipped_file_contents(project_parser_files)
             self.load_and_parse_macros(project_parser_files)
 
             # If we're partially parsing check that certain macros have not been changed
@@ -324,6 +331,7 @@ class ManifestLoader:
                 self.manifest = self.new_manifest  # contains newly read files
                 project_parser_files = orig_project_parser_files
                 self.partially_parsing = False
+                self.load_skipped_file_contents(project_parser_files)
                 self.load_and_parse_macros(project_parser_files)
 
             self._perf_info.load_macros_elapsed = time.perf_counter() - start_load_macros
@@ -399,11 +407,26 @@ class ManifestLoader:
                 self.manifest._parsing_info.static_analysis_path_count
             )
 
+            # Check the manifest before it's written, so that the check doesn't
+            # need to deserialize every node when it's reused as is
+            _check_resource_uniqueness(self.manifest, self.root_project)
+
             # write out the fully parsed manifest
             self.write_manifest_for_partial_parse()
 
         return self.manifest
 
+    def load_skipped_file_contents(self, project_parser_files):
+        """Files that have not changed since the last parse are not read by
+        read_files. Read the contents of any of them that are about to be
+        parsed."""
+        load_deferred_contents(
+            self.manifest.files[file_id]
+            for parser_files in project_parser_files.values()
+            for file_ids in parser_files.values()
+            for file_id in file_ids
+        )
+
     def load_and_parse_macros(self, project_parser_files):
         for project in self.all_projects.values():
             if project.project_name not in project_parser_files:
@@ -456,20 +479,26 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
-                block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
+            file_ids = parser_files[parser_name]
+            if self.use_parse_workers(parser_cls, file_ids) and parse_files_in_processes(
+                parser, file_ids, flags.PARSE_WORKERS
+            ):
+                project_parsed_path_count = len(file_ids)
+            else:
+                for file_id in file_ids:
+                    block = FileBlock(self.manifest.files[file_id])
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        if self.partially_parsing:
+                            dct = block.file.pp_dict
+                        else:
+                            dct = block.file.dict_from_yaml
+                        parser.parse_file(block, dct=dct)
+                        # Came out of here with UnpatchedSourceDefinition containing configs at the source level
+                        # and not configs at the table level (as expected)
                     else:
-                        dct = block.file.dict_from_yaml
-                    parser.parse_file(block, dct=dct)
-                    # Came out of here with UnpatchedSourceDefinition containing configs at the source level
-                    # and not configs at the table level (as expected)
-                else:
-                    parser.parse_file(block)
-                project_parsed_path_count += 1
+                        parser.parse_file(block)
+                    project_parsed_path_count += 1
 
             # Save timing info
             project_loader_info.parsers.append(
@@ -504,6 +533,16 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    def use_parse_workers(self, parser_cls: Type[Parser], file_ids: List[str]) -> bool:
+        # Only a full parse is sharded. Files in a partial parse are few, and
+        # their parsing depends on what's been removed from the saved manifest.
+        return (
+            not self.partially_parsing
+            and flags.PARSE_WORKERS > 1
+            and parser_cls in PARSE_WORKER_PARSER_TYPES
+            and len(file_ids) > 1
+        )
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -546,10 +585,8 @@ class ManifestLoader:
                     ManifestWrongMetadataVersion(version=self.manifest.metadata.dbt_version)
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack()
             make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            PartialParseStore(path).write(self.manifest)
         except Exception:
             raise
 
@@ -640,14 +677,17 @@ class ManifestLoader:
 
         if os.path.exists(path):
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp)  # type: ignore
+                store = PartialParseStore(path)
+                # Only the header is needed to check whether the saved
+                # manifest can be used. Nodes, macros, etc. are deserialized
+                # when they're first accessed.
+                manifest = store.read_header()
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
                 is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
                 if is_partial_parsable:
+                    store.read_manifest(manifest)
                     # We don't want to have stale generated_at dates
                     manifest.metadata.generated_at = datetime.utcnow()
                     # or invocation_ids
@@ -966,18 +1006,19 @@ def _check_resource_uniqueness(
 
 
 def _warn_for_unused_resource_config_paths(manifest: Manifest, config: RuntimeConfig) -> None:
-    resource_fqns: Mapping[str, PathSet] = manifest.get_resource_fqns()
+    # Like manifest.get_resource_fqns(), but read from the flat graph so that
+    # the nodes of a saved manifest don't need to be deserialized
+    resource_fqns: Dict[str, Set[Tuple[str, ...]]] = {}
+    for resources in manifest.flat_graph.values():
+        for resource in resources.values():
+            resource_type_plural = NodeType(resource["resource_type"]).pluralize()
+            resource_fqns.setdefault(resource_type_plural, set()).add(tuple(resource["fqn"]))
     disabled_fqns: PathSet = frozenset(
         tuple(n.fqn) for n in list(chain.from_iterable(manifest.disabled.values()))
     )
     config.warn_for_unused_resource_config_paths(resource_fqns, disabled_fqns)
 
 
-def _check_manifest(manifest: Manifest, config: RuntimeConfig) -> None:
-    _check_resource_uniqueness(manifest, config)
-    _warn_for_unused_resource_config_paths(manifest, config)
-
-
 def _get_node_column(node, column_name):
     """Given a ParsedNode, add some fields that might be missing. Return a
     reference to the dict that refers to the given column, creating it if
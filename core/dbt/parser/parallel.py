@@ -0,0 +1,207 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from dbt.contracts.files import AnySourceFile, SchemaSourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.functions import fire_event
+from dbt.events.types import ParseWorkersFallback
+from dbt.parser.base import Parser
+from dbt.parser.schemas import SchemaParser
+from dbt.parser.search import FileBlock
+
+# Manifest dictionaries that parsers only ever add entries to. New entries
+# are found by position, since dictionaries preserve insertion order.
+ADDED_COLLECTIONS = ("nodes", "sources", "source_patches", "exposures", "metrics", "env_vars")
+
+# Files are split into more shards than workers so that a few slow files
+# don't leave the other workers idle.
+SHARDS_PER_WORKER = 4
+
+# The parser of the current worker process, inherited from the parent when
+# the worker is forked.
+_worker_parser: Optional[Parser] = None
+
+
+@dataclass
+class ManifestMark:
+    """The size of a manifest's collections before a shard is parsed."""
+
+    sizes: Dict[str, int]
+    # disabled sources have a Path as their patch_path, other nodes a str
+    disabled_patch_paths: Dict[str, List[Optional[Union[str, Path]]]]
+    static_analysis_path_count: int
+    static_analysis_parsed_path_count: int
+
+    @classmethod
+    def of(cls, manifest: Manifest) -> "ManifestMark":
+        return cls(
+            sizes={name: len(getattr(manifest, name)) for name in ADDED_COLLECTIONS},
+            disabled_patch_paths={
+                unique_id: [node.patch_path for node in nodes]
+                for unique_id, nodes in manifest.disabled.items()
+            },
+            static_analysis_path_count=manifest._parsing_info.static_analysis_path_count,
+            static_analysis_parsed_path_count=(
+                manifest._parsing_info.static_analysis_parsed_path_count
+            ),
+        )
+
+
+@dataclass
+class ParsedShard:
+    """Everything parsing a shard of files changed in a worker's manifest,
+    in the order the changes were made."""
+
+    files: List[AnySourceFile]
+    added: Dict[str, List[Tuple[str, Any]]]
+    patched_nodes: List[Any] = field(default_factory=list)
+    patched_macros: List[Any] = field(default_factory=list)
+    disabled: List[Tuple[str, List[Any]]] = field(default_factory=list)
+    disabled_patch_paths: List[Tuple[str, int, Optional[Union[str, Path]]]] = field(
+        default_factory=list
+    )
+    static_analysis_path_count: int = 0
+    static_analysis_parsed_path_count: int = 0
+
+    @classmethod
+    def collect(cls, manifest: Manifest, file_ids: List[str], mark: ManifestMark) -> "ParsedShard":
+        files = [manifest.files[file_id] for file_id in file_ids]
+        shard = cls(
+            files=files,
+            added={
+                name: list(islice(getattr(manifest, name).items(), mark.sizes[name], None))
+                for name in ADDED_COLLECTIONS
+            },
+        )
+        for source_file in files:
+            if isinstance(source_file, SchemaSourceFile):
+                shard.patched_nodes.extend(
+                    manifest.nodes[unique_id] for unique_id in source_file.node_patches
+                )
+                shard.patched_macros.extend(
+                    manifest.macros[unique_id] for unique_id in source_file.macro_patches.values()
+                )
+        for unique_id, nodes in manifest.disabled.items():
+            old_patch_paths = mark.disabled_patch_paths.get(unique_id, [])
+            for index, patch_path in enumerate(old_patch_paths):
+                if nodes[index].patch_path != patch_path:
+                    shard.disabled_patch_paths.append((unique_id, index, nodes[index].patch_path))
+            if len(nodes) > len(old_patch_paths):
+                shard.disabled.append((unique_id, nodes[len(old_patch_paths) :]))
+        parsing_info = manifest._parsing_info
+        shard.static_analysis_path_count = (
+            parsing_info.static_analysis_path_count - mark.static_analysis_path_count
+        )
+        shard.static_analysis_parsed_path_count = (
+            parsing_info.static_analysis_parsed_path_count - mark.static_analysis_parsed_path_count
+        )
+        return shard
+
+    def merge_into(self, manifest: Manifest) -> None:
+        for source_file in self.files:
+            manifest.files[source_file.file_id] = source_file
+        for name, items in self.added.items():
+            getattr(manifest, name).update(items)
+        for node in self.patched_nodes:
+            manifest.nodes[node.unique_id] = node
+        for macro in self.patched_macros:
+            manifest.macros[macro.unique_id] = macro
+        for _, nodes in self.disabled:
+            for node in nodes:
+                manifest.add_disabled_nofile(node)
+        for unique_id, index, patch_path in self.disabled_patch_paths:
+            manifest.disabled[unique_id][index].patch_path = patch_path
+        manifest._parsing_info.static_analysis_path_count += self.static_analysis_path_count
+        manifest._parsing_info.static_analysis_parsed_path_count += (
+            self.static_analysis_parsed_path_count
+        )
+
+
+def _find_conflict(manifest: Manifest, shards: List[ParsedShard]) -> Optional[str]:
+    """Return a description of the first change that two shards (or a shard
+    and the manifest) both make, if there is one. Parsing the files serially
+    would raise an error for it, so the shards can't be merged."""
+    seen: Dict[str, set] = {name: set() for name in ADDED_COLLECTIONS}
+    patched_nodes: set = set()
+    patched_macros: set = set()
+    for shard in shards:
+        for name, items in shard.added.items():
+            if name == "env_vars":
+                continue
+            collection = getattr(manifest, name)
+            for key, _ in items:
+                if key in collection or key in seen[name]:
+                    return f"duplicate {name} entry {key}"
+                seen[name].add(key)
+        for node in shard.patched_nodes:
+            if manifest.nodes[node.unique_id].patch_path or node.unique_id in patched_nodes:
+                return f"duplicate patch for {node.unique_id}"
+            patched_nodes.add(node.unique_id)
+        for macro in shard.patched_macros:
+            if manifest.macros[macro.unique_id].patch_path or macro.unique_id in patched_macros:
+                return f"duplicate patch for {macro.unique_id}"
+            patched_macros.add(macro.unique_id)
+    return None
+
+
+def _init_worker(parser: Parser) -> None:
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_shard(file_ids: List[str]) -> ParsedShard:
+    parser = _worker_parser
+    assert parser is not None
+    manifest = parser.manifest
+    mark = ManifestMark.of(manifest)
+    for file_id in file_ids:
+        block = FileBlock(manifest.files[file_id])
+        if isinstance(parser, SchemaParser):
+            assert isinstance(block.file, SchemaSourceFile)
+            parser.parse_file(block, dct=block.file.dict_from_yaml)
+        else:
+            parser.parse_file(block)
+    return ParsedShard.collect(manifest, file_ids, mark)
+
+
+def parse_files_in_processes(parser: Parser, file_ids: List[str], max_workers: int) -> bool:
+    """Parse the files on a pool of forked worker processes and merge the
+    results into the parser's manifest in file order, so the manifest ends up
+    exactly as if the files had been parsed serially.
+
+    Returns False, without changing the manifest, if the files could not be
+    parsed this way. The caller should then parse them serially, which also
+    raises any parsing error with the same message as usual.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return False
+    num_shards = min(len(file_ids), max_workers * SHARDS_PER_WORKER)
+    shard_size = -(-len(file_ids) // num_shards)
+    shards = [file_ids[i : i + shard_size] for i in range(0, len(file_ids), shard_size)]
+    parser_name = type(parser).__name__
+    try:
+        # Workers are forked so that they inherit the manifest, the macros
+        # and the adapter as they are now, rather than rebuilding them.
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(shards)),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(parser,),
+        ) as executor:
+            results = list(executor.map(_parse_shard, shards))
+    except Exception as exc:
+        fire_event(ParseWorkersFallback(parser=parser_name, reason=str(exc)))
+        return False
+
+    conflict = _find_conflict(parser.manifest, results)
+    if conflict is not None:
+        fire_event(ParseWorkersFallback(parser=parser_name, reason=conflict))
+        return False
+
+    for shard in results:
+        shard.merge_into(parser.manifest)
+    return True
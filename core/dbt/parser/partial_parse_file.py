@@ -0,0 +1,407 @@
+import mmap
+import os
+import struct
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import msgpack
+from mashumaro.serializer.msgpack import DEFAULT_DICT_PARAMS
+
+from dbt.contracts.files import AnySourceFile
+from dbt.contracts.graph.manifest import (
+    MANIFEST_ENTRY_TYPES,
+    Manifest,
+    ManifestMetadata,
+    ManifestStateCheck,
+)
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.exceptions import InternalException
+
+# The partial parse state is kept in two files: an index (partial_parse.msgpack)
+# and a data segment next to it. The data segment holds one msgpack record per
+# source file, node, macro, etc., and is only ever appended to. The index
+# starts with MAGIC, the format version and the length of the header. The
+# header holds the manifest metadata and state check, which is all that's
+# needed to decide whether the saved manifest can be used, and the name and
+# committed size of the data segment. It's followed by the position of every
+# record in the data segment, in manifest order.
+#
+# When the manifest is written after a partial parse, only the records that
+# changed are appended to the data segment, and the new index is committed by
+# atomically replacing the old one. Once more than half of the data segment
+# is unreferenced, the live records are copied to a new segment instead.
+MAGIC = b"dbt-partial-parse"
+FORMAT_VERSION = 3
+_PREFIX = struct.Struct(">HI")
+
+T = TypeVar("T")
+Location = Tuple[int, int]
+
+
+# Like the entries in MANIFEST_ENTRY_TYPES, this wraps a source file so that
+# it's serialized and deserialized exactly as it would be in the Manifest.
+@dataclass
+class _FileEntry(dbtClassMixin):
+    value: AnySourceFile
+
+
+STORED_COLLECTIONS: Dict[str, Type[dbtClassMixin]] = {"files": _FileEntry, **MANIFEST_ENTRY_TYPES}
+
+# Partial parsing modifies saved source files and disabled node lists in
+# place. Everything else is replaced rather than modified once it has been
+# parsed (the process_* steps of the ManifestLoader skip entries created
+# before the current parse), so an entry that's still the object read from
+# the data segment doesn't need to be written again.
+MODIFIED_IN_PLACE = ("files", "disabled")
+
+FLAT_GRAPH_COLLECTIONS = ("exposures", "metrics", "nodes", "sources")
+
+
+class Segment:
+    """A data segment file, mapped into memory for reading."""
+
+    def __init__(self, directory: str, name: str, size: int):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        with open(self.path, "rb") as fp:
+            if size:
+                self._buffer: Any = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = b""
+        if len(self._buffer) < size:
+            raise InternalException(f"Partial parse data segment {self.path} is truncated")
+
+    def read(self, location: Location) -> bytes:
+        offset, length = location
+        return self._buffer[offset : offset + length]
+
+
+_PACKED = object()
+
+
+class LazyMapping(MutableMapping[str, T]):
+    """A dictionary of records in a data segment, which are deserialized the
+    first time they are accessed. Iterating over values() or items()
+    deserializes everything.
+
+    It also remembers which keys still hold the value that was read from the
+    data segment, so they don't need to be written again.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[bytes], T],
+        segment: Segment,
+        locations: Dict[str, Location],
+    ):
+        self._decode = decode
+        self.segment = segment
+        self.locations: Dict[str, Location] = dict(locations)
+        self._data: Dict[str, Any] = dict.fromkeys(locations, _PACKED)
+        self._num_packed = len(self._data)
+        self._lock = threading.Lock()
+
+    def is_packed(self, key: str) -> bool:
+        return self._data[key] is _PACKED
+
+    def unpack(self, key: str) -> Any:
+        """Return the record of a packed key as the plain dictionary it was
+        serialized from."""
+        return msgpack.unpackb(self.segment.read(self.locations[key]), raw=False)
+
+    def _hydrate(self, key: str) -> T:
+        with self._lock:
+            value = self._data[key]
+            if value is _PACKED:
+                value = self._decode(self.segment.read(self.locations[key]))
+                self._data[key] = value
+                self._num_packed -= 1
+        return value
+
+    def _hydrate_all(self) -> None:
+        if self._num_packed:
+            for key, value in list(self._data.items()):
+                if value is _PACKED:
+                    self._hydrate(key)
+
+    def __getitem__(self, key: str) -> T:
+        value = self._data[key]
+        if value is _PACKED:
+            value = self._hydrate(key)
+        return value
+
+    def __setitem__(self, key: str, value: T) -> None:
+        with self._lock:
+            if self._data.get(key) is _PACKED:
+                self._num_packed -= 1
+            self.locations.pop(key, None)
+            self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if self._data[key] is _PACKED:
+                self._num_packed -= 1
+            self.locations.pop(key, None)
+            del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def values(self):  # type: ignore
+        self._hydrate_all()
+        return self._data.values()
+
+    def items(self):  # type: ignore
+        self._hydrate_all()
+        return self._data.items()
+
+    def copy(self) -> Dict[str, T]:
+        return dict(self.items())
+
+    # copy.deepcopy() and pickle get a plain, fully deserialized dict
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} entries, {self._num_packed} packed)"
+
+
+def _pack(entry_cls, value) -> bytes:
+    dct = entry_cls(value=value).to_dict(**DEFAULT_DICT_PARAMS)["value"]
+    return msgpack.packb(dct, use_bin_type=True)
+
+
+def _unpacker(entry_cls) -> Callable[[bytes], Any]:
+    def unpack(data: bytes) -> Any:
+        dct = msgpack.unpackb(data, raw=False)
+        return entry_cls.from_dict({"value": dct}, **DEFAULT_DICT_PARAMS).value
+
+    return unpack
+
+
+def build_flat_graph(manifest: Manifest) -> None:
+    """Build the manifest's flat graph like Manifest.build_flat_graph. A
+    record that is still packed already holds the dictionary the flat graph
+    needs, so it's unpacked without being deserialized.
+    """
+    flat_graph: Dict[str, Dict[str, Any]] = {}
+    for name in FLAT_GRAPH_COLLECTIONS:
+        collection = getattr(manifest, name)
+        stored = isinstance(collection, LazyMapping)
+        entries: Dict[str, Any] = {}
+        for key in collection:
+            if stored and collection.is_packed(key):
+                entries[key] = collection.unpack(key)
+            else:
+                entries[key] = collection[key].to_dict(omit_none=False)
+        flat_graph[name] = entries
+    manifest.flat_graph = flat_graph
+
+
+def _fsync_directory(directory: str) -> None:
+    # Make a rename durable. Not all platforms can open a directory.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class PartialParseStore:
+    """Reads and writes the partial parse index at `path` and its data
+    segment."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.directory = os.path.dirname(path)
+
+    def _read_header(self, fp: BinaryIO) -> Dict[str, Any]:
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise InternalException(f"{self.path} is not a partial parse file")
+        version, header_length = _PREFIX.unpack(fp.read(_PREFIX.size))
+        if version != FORMAT_VERSION:
+            raise InternalException(
+                f"Unsupported partial parse file version {version}, expected {FORMAT_VERSION}"
+            )
+        return msgpack.unpackb(fp.read(header_length), raw=False)
+
+    def read_header(self) -> Manifest:
+        """Return a Manifest with only the metadata and state check of the
+        saved manifest."""
+        with open(self.path, "rb") as fp:
+            header = self._read_header(fp)
+        return Manifest(
+            metadata=ManifestMetadata.from_dict(header["metadata"], **DEFAULT_DICT_PARAMS),
+            state_check=ManifestStateCheck.from_dict(header["state_check"], **DEFAULT_DICT_PARAMS),
+        )
+
+    def read_manifest(self, manifest: Optional[Manifest] = None) -> Manifest:
+        """Read the rest of the saved manifest into the manifest returned by
+        read_header. Records are deserialized when they're first accessed.
+        """
+        if manifest is None:
+            manifest = self.read_header()
+        with open(self.path, "rb") as fp:
+            header = self._read_header(fp)
+            index = msgpack.unpackb(fp.read(), raw=False)
+        segment = Segment(self.directory, header["segment"], header["segment_size"])
+        manifest.selectors = index["selectors"]
+        manifest.env_vars = index["env_vars"]
+        for name, entry_cls in STORED_COLLECTIONS.items():
+            # msgpack reads the locations back as lists
+            locations: Dict[str, Location] = {
+                key: (offset, length) for key, (offset, length) in index[name].items()
+            }
+            setattr(manifest, name, LazyMapping(_unpacker(entry_cls), segment, locations))
+        return manifest
+
+    def _committed_segment(self) -> Tuple[Optional[str], int]:
+        try:
+            with open(self.path, "rb") as fp:
+                header = self._read_header(fp)
+            return header["segment"], header["segment_size"]
+        except Exception:
+            return None, 0
+
+    def write(self, manifest: Manifest) -> None:
+        """Write the manifest, appending only changed records to the data
+        segment it was read from if that's still the committed one."""
+        # Like Manifest.__pre_serialize__: source_patches can't be serialized
+        # because of their tuple keys.
+        manifest.source_patches = {}
+        committed_name, committed_size = self._committed_segment()
+
+        # Work out which records can be reused from the committed segment,
+        # and serialize the rest
+        reused: Dict[str, Dict[str, Location]] = {}
+        reused_size = 0
+        new_records: List[Tuple[str, str, bytes]] = []
+        segment: Optional[Segment] = None
+        for name, entry_cls in STORED_COLLECTIONS.items():
+            collection = getattr(manifest, name)
+            reused[name] = {}
+            stored = isinstance(collection, LazyMapping)
+            if stored:
+                if segment is None:
+                    segment = collection.segment
+                stored = collection.segment is segment
+            for key in collection:
+                location = collection.locations.get(key) if stored else None
+                if location is not None and name in MODIFIED_IN_PLACE:
+                    if not collection.is_packed(key):
+                        record = _pack(entry_cls, collection[key])
+                        if record != segment.read(location):  # type: ignore
+                            location = None
+                if location is None:
+                    new_records.append((name, key, _pack(entry_cls, collection[key])))
+                else:
+                    reused[name][key] = location
+                    reused_size += location[1]
+
+        new_size = sum(len(record) for _, _, record in new_records)
+        append = (
+            segment is not None
+            and segment.name == committed_name
+            and committed_size - reused_size <= reused_size + new_size
+        )
+        if append:
+            assert segment is not None
+            segment_name, base = segment.name, committed_size
+            mode = "r+b"
+        else:
+            # Start a new segment, copying over the records that are still used
+            segment_name, base = f"partial_parse.{uuid.uuid4().hex}.data", 0
+            mode = "wb"
+
+        locations: Dict[str, Dict[str, Location]] = {name: {} for name in STORED_COLLECTIONS}
+        with open(os.path.join(self.directory, segment_name), mode) as fp:
+            fp.truncate(base)
+            fp.seek(base)
+            offset = base
+            if not append:
+                for name, collection_locations in reused.items():
+                    for key, location in collection_locations.items():
+                        record = segment.read(location)  # type: ignore
+                        fp.write(record)
+                        reused[name][key] = (offset, len(record))
+                        offset += len(record)
+            new_locations: Dict[Tuple[str, str], Location] = {}
+            for name, key, record in new_records:
+                fp.write(record)
+                new_locations[(name, key)] = (offset, len(record))
+                offset += len(record)
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        # Keep the records in manifest order
+        for name in STORED_COLLECTIONS:
+            for key in getattr(manifest, name):
+                location = reused[name].get(key)
+                locations[name][key] = location or new_locations[(name, key)]
+
+        header = msgpack.packb(
+            {
+                "metadata": manifest.metadata.to_dict(**DEFAULT_DICT_PARAMS),
+                "state_check": manifest.state_check.to_dict(**DEFAULT_DICT_PARAMS),
+                "segment": segment_name,
+                "segment_size": offset,
+            },
+            use_bin_type=True,
+        )
+        index = {
+            "selectors": manifest.selectors,
+            "env_vars": manifest.env_vars,
+        }
+        index.update(locations)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as fp:
+            fp.write(MAGIC)
+            fp.write(_PREFIX.pack(FORMAT_VERSION, len(header)))
+            fp.write(header)
+            fp.write(msgpack.packb(index, use_bin_type=True))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, self.path)
+        _fsync_directory(self.directory)
+
+        if not append:
+            self._remove_unused_segments(segment_name)
+
+    def _remove_unused_segments(self, segment_name: str) -> None:
+        for name in os.listdir(self.directory):
+            if name.startswith("partial_parse.") and name.endswith(".data"):
+                if name != segment_name:
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        # e.g. it's still mapped into memory on Windows
+                        pass
+
+
+def read_partial_parse_file(path: str) -> Manifest:
+    return PartialParseStore(path).read_manifest()
@@ -1,4 +1,7 @@
+import os
 import pathlib
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dbt import flags
 from dbt.clients.system import load_file_contents
 from dbt.contracts.files import (
     FilePath,
@@ -12,7 +15,10 @@ from dbt.contracts.files import (
 from dbt.parser.schemas import yaml_from_file, schema_file_keys, check_format_version
 from dbt.exceptions import ParsingException
 from dbt.parser.search import filesystem_search
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# The number of threads used to read project files.
+MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 
 # This loads the files contents and creates the SourceFile object
@@ -31,22 +37,22 @@ def load_source_file(
         project_name=project_name,
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
+    # If the file's modification time, size and inode match the saved file,
+    # reuse the saved checksum instead of reading and hashing the file. The
+    # contents of non-schema files are only read if the file ends up being
+    # parsed (see load_deferred_contents). Schema files reuse the saved yaml.
+    skip_loading_file = False
+    if flags.PARTIAL_PARSE_FILE_STAT and saved_files and source_file.file_id in saved_files:
         old_source_file = saved_files[source_file.file_id]
-        if (
-            source_file.path.modification_time != 0.0
-            and old_source_file.path.modification_time == source_file.path.modification_time
+        if old_source_file.parse_file_type == parse_file_type and source_file.path.stat_matches(
+            old_source_file.path
         ):
             source_file.checksum = old_source_file.checksum
-            source_file.dfy = old_source_file.dfy
-            skip_loading_schema_file = True
+            if parse_file_type == ParseFileType.Schema:
+                source_file.dfy = old_source_file.dfy
+            skip_loading_file = True
 
-    if not skip_loading_schema_file:
+    if not skip_loading_file:
         file_contents = load_file_contents(path.absolute_path, strip=False)
         source_file.checksum = FileHash.from_contents(file_contents)
         source_file.contents = file_contents.strip()
@@ -61,6 +67,26 @@ def load_source_file(
     return source_file
 
 
+def _read_contents(source_file: AnySourceFile) -> None:
+    file_contents = load_file_contents(source_file.path.absolute_path, strip=False)
+    source_file.contents = file_contents.strip()
+
+
+def load_deferred_contents(source_files: Iterable[AnySourceFile]) -> None:
+    """Read the contents of any non-schema files whose read was skipped by
+    load_source_file because they had not changed since the last parse."""
+    pending = [
+        source_file
+        for source_file in source_files
+        if source_file.contents is None
+        and isinstance(source_file.path, FilePath)
+        and source_file.parse_file_type != ParseFileType.Schema
+    ]
+    if pending:
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            list(executor.map(_read_contents, pending))
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -91,13 +117,23 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
+def load_seed_source_file(match: FilePath, project_name, saved_files=None) -> SourceFile:
     if match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
-        file_contents = load_file_contents(match.absolute_path, strip=False)
-        checksum = FileHash.from_contents(file_contents)
+        file_id = f"{project_name}://{match.original_file_path}"
+        old_source_file = saved_files.get(file_id) if saved_files else None
+        if (
+            flags.PARTIAL_PARSE_FILE_STAT
+            and old_source_file is not None
+            and old_source_file.parse_file_type == ParseFileType.Seed
+            and match.stat_matches(old_source_file.path)
+        ):
+            checksum = old_source_file.checksum
+        else:
+            file_contents = load_file_contents(match.absolute_path, strip=False)
+            checksum = FileHash.from_contents(file_contents)
         source_file = SourceFile(path=match, checksum=checksum)
         source_file.contents = ""
     source_file.parse_file_type = ParseFileType.Seed
@@ -106,27 +142,33 @@ def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
 
 
 # Use the FilesystemSearcher to get a bunch of FilePaths, then turn
-# them into a bunch of FileSource objects
-def get_source_files(project, paths, extension, parse_file_type, saved_files):
+# them into a bunch of FileSource objects. If an executor is passed in,
+# the files are read (and hashed, and yaml loaded) on its worker threads,
+# but the results are still returned in filesystem search order.
+def get_source_files(
+    project, paths, extension, parse_file_type, saved_files, executor: Optional[Executor] = None
+) -> Iterator[AnySourceFile]:
     # file path list
     fp_list = filesystem_search(project, paths, extension)
-    # file block list
-    fb_list = []
-    for fp in fp_list:
+    # singular tests live in /tests but only generic tests live
+    # in /tests/generic so we want to skip those
+    if parse_file_type == ParseFileType.SingularTest:
+        fp_list = [fp for fp in fp_list if pathlib.Path(fp.relative_path).parts[0] != "generic"]
+
+    def load(fp: FilePath) -> Optional[AnySourceFile]:
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
-        # singular tests live in /tests but only generic tests live
-        # in /tests/generic so we want to skip those
-        else:
-            if parse_file_type == ParseFileType.SingularTest:
-                path = pathlib.Path(fp.relative_path)
-                if path.parts[0] == "generic":
-                    continue
-            file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
-            # only append the list if it has contents. added to fix #3568
-            if file:
-                fb_list.append(file)
-    return fb_list
+            return load_seed_source_file(fp, project.project_name, saved_files)
+        return load_source_file(fp, parse_file_type, project.project_name, saved_files)
+
+    # file block list
+    fb_list: Iterator[Optional[AnySourceFile]]
+    if executor is None:
+        fb_list = map(load, fp_list)
+    else:
+        # Executor.map submits every file up front
+        fb_list = executor.map(load, fp_list)
+    # only return files with contents. added to fix #3568
+    return (file for file in fb_list if file)
 
 
 def read_files_for_parser(project, files, dirs, extension, parse_ft, saved_files):
@@ -138,57 +180,55 @@ def read_files_for_parser(project, files, dirs, extension, parse_ft, saved_files
     return parser_files
 
 
+# The parser name, project paths attribute, extension and file type
+# for each kind of file read from a project, in the order they are read.
+PROJECT_FILE_TYPES = [
+    ("MacroParser", "macro_paths", ".sql", ParseFileType.Macro),
+    ("ModelParser", "model_paths", ".sql", ParseFileType.Model),
+    ("SnapshotParser", "snapshot_paths", ".sql", ParseFileType.Snapshot),
+    ("AnalysisParser", "analysis_paths", ".sql", ParseFileType.Analysis),
+    ("SingularTestParser", "test_paths", ".sql", ParseFileType.SingularTest),
+    # all generic tests within /tests must be nested under a /generic subfolder
+    ("GenericTestParser", "generic_test_paths", ".sql", ParseFileType.GenericTest),
+    ("SeedParser", "seed_paths", ".csv", ParseFileType.Seed),
+    ("DocumentationParser", "docs_paths", ".md", ParseFileType.Documentation),
+    ("SchemaParser", "all_source_paths", ".yml", ParseFileType.Schema),
+    # Also read .yaml files for schema files.
+    ("SchemaParser", "all_source_paths", ".yaml", ParseFileType.Schema),
+]
+
+
 # This needs to read files for multiple projects, so the 'files'
 # dictionary needs to be passed in. What determines the order of
 # the various projects? Is the root project always last? Do the
 # non-root projects need to be done separately in order?
 def read_files(project, files, parser_files, saved_files):
 
-    project_files = {}
-
-    project_files["MacroParser"] = read_files_for_parser(
-        project, files, project.macro_paths, ".sql", ParseFileType.Macro, saved_files
-    )
-
-    project_files["ModelParser"] = read_files_for_parser(
-        project, files, project.model_paths, ".sql", ParseFileType.Model, saved_files
-    )
-
-    project_files["SnapshotParser"] = read_files_for_parser(
-        project, files, project.snapshot_paths, ".sql", ParseFileType.Snapshot, saved_files
-    )
-
-    project_files["AnalysisParser"] = read_files_for_parser(
-        project, files, project.analysis_paths, ".sql", ParseFileType.Analysis, saved_files
-    )
-
-    project_files["SingularTestParser"] = read_files_for_parser(
-        project, files, project.test_paths, ".sql", ParseFileType.SingularTest, saved_files
-    )
-
-    # all generic tests within /tests must be nested under a /generic subfolder
-    project_files["GenericTestParser"] = read_files_for_parser(
-        project, files, project.generic_test_paths, ".sql", ParseFileType.GenericTest, saved_files
-    )
-
-    project_files["SeedParser"] = read_files_for_parser(
-        project, files, project.seed_paths, ".csv", ParseFileType.Seed, saved_files
-    )
-
-    project_files["DocumentationParser"] = read_files_for_parser(
-        project, files, project.docs_paths, ".md", ParseFileType.Documentation, saved_files
-    )
-
-    project_files["SchemaParser"] = read_files_for_parser(
-        project, files, project.all_source_paths, ".yml", ParseFileType.Schema, saved_files
-    )
-
-    # Also read .yaml files for schema files. Might be better to change
-    # 'read_files_for_parser' accept an array in the future.
-    yaml_files = read_files_for_parser(
-        project, files, project.all_source_paths, ".yaml", ParseFileType.Schema, saved_files
-    )
-    project_files["SchemaParser"].extend(yaml_files)
+    project_files: Dict[str, List[str]] = {}
+
+    # Reading files is mostly waiting on the filesystem (and hashing, which
+    # releases the GIL), so read every kind of file concurrently on a bounded
+    # pool of threads, then record them in the same order as a serial read.
+    with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+        pending = [
+            (
+                parser_name,
+                get_source_files(
+                    project,
+                    getattr(project, paths_attr),
+                    extension,
+                    parse_file_type,
+                    saved_files,
+                    executor,
+                ),
+            )
+            for parser_name, paths_attr, extension, parse_file_type in PROJECT_FILE_TYPES
+        ]
+        for parser_name, source_files in pending:
+            file_ids = project_files.setdefault(parser_name, [])
+            for sf in source_files:
+                files[sf.file_id] = sf
+                file_ids.append(sf.file_id)
 
     # Store the parser files for this particular project
     parser_files[project.project_name] = project_files
@@ -73,6 +73,8 @@ def filesystem_search(project: Project, relative_dirs: List[str], extension: str
             relative_path=result["relative_path"],
             modification_time=result["modification_time"],
             project_root=root,
+            file_size=result["file_size"],
+            inode=result["inode"],
         )
         file_path_list.append(file_match)
 
@@ -45,6 +45,7 @@ from dbt.events.types import (
 from .printer import print_run_result_error
 
 from dbt.adapters.factory import register_adapter
+from dbt.clients.jinja import set_bytecode_cache_path
 from dbt.config import RuntimeConfig, Project
 from dbt.config.profile import read_profile
 import dbt.exceptions
@@ -178,6 +179,7 @@ class ConfiguredTask(BaseTask):
     def __init__(self, args, config):
         super().__init__(args, config)
         register_adapter(self.config)
+        set_bytecode_cache_path(self.config.target_path)
 
     @classmethod
     def from_args(cls, args):
@@ -1,6 +1,8 @@
 import os
 import threading
 import time
+from concurrent.futures import as_completed
+from typing import Any, AbstractSet, Dict, List, Optional, Tuple
 
 from .base import BaseRunner
 from .printer import (
@@ -18,6 +20,7 @@ from dbt.contracts.results import (
 from dbt.exceptions import RuntimeException, InternalException
 from dbt.events.functions import fire_event
 from dbt.events.types import (
+    FreshnessBatchFailed,
     FreshnessCheckComplete,
     PrintStartLine,
     PrintHookEndErrorLine,
@@ -26,15 +29,24 @@ from dbt.events.types import (
     PrintHookEndPassLine,
 )
 from dbt.node_types import NodeType
+from dbt.utils import executor, lowercase
+import dbt.flags as flags
 
 from dbt.graph import ResourceTypeSelector
 from dbt.contracts.graph.parsed import ParsedSourceDefinition
 
 
 RESULT_FILE_NAME = "sources.json"
+# the most sources whose freshness is checked in one query
+MAX_BATCH_SIZE = 100
 
 
 class FreshnessRunner(BaseRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # the freshness of the source if it was checked in a batch
+        self.batched_freshness: Optional[Dict[str, Any]] = None
+
     def on_skip(self):
         raise RuntimeException("Freshness: nodes cannot be skipped!")
 
@@ -138,16 +150,18 @@ class FreshnessRunner(BaseRunner):
                 "Got to execute for source freshness of a source that has no " "loaded_at_field!"
             )
 
-        relation = self.adapter.Relation.create_from_source(compiled_node)
-        # given a Source, calculate its fresnhess.
-        with self.adapter.connection_for(compiled_node):
-            self.adapter.clear_transaction()
-            freshness = self.adapter.calculate_freshness(
-                relation,
-                compiled_node.loaded_at_field,
-                compiled_node.freshness.filter,
-                manifest=manifest,
-            )
+        freshness = self.batched_freshness
+        if freshness is None:
+            relation = self.adapter.Relation.create_from_source(compiled_node)
+            # given a Source, calculate its fresnhess.
+            with self.adapter.connection_for(compiled_node):
+                self.adapter.clear_transaction()
+                freshness = self.adapter.calculate_freshness(
+                    relation,
+                    compiled_node.loaded_at_field,
+                    compiled_node.freshness.filter,
+                    manifest=manifest,
+                )
 
         status = compiled_node.freshness.status(freshness["age"])
 
@@ -181,6 +195,11 @@ class FreshnessSelector(ResourceTypeSelector):
 
 
 class FreshnessTask(GraphRunnableTask):
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        # the freshness of the sources checked in batches, by unique_id
+        self.batched_freshness: Dict[str, Dict[str, Any]] = {}
+
     def result_path(self):
         if self.args.output:
             return os.path.realpath(self.args.output)
@@ -203,6 +222,82 @@ class FreshnessTask(GraphRunnableTask):
     def get_runner_type(self, _):
         return FreshnessRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.batched_freshness = self.batched_freshness.get(node.unique_id)
+        return runner
+
+    def get_freshness_batches(
+        self, selected_uids: AbstractSet[str]
+    ) -> List[List[ParsedSourceDefinition]]:
+        """Group the selected sources that share a database, a schema and a
+        loaded_at_field into batches of at most MAX_BATCH_SIZE sources.
+        """
+        if self.manifest is None:
+            raise InternalException("manifest must be set to get the freshness batches")
+        groups: Dict[Tuple[Optional[str], str, str], List[ParsedSourceDefinition]] = {}
+        for unique_id in sorted(selected_uids):
+            source = self.manifest.sources.get(unique_id)
+            if source is None or not source.has_freshness:
+                continue
+            # sources with freshness have a loaded_at_field
+            assert source.loaded_at_field is not None
+            key = (lowercase(source.database), source.schema.lower(), source.loaded_at_field)
+            groups.setdefault(key, []).append(source)
+
+        batches = []
+        for sources in groups.values():
+            for start in range(0, len(sources), MAX_BATCH_SIZE):
+                batch = sources[start : start + MAX_BATCH_SIZE]
+                # a source on its own is checked by its runner
+                if len(batch) > 1:
+                    batches.append(batch)
+        return batches
+
+    def _check_batch(
+        self, adapter, batch: List[ParsedSourceDefinition]
+    ) -> Dict[str, Dict[str, Any]]:
+        adapter.clear_transaction()
+        sources = []
+        for source in batch:
+            # the batches only hold sources with freshness
+            assert source.freshness is not None
+            sources.append(
+                (
+                    adapter.Relation.create_from_source(source),
+                    source.loaded_at_field,
+                    source.freshness.filter,
+                )
+            )
+        try:
+            freshness = adapter.calculate_freshness_batch(sources, manifest=self.manifest)
+        except RuntimeException as exc:
+            # one source that can't be checked fails the whole query, so the
+            # runners check each source of the batch on its own instead
+            fire_event(FreshnessBatchFailed(num_sources=len(batch), exc=str(exc)))
+            return {}
+        return {source.unique_id: result for source, result in zip(batch, freshness)}
+
+    def check_freshness_in_batches(
+        self, adapter, selected_uids: AbstractSet[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        batched: Dict[str, Dict[str, Any]] = {}
+        with executor(self.config) as tpe:
+            futures = [
+                tpe.submit_connected(
+                    adapter, f"freshness_batch_{index}", self._check_batch, adapter, batch
+                )
+                for index, batch in enumerate(self.get_freshness_batches(selected_uids))
+            ]
+            for future in as_completed(futures):
+                batched.update(future.result())
+        return batched
+
+    def before_run(self, adapter, selected_uids: AbstractSet[str]):
+        super().before_run(adapter, selected_uids)
+        if flags.BATCH_SOURCE_FRESHNESS:
+            self.batched_freshness = self.check_freshness_in_batches(adapter, selected_uids)
+
     def write_result(self, result):
         artifact = FreshnessExecutionResultArtifact.from_result(result)
         artifact.write(self.result_path())
@@ -1,12 +1,15 @@
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+from itertools import chain
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Set
 
 from dbt.dataclass_schema import ValidationError
 
 from .compile import CompileTask
+from .runnable import RESULT_FILE_NAME
 
+from dbt.adapters.base import BaseAdapter
 from dbt.adapters.factory import get_adapter
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
@@ -21,8 +24,11 @@ from dbt.contracts.results import (
     StatsDict,
     ColumnMetadata,
     CatalogArtifact,
+    RunResultsArtifact,
 )
-from dbt.exceptions import InternalException
+from dbt.exceptions import InternalException, RuntimeException
+from dbt.graph import UniqueId
+from dbt.graph.selector_methods import StateSelectorMethod
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -30,6 +36,8 @@ from dbt.events.types import (
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    BuildingCatalogIncrementally,
+    IncrementalCatalogFallback,
 )
 from dbt.parser.manifest import ManifestLoader
 import dbt.utils
@@ -179,6 +187,10 @@ def mapping_key(node: CompileResultNode) -> CatalogKey:
     return CatalogKey(dkey, node.schema.lower(), node.identifier.lower())
 
 
+def schema_key(node: CompileResultNode) -> Tuple[Optional[str], str]:
+    return dbt.utils.lowercase(node.database), node.schema.lower()
+
+
 def get_unique_id_mapping(
     manifest: Manifest,
 ) -> Tuple[Dict[CatalogKey, str], Dict[CatalogKey, Set[str]]]:
@@ -204,7 +216,128 @@ class GenerateTask(CompileTask):
             raise InternalException("manifest should not be None in _get_manifest")
         return self.manifest
 
+    def _get_previous_catalog(self) -> Optional[CatalogArtifact]:
+        """Get the catalog to build the new one incrementally from, or None to
+        build a full catalog.
+        """
+        if not self.args.incremental:
+            return None
+
+        state = self.previous_state
+        if state is None:
+            raise RuntimeException(
+                "Received an --incremental argument, but no value was provided to --state"
+            )
+        if state.catalog is None:
+            fire_event(IncrementalCatalogFallback(reason="no catalog.json in --state"))
+            return None
+        if state.manifest is None:
+            fire_event(IncrementalCatalogFallback(reason="no manifest.json in --state"))
+            return None
+        return state.catalog
+
+    def _read_run_results(self) -> Optional[RunResultsArtifact]:
+        # read before compiling, which overwrites run_results.json
+        path = os.path.join(self.config.target_path, RESULT_FILE_NAME)
+        if not os.path.isfile(path):
+            return None
+        try:
+            return RunResultsArtifact.read_and_check_versions(path)
+        except (RuntimeException, ValueError):
+            # the run results only narrow down the schemas to query, so a file
+            # that can't be read is ignored
+            return None
+
+    def _catalog_nodes(self) -> Iterator[CompileResultNode]:
+        # the nodes and sources whose schemas get_catalog queries
+        manifest = self._get_manifest()
+        for node in manifest.nodes.values():
+            if node.is_relational and not node.is_ephemeral_model:
+                yield node
+        yield from manifest.sources.values()
+
+    def _schemas_to_query(
+        self,
+        previous: CatalogArtifact,
+        run_results: List[Optional[RunResultsArtifact]],
+    ) -> Set[Tuple[Optional[str], str]]:
+        """Get the schemas the previous catalog can't be reused for: those of
+        the new and modified nodes and sources, of the relations missing from
+        the previous catalog, and of the nodes run since it was generated.
+        """
+        manifest = self._get_manifest()
+        nodes = {node.unique_id: node for node in self._catalog_nodes()}
+        method = StateSelectorMethod(manifest, self.previous_state, [])
+        modified = set(method.search({UniqueId(unique_id) for unique_id in nodes}, "modified"))
+        previous_keys = {
+            table.key() for table in chain(previous.nodes.values(), previous.sources.values())
+        }
+
+        schemas: Set[Tuple[Optional[str], str]] = set()
+        for unique_id, node in nodes.items():
+            if unique_id in modified or mapping_key(node) not in previous_keys:
+                schemas.add(schema_key(node))
+
+        for results in run_results:
+            if results is None or results.metadata.generated_at <= previous.metadata.generated_at:
+                continue
+            # compiling doesn't touch the database
+            if results.args.get("which") in ("compile", "generate"):
+                continue
+            for result in results.results:
+                run_node = manifest.nodes.get(result.unique_id)
+                if run_node is not None and result.status != NodeStatus.Skipped:
+                    schemas.add(schema_key(run_node))
+        return schemas
+
+    def _get_catalog(
+        self,
+        adapter,
+        previous: Optional[CatalogArtifact],
+        run_results: List[Optional[RunResultsArtifact]],
+    ) -> Tuple[Catalog, List[Exception]]:
+        if (
+            previous is not None
+            and getattr(type(adapter), "get_catalog", BaseAdapter.get_catalog)
+            is not BaseAdapter.get_catalog
+        ):
+            # get_catalog_for_schemas would bypass the adapter's own catalog query
+            fire_event(IncrementalCatalogFallback(reason="the adapter overrides get_catalog"))
+            previous = None
+
+        schemas: Set[Tuple[Optional[str], str]] = set()
+        if previous is None:
+            catalog_table, exceptions = adapter.get_catalog(self.manifest)
+        else:
+            schemas = self._schemas_to_query(previous, run_results)
+            catalog_table, exceptions = adapter.get_catalog_for_schemas(self.manifest, schemas)
+
+        catalog_data: List[PrimitiveDict] = [
+            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
+            for row in catalog_table
+        ]
+
+        catalog = Catalog(catalog_data)
+        if previous is None:
+            return catalog, exceptions
+
+        # the relations in the schemas that weren't queried are taken from the
+        # previous catalog as they are
+        num_reused = 0
+        for table in chain(previous.nodes.values(), previous.sources.values()):
+            key = table.key()
+            if (key.database, key.schema) not in schemas and key not in catalog:
+                catalog[key] = table
+                num_reused += 1
+        fire_event(BuildingCatalogIncrementally(num_schemas=len(schemas), num_reused=num_reused))
+        return catalog, exceptions
+
     def run(self) -> CatalogArtifact:
+        previous_catalog = self._get_previous_catalog()
+        run_results: List[Optional[RunResultsArtifact]] = []
+        if previous_catalog is not None and self.previous_state is not None:
+            run_results = [self.previous_state.results, self._read_run_results()]
+
         compile_results = None
         if self.args.compile:
             compile_results = CompileTask.run(self)
@@ -237,14 +370,7 @@ class GenerateTask(CompileTask):
         adapter = get_adapter(self.config)
         with adapter.connection_named("generate_catalog"):
             fire_event(BuildingCatalog())
-            catalog_table, exceptions = adapter.get_catalog(self.manifest)
-
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+            catalog, exceptions = self._get_catalog(adapter, previous_catalog, run_results)
 
         errors: Optional[List[str]] = None
         if exceptions:
@@ -8,7 +8,12 @@
 # snakeviz dbt.cprof
 from dbt.task.base import ConfiguredTask
 from dbt.adapters.factory import get_adapter
-from dbt.parser.manifest import Manifest, ManifestLoader, _check_manifest
+from dbt.parser.manifest import (
+    Manifest,
+    ManifestLoader,
+    _warn_for_unused_resource_config_paths,
+)
+from dbt.parser.partial_parse_file import build_flat_graph
 from dbt.logger import DbtProcessState
 from dbt.clients.system import write_file
 from dbt.events.types import (
@@ -73,10 +78,10 @@ class ParseTask(ConfiguredTask):
             fire_event(ManifestLoaderCreated())
             manifest = loader.load()
             fire_event(ManifestLoaded())
-            _check_manifest(manifest, root_config)
-            fire_event(ManifestChecked())
-            manifest.build_flat_graph()
+            build_flat_graph(manifest)
             fire_event(ManifestFlatGraphBuilt())
+            _warn_for_unused_resource_config_paths(manifest, root_config)
+            fire_event(ManifestChecked())
             loader._perf_info.load_all_elapsed = time.perf_counter() - start_load_all
 
         self.loader = loader
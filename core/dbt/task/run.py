@@ -30,6 +30,7 @@ from dbt.exceptions import (
 )
 from dbt.events.functions import fire_event, get_invocation_id
 from dbt.events.types import (
+    ConnectionCounts,
     DatabaseErrorRunning,
     EmptyLine,
     HooksRunning,
@@ -404,6 +405,10 @@ class RunTask(CompileTask):
             fire_event(EmptyLine())
         fire_event(HookFinished(stat_line=stat_line, execution=execution))
 
+    def print_connection_counts(self, adapter):
+        pool = adapter.connections.pool
+        fire_event(ConnectionCounts(opened=pool.opened, reused=pool.reused))
+
     def _get_deferred_manifest(self) -> Optional[WritableManifest]:
         if not self.args.defer:
             return None
@@ -467,6 +472,7 @@ class RunTask(CompileTask):
 
     def after_hooks(self, adapter, results, elapsed):
         self.print_results_line(results, elapsed)
+        self.print_connection_counts(adapter)
 
     def get_node_selector(self) -> ResourceTypeSelector:
         if self.manifest is None or self.graph is None:
@@ -35,11 +35,17 @@ from dbt.events.types import (
     NodeFinished,
     QueryCancelationUnsupported,
     ConcurrencyLine,
+    CriticalPathMakespan,
 )
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedSourceDefinition
-from dbt.contracts.results import NodeStatus, RunExecutionResult, RunningStatus
+from dbt.contracts.results import (
+    NodeStatus,
+    RunExecutionResult,
+    RunningStatus,
+    RunResultsArtifact,
+)
 from dbt.contracts.state import PreviousState
 from dbt.exceptions import (
     InternalException,
@@ -150,10 +156,33 @@ class GraphRunnableTask(ManifestTask):
     def get_node_selector(self) -> NodeSelector:
         raise NotImplementedException(f"get_node_selector not implemented for task {type(self)}")
 
+    def get_node_timings(self) -> Optional[Dict[str, float]]:
+        """If critical path scheduling is enabled, return the execution time
+        of every node in the previous run_results.json, preferring the one in
+        --state over the one in the target path.
+        """
+        if not flags.PRIORITIZE_CRITICAL_PATH:
+            return None
+
+        results: Optional[RunResultsArtifact] = None
+        results_path = os.path.join(self.config.target_path, RESULT_FILE_NAME)
+        try:
+            if self.previous_state is not None:
+                results = self.previous_state.results
+            if results is None and os.path.isfile(results_path):
+                results = RunResultsArtifact.read_and_check_versions(results_path)
+        except (RuntimeException, ValueError):
+            # an unreadable run_results.json only costs the scheduling order
+            return None
+        if results is None:
+            return None
+
+        return {result.unique_id: result.execution_time for result in results.results}
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, timings=self.get_node_timings())
 
     def _runtime_initialize(self):
         super()._runtime_initialize()
@@ -374,7 +403,12 @@ class GraphRunnableTask(ManifestTask):
         with TextOnly():
             fire_event(EmptyLine())
 
+        predicted_makespan: Optional[float] = None
+        if self.job_queue is not None and self.job_queue.timings is not None:
+            predicted_makespan = self.job_queue.predict_makespan(num_threads)
+
         pool = ThreadPool(num_threads)
+        started = time.perf_counter()
         try:
             self.run_queue(pool)
 
@@ -391,6 +425,18 @@ class GraphRunnableTask(ManifestTask):
         pool.close()
         pool.join()
 
+        if predicted_makespan is not None and self.job_queue is not None:
+            timings = self.job_queue.timings or {}
+            fire_event(
+                CriticalPathMakespan(
+                    predicted=predicted_makespan,
+                    actual=time.perf_counter() - started,
+                    untimed_nodes=len(
+                        [uid for uid in self.job_queue.get_selected_nodes() if uid not in timings]
+                    ),
+                )
+            )
+
         return self.node_results
 
     def _mark_dependent_errors(self, node_id, result, cause):
@@ -401,10 +447,13 @@ class GraphRunnableTask(ManifestTask):
 
     def populate_adapter_cache(self, adapter, required_schemas: Set[BaseRelation] = None):
         start_populate_cache = time.perf_counter()
+        lazy = flags.LAZY_RELATION_CACHE is True
         if flags.CACHE_SELECTED_ONLY is True:
-            adapter.set_relations_cache(self.manifest, required_schemas=required_schemas)
+            adapter.set_relations_cache(
+                self.manifest, required_schemas=required_schemas, lazy=lazy
+            )
         else:
-            adapter.set_relations_cache(self.manifest)
+            adapter.set_relations_cache(self.manifest, lazy=lazy)
         cache_populate_time = time.perf_counter() - start_populate_cache
         if dbt.tracking.active_user is not None:
             dbt.tracking.track_runnable_timing(
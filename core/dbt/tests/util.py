@@ -10,6 +10,7 @@ from contextlib import contextmanager
 from dbt.main import handle_and_check
 from dbt.logger import log_manager
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_parse_file import read_partial_parse_file
 from dbt.events.functions import fire_event, capture_stdout_logs, stop_capture_stdout_logs
 from dbt.events.test_types import IntegrationTestDebug
 
@@ -92,9 +93,7 @@ def run_dbt_and_capture(args: List[str] = None, expect_pass=True):
 def get_manifest(project_root):
     path = os.path.join(project_root, "target", "partial_parse.msgpack")
     if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+        manifest: Manifest = read_partial_parse_file(path)
         return manifest
     else:
         return None
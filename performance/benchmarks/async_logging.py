@@ -0,0 +1,61 @@
+"""Time many threads firing debug events while the file log is written, with
+the file log written on the firing threads and with it written by the
+background EventLogWriter.
+
+"fired" is how long the threads took to fire every event, "written" also
+includes waiting for the file log to catch up.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import dbt.events.functions as event_funcs
+import dbt.flags
+from dbt.events.types import SQLQuery
+
+
+def fire_events(threads, events):
+    def fire(name):
+        for index in range(events):
+            event_funcs.fire_event(SQLQuery(conn_name=name, sql=f"select {index} as id"))
+
+    workers = [
+        threading.Thread(target=fire, args=(f"Thread-{index}",), name=f"Thread-{index}")
+        for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def run(label, log_path, threads, events):
+    dbt.flags.ASYNC_LOGGING = label == "async"
+    event_funcs.setup_event_logger(log_path)
+    start = time.perf_counter()
+    fire_events(threads, events)
+    fired = time.perf_counter() - start
+    event_funcs.close_event_log_writer()
+    written = time.perf_counter() - start
+    print(f"{label:<6} fired {fired:8.3f}s  written {written:8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=32, help="number of threads")
+    parser.add_argument("--events", type=int, default=2000, help="events fired by each thread")
+    parser.add_argument("--secrets", type=int, default=20, help="DBT_ENV_SECRET_ env vars")
+    args = parser.parse_args()
+
+    secrets = {f"DBT_ENV_SECRET_{index}": f"secret-{index}" for index in range(args.secrets)}
+    with mock.patch.dict(os.environ, secrets):
+        for label in ("sync", "async"):
+            with tempfile.TemporaryDirectory() as log_path:
+                run(label, log_path, args.threads, args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare memory use and traversal time of the networkx and compact graph
+backends behind dbt.graph.Graph.
+
+The synthetic DAG is layered like a typical project: sources feed staging
+models, which feed marts, with a handful of tests on every model.
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+import networkx as nx  # type: ignore
+
+from dbt.graph import CompactGraph, Graph
+
+
+def build_dag(size: int, seed: int = 0) -> nx.DiGraph:
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    models = []
+    for index in range(size):
+        unique_id = f"model.my_project.some_reasonably_long_model_name_{index}"
+        graph.add_node(unique_id)
+        for parent in rng.sample(models[-500:], min(len(models), rng.randint(0, 4))):
+            graph.add_edge(parent, unique_id)
+        for test in range(2):
+            graph.add_edge(unique_id, f"test.my_project.not_null_{index}_{test}.abcdef1234")
+        models.append(unique_id)
+    return graph
+
+
+def measure(label, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} build {elapsed:8.3f}s  memory {size / 2 ** 20:8.1f} MiB")
+    return graph
+
+
+def traverse(label, graph: Graph, sample):
+    start = time.perf_counter()
+    for node in sample:
+        graph.descendants(node)
+        graph.ancestors(node, 2)
+    traversal = time.perf_counter() - start
+
+    start = time.perf_counter()
+    selected = set(graph.select_children(set(sample[:5]))) | set(sample[:5])
+    subset = graph.get_subset_graph(selected)
+    subset_time = time.perf_counter() - start
+    print(
+        f"{label:<12} traversals {traversal:8.3f}s  "
+        f"subset of {len(subset.nodes())} nodes {subset_time:8.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=20000, help="number of models")
+    parser.add_argument("--samples", type=int, default=200, help="nodes to traverse from")
+    args = parser.parse_args()
+
+    dag = build_dag(args.size)
+    print(f"{len(dag)} nodes, {dag.number_of_edges()} edges")
+    nx_graph = measure("networkx", lambda: nx.DiGraph(dag))
+    compact = measure("compact", lambda: CompactGraph.from_networkx(dag))
+
+    models = [node for node in dag if node.startswith("model.")]
+    sample = random.Random(1).sample(models, min(args.samples, len(models)))
+    traverse("networkx", Graph(nx_graph), sample)
+    traverse("compact", Graph(compact), sample)
+
+
+if __name__ == "__main__":
+    main()
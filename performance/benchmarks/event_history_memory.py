@@ -0,0 +1,160 @@
+"""Measure the memory held by the event history while the events of a
+`dbt --debug run` of many models are fired, and what it retains once they
+have all been added, with the events kept as objects in a deque as dbt used
+to, and serialized in an EventHistory. The peak is traced during firing, so
+it includes the events still queued for the history's thread. Also time how
+long the firing thread spends building and adding the events, when they're
+serialized on that thread and when the history serializes them on its own.
+The times are taken with tracemalloc on, so they're only comparable to each
+other.
+
+Each model fires the events a model run does: its start and result lines,
+the compiling, executing and finished events with the node's info and run
+result, and the debug events for the query it runs. No database connection
+is needed, since the events are fired directly.
+"""
+import argparse
+import gc
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import dbt.flags
+from dbt.contracts.graph.parsed import ParsedModelNode
+from dbt.contracts.results import RunResult, RunStatus, TimingInfo
+from dbt.events.functions import event_to_serializable_dict, get_ts
+from dbt.events.history import EventHistory
+from dbt.events.types import (
+    ConnectionUsed,
+    NodeCompiling,
+    NodeExecuting,
+    NodeFinished,
+    NodeStart,
+    PrintModelResultLine,
+    PrintStartLine,
+    SQLQuery,
+    SQLQueryStatus,
+)
+
+
+def make_node(index):
+    name = f"model_{index}"
+    return ParsedModelNode.from_dict(
+        {
+            "name": name,
+            "alias": name,
+            "database": "dbt",
+            "schema": "analytics",
+            "resource_type": "model",
+            "unique_id": f"model.bench.{name}",
+            "fqn": ["bench", name],
+            "package_name": "bench",
+            "root_path": "/usr/src/app",
+            "path": f"{name}.sql",
+            "original_file_path": f"models/{name}.sql",
+            "raw_sql": f"select * from {{{{ ref('model_{index - 1}') }}}}",
+            "checksum": {"name": "sha256", "checksum": "0" * 64},
+            "config": {"materialized": "table"},
+            "depends_on": {"nodes": [f"model.bench.model_{index - 1}"]},
+        }
+    )
+
+
+def model_events(node, index, total):
+    sql = f'create table "dbt"."analytics"."{node.name}" as (select * from "model_{index - 1}")'
+    result = RunResult(
+        status=RunStatus.Success,
+        timing=[TimingInfo("compile"), TimingInfo("execute")],
+        thread_id="Thread-1",
+        execution_time=0.1,
+        adapter_response={"_message": "SELECT 1", "code": "SELECT", "rows_affected": 1},
+        message="SELECT 1",
+        failures=None,
+        node=node,
+    )
+    description = f"table model analytics.{node.name}"
+    yield PrintStartLine(
+        description=description, index=index, total=total, node_info=node.node_info
+    )
+    yield NodeStart(unique_id=node.unique_id, node_info=node.node_info)
+    yield NodeCompiling(unique_id=node.unique_id, node_info=node.node_info)
+    yield NodeExecuting(unique_id=node.unique_id, node_info=node.node_info)
+    yield ConnectionUsed(conn_type="postgres", conn_name=node.unique_id)
+    yield SQLQuery(conn_name=node.unique_id, sql=sql)
+    yield SQLQueryStatus(status="SELECT 1", elapsed=0.1)
+    yield PrintModelResultLine(
+        description=description,
+        status="SELECT 1",
+        index=index,
+        total=total,
+        execution_time=0.1,
+        node_info=node.node_info,
+    )
+    yield NodeFinished(
+        unique_id=node.unique_id, run_result=result.to_dict(), node_info=node.node_info
+    )
+
+
+def measure(label, nodes, append, finish=lambda: None):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    # the events are built as they're fired, so only what the history holds
+    # on to adds up
+    for index, node in enumerate(nodes):
+        for event in model_events(node, index, len(nodes)):
+            append(event)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    finish()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<22} peak while firing {peak / 2**20:8.1f}MiB"
+        f"  retained {retained / 2**20:8.1f}MiB  firing thread {elapsed:6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=20000, help="number of models")
+    args = parser.parse_args()
+
+    nodes = [make_node(index) for index in range(args.models)]
+    print(f"{args.models} models, buffer of {dbt.flags.EVENT_BUFFER_SIZE} events")
+
+    events = deque(maxlen=dbt.flags.EVENT_BUFFER_SIZE)
+    measure("event objects", nodes, events.append)
+    del events
+
+    history = EventHistory(dbt.flags.EVENT_BUFFER_SIZE, dbt.flags.EVENT_BUFFER_BYTES)
+    measure(
+        "serialized when fired",
+        nodes,
+        lambda event: history.append(event_to_serializable_dict(event)),
+        history.flush,
+    )
+    print(f"{len(history)} events kept in {history.size / 2**20:.1f}MiB")
+    history.close()
+    del history
+
+    history = EventHistory(
+        dbt.flags.EVENT_BUFFER_SIZE,
+        dbt.flags.EVENT_BUFFER_BYTES,
+        serialize=event_to_serializable_dict,
+    )
+    thread_name = threading.current_thread().name
+    measure(
+        "serialized by history",
+        nodes,
+        lambda event: history.append_event(event, get_ts(), thread_name),
+        history.flush,
+    )
+    print(f"{len(history)} events kept in {history.size / 2**20:.1f}MiB")
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure the scheduling overhead of GraphQueue on synthetic DAGs.
+
+Every node is handed out and immediately marked as done on a single thread, so
+the reported time is the cost of the queue itself, not of running any nodes.
+"""
+import argparse
+import time
+
+import networkx as nx  # type: ignore
+
+from dbt.graph.queue import GraphQueue
+
+
+class _Manifest:
+    """GraphQueue only needs `expect` to hand nodes out."""
+
+    def expect(self, unique_id):
+        return unique_id
+
+
+def wide(size: int) -> nx.DiGraph:
+    """One root fanning out to every other node."""
+    graph = nx.DiGraph()
+    graph.add_node("n0")
+    graph.add_edges_from(("n0", f"n{i}") for i in range(1, size))
+    return graph
+
+
+def deep(size: int) -> nx.DiGraph:
+    """A single chain."""
+    graph = nx.DiGraph()
+    graph.add_node("n0")
+    graph.add_edges_from((f"n{i - 1}", f"n{i}") for i in range(1, size))
+    return graph
+
+
+def diamond(size: int, width: int = 50) -> nx.DiGraph:
+    """Layers of `width` nodes, each fully connected to the previous layer
+    through a single hub node."""
+    graph = nx.DiGraph()
+    graph.add_node("hub0")
+    layer = 0
+    count = 1
+    while count < size:
+        hub = f"hub{layer}"
+        next_hub = f"hub{layer + 1}"
+        for i in range(width):
+            node = f"n{layer}_{i}"
+            graph.add_edge(hub, node)
+            graph.add_edge(node, next_hub)
+        count += width + 1
+        layer += 1
+    return graph
+
+
+SHAPES = {"wide": wide, "deep": deep, "diamond": diamond}
+
+
+def drain(graph: nx.DiGraph) -> float:
+    queue = GraphQueue(graph, _Manifest(), set(graph.nodes()))
+    start = time.perf_counter()
+    while not queue.empty():
+        node = queue.get(block=False)
+        queue.mark_done(node)
+    queue.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=sorted(SHAPES))
+    args = parser.parse_args()
+
+    print(f"{'shape':<10}{'nodes':>10}{'total (s)':>14}{'per node (us)':>16}")
+    for shape in args.shapes:
+        for size in args.sizes:
+            graph = SHAPES[shape](size)
+            nodes = len(graph)
+            elapsed = drain(graph)
+            per_node = elapsed / nodes * 1e6
+            print(f"{shape:<10}{nodes:>10}{elapsed:>14.4f}{per_node:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
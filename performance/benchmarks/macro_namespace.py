@@ -0,0 +1,132 @@
+"""Time compiling every model of a project with many installed packages, and
+compare the cost of building the macro namespace of one node context with
+the shared namespace against building it from every macro in the manifest.
+
+The project is written to a temporary directory: a root project with models
+that each call a macro, and a number of installed packages with many macros
+each. No database connection is needed, since compiling these models doesn't
+run any queries.
+"""
+import argparse
+import os
+import tempfile
+import time
+import types
+
+import yaml
+
+import dbt.flags
+from dbt import tracking
+from dbt.adapters.factory import get_adapter_package_names, register_adapter, reset_adapters
+from dbt.clients.jinja import MacroStack
+from dbt.compilation import Compiler
+from dbt.config import RuntimeConfig
+from dbt.context.macros import MacroNamespaceBuilder, get_shared_namespace
+from dbt.parser.manifest import ManifestLoader
+
+
+def write(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+def write_project(root, models, packages, macros):
+    profile = {
+        "bench": {
+            "target": "dev",
+            "outputs": {
+                "dev": {
+                    "type": "postgres",
+                    "host": "localhost",
+                    "port": 5432,
+                    "user": "root",
+                    "pass": "password",
+                    "dbname": "dbt",
+                    "schema": "bench",
+                    "threads": 1,
+                }
+            },
+        }
+    }
+    write(os.path.join(root, "profiles.yml"), yaml.safe_dump(profile))
+    write(
+        os.path.join(root, "dbt_project.yml"),
+        yaml.safe_dump({"name": "bench", "version": "1.0", "profile": "bench", "config-version": 2}),
+    )
+    for package in range(packages):
+        package_root = os.path.join(root, "dbt_packages", f"package_{package}")
+        write(
+            os.path.join(package_root, "dbt_project.yml"),
+            yaml.safe_dump({"name": f"package_{package}", "version": "1.0", "config-version": 2}),
+        )
+        write(
+            os.path.join(package_root, "macros", "macros.sql"),
+            "\n".join(
+                f"{{% macro macro_{index}(x) %}}{{{{ x }}}} + {index}{{% endmacro %}}"
+                for index in range(macros)
+            ),
+        )
+    for index in range(models):
+        write(
+            os.path.join(root, "models", f"model_{index}.sql"),
+            f"select {{{{ package_{index % packages}.macro_{index % macros}('id') }}}} as id",
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=2000, help="number of models")
+    parser.add_argument("--packages", type=int, default=10, help="number of installed packages")
+    parser.add_argument("--macros", type=int, default=300, help="macros in each package")
+    args = parser.parse_args()
+
+    tracking.do_not_track()
+    with tempfile.TemporaryDirectory() as root:
+        write_project(root, args.models, args.packages, args.macros)
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            flag_args = types.SimpleNamespace(
+                profiles_dir=root, project_dir=root, profile=None, target=None, threads=None
+            )
+            dbt.flags.set_from_args(flag_args, None)
+            dbt.flags.PARTIAL_PARSE = False
+            config = RuntimeConfig.from_args(flag_args)
+            register_adapter(config)
+            manifest = ManifestLoader.get_full_manifest(config)
+            print(f"{len(manifest.nodes)} models, {len(manifest.macros)} macros")
+
+            compiler = Compiler(config)
+            start = time.perf_counter()
+            for node in manifest.nodes.values():
+                compiler.compile_node(node, manifest, {}, write=False)
+            elapsed = time.perf_counter() - start
+            print(f"compile all models {elapsed:8.3f}s")
+
+            internal_packages = get_adapter_package_names(config.credentials.type)
+            repeat = 50
+            start = time.perf_counter()
+            for _ in range(repeat):
+                builder = MacroNamespaceBuilder(
+                    config.project_name, config.project_name, MacroStack(), internal_packages
+                )
+                dict(builder.build_namespace(manifest.macros.values(), {}))
+            per_context = (time.perf_counter() - start) / repeat
+            print(f"namespace from all macros  {per_context * 1000:8.3f}ms per context")
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                shared = get_shared_namespace(
+                    manifest, config.project_name, config.project_name, internal_packages
+                )
+                dict(shared.flat)
+            per_context = (time.perf_counter() - start) / repeat
+            print(f"shared namespace           {per_context * 1000:8.3f}ms per context")
+        finally:
+            os.chdir(cwd)
+            reset_adapters()
+
+
+if __name__ == "__main__":
+    main()
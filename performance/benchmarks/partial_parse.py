@@ -0,0 +1,125 @@
+"""Time ManifestLoader.get_full_manifest with partial parsing enabled: the
+full parse that writes partial_parse.msgpack, a reload when nothing changed,
+and a reload after one model changed. For each reload it also prints how many
+of the saved nodes had to be deserialized.
+
+The project is written to a temporary directory: models that each select from
+the previous one, with schema files that document and test them. No database
+connection is needed, since parsing doesn't run any queries.
+"""
+import argparse
+import os
+import tempfile
+import time
+import types
+
+import yaml
+
+import dbt.flags
+from dbt import tracking
+from dbt.adapters.factory import register_adapter, reset_adapters
+from dbt.config import RuntimeConfig
+from dbt.parser.manifest import ManifestLoader
+from dbt.parser.partial_parse_file import LazyMapping
+
+
+def write(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+def model_sql(index, suffix=""):
+    if index == 0:
+        return f"select 0 as id{suffix}"
+    return f"select {index} as id{suffix} from {{{{ ref('model_{index - 1}') }}}}"
+
+
+def write_project(root, models, models_per_schema_file):
+    profile = {
+        "bench": {
+            "target": "dev",
+            "outputs": {
+                "dev": {
+                    "type": "postgres",
+                    "host": "localhost",
+                    "port": 5432,
+                    "user": "root",
+                    "pass": "password",
+                    "dbname": "dbt",
+                    "schema": "bench",
+                    "threads": 1,
+                }
+            },
+        }
+    }
+    write(os.path.join(root, "profiles.yml"), yaml.safe_dump(profile))
+    write(
+        os.path.join(root, "dbt_project.yml"),
+        yaml.safe_dump(
+            {"name": "bench", "version": "1.0", "profile": "bench", "config-version": 2}
+        ),
+    )
+    for index in range(models):
+        write(os.path.join(root, "models", f"model_{index}.sql"), model_sql(index))
+    for start in range(0, models, models_per_schema_file):
+        schema = {
+            "version": 2,
+            "models": [
+                {
+                    "name": f"model_{index}",
+                    "description": f"model {index}",
+                    "columns": [{"name": "id", "tests": ["unique", "not_null"]}],
+                }
+                for index in range(start, min(start + models_per_schema_file, models))
+            ],
+        }
+        write(os.path.join(root, "models", f"schema_{start}.yml"), yaml.safe_dump(schema))
+
+
+def timed_load(label, config):
+    start = time.perf_counter()
+    manifest = ManifestLoader.get_full_manifest(config, reset=True)
+    elapsed = time.perf_counter() - start
+    nodes = manifest.nodes
+    if isinstance(nodes, LazyMapping):
+        packed = sum(1 for key in nodes if nodes.is_packed(key))
+        deserialized = f"{len(nodes) - packed} of {len(nodes)} nodes deserialized"
+    else:
+        deserialized = "full parse"
+    print(f"{label:<22} {elapsed:8.3f}s  ({deserialized})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=1500, help="number of models")
+    parser.add_argument(
+        "--models-per-schema-file", type=int, default=6, help="models in each schema file"
+    )
+    args = parser.parse_args()
+
+    tracking.do_not_track()
+    with tempfile.TemporaryDirectory() as root:
+        write_project(root, args.models, args.models_per_schema_file)
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            flag_args = types.SimpleNamespace(
+                profiles_dir=root, project_dir=root, profile=None, target=None, threads=None
+            )
+            dbt.flags.set_from_args(flag_args, None)
+            dbt.flags.PARTIAL_PARSE = True
+            config = RuntimeConfig.from_args(flag_args)
+            register_adapter(config)
+
+            timed_load("full parse", config)
+            timed_load("unchanged", config)
+            write(os.path.join(root, "models", "model_1.sql"), model_sql(1, suffix="_changed"))
+            timed_load("one model changed", config)
+        finally:
+            os.chdir(cwd)
+            reset_adapters()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Time many threads updating the relations cache at once, as the threads of
+a run do with cache_added, cache_renamed and cache_dropped, with the
+RelationsCache behind one lock and with the PartitionedRelationsCache.
+
+The cache starts out filled with many relations in many schemas, with a
+view on each table. Each thread then materializes tables in one schema the
+way the table materialization does: it adds an intermediate relation,
+renames the existing table to a backup, renames the intermediate relation
+to the table, and drops the backup.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.cache import PartitionedRelationsCache, RelationsCache
+
+
+def relation(schema, identifier):
+    return BaseRelation.create(database="dbt", schema=schema, identifier=identifier)
+
+
+def populate(cache, schemas, tables):
+    for schema in schemas:
+        for index in range(tables):
+            cache.add(relation(schema, f"table_{index}"))
+            cache.add(relation(schema, f"view_{index}"))
+            cache.add_link(relation(schema, f"table_{index}"), relation(schema, f"view_{index}"))
+
+
+def materialize(cache, schema, tables):
+    for index in range(tables):
+        name = f"table_{index}"
+        cache.add(relation(schema, name + "__dbt_tmp"))
+        cache.rename(relation(schema, name), relation(schema, name + "__dbt_backup"))
+        cache.rename(relation(schema, name + "__dbt_tmp"), relation(schema, name))
+        cache.drop(relation(schema, name + "__dbt_backup"))
+        cache.get_relations("dbt", schema)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=32, help="number of threads")
+    parser.add_argument("--schemas", type=int, default=32, help="number of schemas")
+    parser.add_argument("--tables", type=int, default=50, help="tables in each schema")
+    args = parser.parse_args()
+
+    schemas = [f"schema_{index}" for index in range(args.schemas)]
+    print(f"{args.schemas * args.tables * 2} relations, {args.threads} threads")
+    for cache_cls in (RelationsCache, PartitionedRelationsCache):
+        cache = cache_cls()
+        populate(cache, schemas, args.tables)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as executor:
+            list(executor.map(lambda schema: materialize(cache, schema, args.tables), schemas))
+        elapsed = time.perf_counter() - start
+        print(f"{cache_cls.__name__:<26} {elapsed:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
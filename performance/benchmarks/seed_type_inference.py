@@ -0,0 +1,91 @@
+"""Time reading seed files with agate_helper.from_csv, inferring the column
+types with agate's TypeTester over the rows of the table as dbt used to, and
+with the ColumnarTypeTester in a streaming pass over the file first.
+
+Two files are generated: a wide one with many columns and few rows, and a
+tall one with few columns and many rows. Their columns hold numbers, dates,
+timestamps, booleans, text and mostly-null values.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import agate
+
+from dbt.clients import agate_helper
+
+
+def cell(kind, rng):
+    if kind == "number":
+        return str(rng.randint(0, 1000))
+    if kind == "decimal":
+        return f"{rng.random() * 1000:.2f}"
+    if kind == "date":
+        return f"2022-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if kind == "timestamp":
+        return f"2022-01-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00:00"
+    if kind == "boolean":
+        return rng.choice(["true", "false"])
+    if kind == "sparse":
+        return "" if rng.random() < 0.95 else str(rng.randint(0, 9))
+    return f"text {rng.randint(0, 1000)}"
+
+
+KINDS = ["number", "decimal", "date", "timestamp", "boolean", "sparse", "text"]
+
+
+def write_csv(path, columns, rows):
+    rng = random.Random(0)
+    kinds = [KINDS[index % len(KINDS)] for index in range(columns)]
+    with open(path, "w") as fp:
+        fp.write(",".join(f"{kind}_{index}" for index, kind in enumerate(kinds)) + "\n")
+        for _ in range(rows):
+            fp.write(",".join(cell(kind, rng) for kind in kinds) + "\n")
+
+
+def agate_from_csv(path):
+    # from_csv as it was, with agate's TypeTester
+    tester = agate_helper.build_type_tester(())
+    tester = agate.TypeTester(force=tester._force, types=tester._possible_types)
+    with open(path, encoding="utf-8") as fp:
+        return agate.Table.from_csv(fp, column_types=tester)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wide-columns", type=int, default=500, help="columns of the wide file")
+    parser.add_argument("--wide-rows", type=int, default=2000, help="rows of the wide file")
+    parser.add_argument("--tall-columns", type=int, default=7, help="columns of the tall file")
+    parser.add_argument("--tall-rows", type=int, default=200000, help="rows of the tall file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        for label, columns, rows in (
+            ("wide", args.wide_columns, args.wide_rows),
+            ("tall", args.tall_columns, args.tall_rows),
+        ):
+            path = os.path.join(tempdir, f"{label}.csv")
+            write_csv(path, columns, rows)
+            print(f"{label}: {columns} columns, {rows} rows")
+
+            start = time.perf_counter()
+            expected = agate_from_csv(path)
+            print(f"  agate TypeTester     {time.perf_counter() - start:8.3f}s")
+
+            start = time.perf_counter()
+            agate_helper.infer_csv_column_types(path, ())
+            print(f"  streaming inference  {time.perf_counter() - start:8.3f}s")
+
+            start = time.perf_counter()
+            table = agate_helper.from_csv(path, ())
+            print(f"  from_csv             {time.perf_counter() - start:8.3f}s")
+
+            assert [type(t) for t in table.column_types] == [
+                type(t) for t in expected.column_types
+            ], "the column types differ"
+
+
+if __name__ == "__main__":
+    main()
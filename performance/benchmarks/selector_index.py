@@ -0,0 +1,63 @@
+"""Time selecting nodes of a large manifest with a union of many criteria, as a
+selector in selectors.yml might, with the selector methods scanning every
+node for each criterion, and with the inverted indexes of SelectorIndex.
+"""
+import argparse
+import time
+
+from dbt.contracts.graph.manifest import Manifest
+from dbt.graph.selector_methods import MethodManager
+
+from write_manifest import make_node
+
+
+def criteria(count):
+    methods = [
+        ("tag", [], "tag_{}"),
+        ("package", [], "bench"),
+        ("fqn", [], "bench.model_{}"),
+        ("file", [], "model_{}.sql"),
+        ("config", ["materialized"], "table"),
+        ("resource_type", [], "model"),
+    ]
+    for index in range(count):
+        method, arguments, value = methods[index % len(methods)]
+        yield method, arguments, value.format(index)
+
+
+def select(manifest, specs, use_index):
+    methods = MethodManager(manifest, None)
+    if not use_index:
+        methods.index = None
+    included = set(manifest.nodes)
+    selected = set()
+    for method, arguments, value in specs:
+        selected.update(methods.get_method(method, arguments).search(included, value))
+    return selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=10000, help="number of models")
+    parser.add_argument("--criteria", type=int, default=30, help="number of criteria")
+    args = parser.parse_args()
+
+    nodes = {}
+    for index in range(args.models):
+        node = make_node(index, 0)
+        node.tags = [f"tag_{index % 100}"]
+        nodes[node.unique_id] = node
+    manifest = Manifest(nodes=nodes)
+    specs = list(criteria(args.criteria))
+
+    results = []
+    for label, use_index in (("scan", False), ("indexed", True)):
+        start = time.perf_counter()
+        results.append(select(manifest, specs, use_index))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<8} {elapsed:8.3f}s  {len(results[-1])} nodes selected")
+    assert results[0] == results[1], "the selections differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Time reading a large manifest.json from the --state directory and running
+state:modified against it, with the manifest fully deserialized up front as
+dbt used to, and read by PreviousState, which only deserializes the entries
+that are compared.
+
+Only a fraction of the current project's models are selected for the
+comparison, as with `dbt run -s state:modified --select tag:...`.
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from dbt.contracts.graph.manifest import Manifest, WritableManifest
+from dbt.contracts.state import PreviousState
+from dbt.graph.selector_methods import MethodManager
+
+from write_manifest import make_node
+
+
+def select_modified(manifest, previous_state, included):
+    method = MethodManager(manifest, previous_state).get_method("state", [])
+    return set(method.search(included, "modified"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=10000, help="number of models")
+    parser.add_argument("--columns", type=int, default=20, help="columns of each model")
+    parser.add_argument("--selected", type=int, default=100, help="models compared")
+    args = parser.parse_args()
+
+    nodes = {}
+    for index in range(args.models):
+        node = make_node(index, args.columns)
+        nodes[node.unique_id] = node
+    manifest = Manifest(nodes=nodes)
+    included = set(list(nodes)[: args.selected])
+
+    with tempfile.TemporaryDirectory() as state_path:
+        path = os.path.join(state_path, "manifest.json")
+        manifest.writable_manifest().write(path)
+        print(f"manifest.json is {os.path.getsize(path) / 2**20:.1f}MiB")
+
+        start = time.perf_counter()
+        eager = PreviousState(Path(state_path), Path(state_path))
+        eager.manifest = WritableManifest.read_and_check_versions(path)
+        loaded = time.perf_counter()
+        select_modified(manifest, eager, included)
+        done = time.perf_counter()
+        print(f"eager  read {loaded - start:6.2f}s  compare {done - loaded:6.2f}s")
+
+        start = time.perf_counter()
+        lazy = PreviousState(Path(state_path), Path(state_path))
+        lazy.manifest
+        loaded = time.perf_counter()
+        select_modified(manifest, lazy, included)
+        done = time.perf_counter()
+        print(f"lazy   read {loaded - start:6.2f}s  compare {done - loaded:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
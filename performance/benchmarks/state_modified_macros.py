@@ -0,0 +1,106 @@
+"""Time selecting state:modified.macros on a synthetic manifest where many
+nodes share deep macro trees, walking each node's macro tree as dbt used to,
+and with the set of affected macros computed once per selection.
+
+The macros form a DAG in which each macro calls a few macros with higher
+numbers, and each model calls a few macros. A handful of the first macros,
+which no other macro calls, are changed in the previous manifest, so most
+models aren't affected and their whole macro tree has to be checked.
+"""
+import argparse
+import copy
+import random
+import time
+from pathlib import Path
+
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.contracts.state import PreviousState
+from dbt.graph.selector_methods import MethodManager
+
+from write_manifest import make_node
+
+
+def make_macro(index, depends_on):
+    name = f"macro_{index}"
+    return ParsedMacro.from_dict(
+        {
+            "name": name,
+            "resource_type": "macro",
+            "unique_id": f"macro.bench.{name}",
+            "package_name": "bench",
+            "root_path": "/usr/src/app",
+            "path": "macros/macros.sql",
+            "original_file_path": "macros/macros.sql",
+            "macro_sql": f"{{% macro {name}() %}}{index}{{% endmacro %}}",
+            "depends_on": {"macros": depends_on},
+        }
+    )
+
+
+def walk_macro_trees(manifest, modified):
+    # the recursive check that dbt used to run for every node
+    def check(node, visited):
+        for macro_uid in node.depends_on.macros:
+            if macro_uid in visited:
+                continue
+            visited.append(macro_uid)
+            if macro_uid in modified:
+                return True
+            macro = manifest.macros[macro_uid]
+            if macro.depends_on.macros and check(macro, visited):
+                return True
+        return False
+
+    return {uid for uid, node in manifest.nodes.items() if check(node, [])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--macros", type=int, default=5000, help="number of macros")
+    parser.add_argument("--models", type=int, default=10000, help="number of models")
+    parser.add_argument("--calls", type=int, default=3, help="macros called by each macro/model")
+    parser.add_argument("--changed", type=int, default=5, help="number of changed macros")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    macros = {}
+    for index in range(args.macros):
+        callees = range(index + 1, args.macros)
+        depends_on = [
+            f"macro.bench.macro_{callee}"
+            for callee in rng.sample(callees, min(args.calls, len(callees)))
+        ]
+        macro = make_macro(index, depends_on)
+        macros[macro.unique_id] = macro
+    nodes = {}
+    for index in range(args.models):
+        node = make_node(index, 0)
+        node.depends_on.macros = [
+            f"macro.bench.macro_{callee}" for callee in rng.sample(range(args.macros), args.calls)
+        ]
+        nodes[node.unique_id] = node
+    manifest = Manifest(nodes=nodes, macros=macros)
+
+    previous = copy.deepcopy(manifest)
+    changed = list(macros)[: args.changed]
+    for uid in changed:
+        previous.macros[uid] = previous.macros[uid].replace(macro_sql="changed")
+    state = PreviousState(Path("/path/does/not/exist"), Path("/path/does/not/exist"))
+    state.manifest = previous.writable_manifest()
+    print(f"{len(macros)} macros, {len(nodes)} models, {len(changed)} changed macros")
+
+    start = time.perf_counter()
+    walked = walk_macro_trees(manifest, changed)
+    print(f"walk macro trees    {time.perf_counter() - start:8.3f}s")
+
+    start = time.perf_counter()
+    method = MethodManager(manifest, state).get_method("state", [])
+    selected = set(method.search(set(nodes), "modified.macros"))
+    print(f"affected macro set  {time.perf_counter() - start:8.3f}s")
+    assert selected == walked, "the selections differ"
+    print(f"{len(selected)} models selected")
+
+
+if __name__ == "__main__":
+    main()
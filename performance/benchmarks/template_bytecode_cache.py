@@ -0,0 +1,66 @@
+"""Time compiling the templates of a project without the on-disk bytecode
+cache, with an empty cache, and with a warm cache, as a new dbt invocation
+would.
+
+The templates are the macro files of dbt's global project and of the
+installed adapter plugins, plus synthetic models that use a few jinja
+constructs each.
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from dbt.clients.jinja import get_template, set_bytecode_cache_path
+from dbt.include.global_project import PACKAGE_PATH
+
+
+def model_sql(index):
+    return (
+        f"{{{{ config(materialized='table') }}}}\n"
+        f"{{% set columns = ['a', 'b', 'c_{index}'] %}}\n"
+        f"select\n"
+        f"{{% for column in columns %}}  {{{{ column }}}}{{% if not loop.last %}},{{% endif %}}\n"
+        f"{{% endfor %}}"
+        f"from {{{{ ref('model_{index - 1}') }}}}\n"
+        f"{{% if is_incremental() %}}where updated_at > (select max(updated_at) from "
+        f"{{{{ this }}}}){{% endif %}}\n"
+    )
+
+
+def compile_all(label, sources):
+    start = time.perf_counter()
+    for source in sources:
+        get_template(source, {})
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=4000, help="number of models")
+    args = parser.parse_args()
+
+    sources = []
+    for path in glob.glob(os.path.join(PACKAGE_PATH, "macros", "**", "*.sql"), recursive=True):
+        with open(path) as fp:
+            sources.append(fp.read())
+    macro_count = len(sources)
+    sources.extend(model_sql(index) for index in range(args.models))
+    print(f"{macro_count} macro files, {args.models} models")
+
+    with tempfile.TemporaryDirectory() as target_path:
+        set_bytecode_cache_path(None)
+        compile_all("no cache", sources)
+        set_bytecode_cache_path(target_path)
+        compile_all("cold cache", sources)
+        # a new invocation starts with a new cache object
+        set_bytecode_cache_path(None)
+        set_bytecode_cache_path(target_path)
+        compile_all("warm cache", sources)
+        set_bytecode_cache_path(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure the peak memory and the time of writing manifest.json for a large
+manifest, serialized to one dict and string with write_json as dbt used to,
+and streamed a node at a time by WritableManifest.write.
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from dbt.clients.system import write_json
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedModelNode
+
+
+def make_node(index, columns):
+    name = f"model_{index}"
+    return ParsedModelNode.from_dict(
+        {
+            "name": name,
+            "alias": name,
+            "database": "dbt",
+            "schema": "analytics",
+            "resource_type": "model",
+            "unique_id": f"model.bench.{name}",
+            "fqn": ["bench", name],
+            "package_name": "bench",
+            "root_path": "/usr/src/app",
+            "path": f"{name}.sql",
+            "original_file_path": f"models/{name}.sql",
+            "raw_sql": f"select * from {{{{ ref('model_{index - 1}') }}}}",
+            "description": f"The {name} model. " * 20,
+            "checksum": {"name": "sha256", "checksum": "0" * 64},
+            "config": {"materialized": "table"},
+            "depends_on": {"nodes": [f"model.bench.model_{index - 1}"] if index else []},
+            "columns": {
+                f"column_{c}": {"name": f"column_{c}", "description": f"column {c} of {name}"}
+                for c in range(columns)
+            },
+        }
+    )
+
+
+def measure(label, write):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    write()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} peak {peak / 2**20:8.1f}MiB  {elapsed:6.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=10000, help="number of models")
+    parser.add_argument("--columns", type=int, default=20, help="columns of each model")
+    args = parser.parse_args()
+
+    nodes = {}
+    for index in range(args.models):
+        node = make_node(index, args.columns)
+        nodes[node.unique_id] = node
+    manifest = Manifest(nodes=nodes)
+    writable = manifest.writable_manifest()
+
+    with tempfile.TemporaryDirectory() as target_path:
+        path = os.path.join(target_path, "manifest.json")
+        measure("write_json", lambda: write_json(path, writable.to_dict(omit_none=False)))
+        print(f"manifest.json is {os.path.getsize(path) / 2**20:.1f}MiB")
+        measure("streamed", lambda: writable.write(path))
+
+
+if __name__ == "__main__":
+    main()
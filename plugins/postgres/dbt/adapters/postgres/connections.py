@@ -149,6 +149,33 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def reset(cls, connection):
+        handle = connection.handle
+        if handle.closed:
+            return False
+
+        credentials = cls.get_credentials(connection.credentials)
+        try:
+            handle.rollback()
+            # discard all can't run inside a transaction block
+            handle.autocommit = True
+            try:
+                cursor = handle.cursor()
+                # drops temporary tables and restores the role and the session
+                # settings, including the search_path set when connecting
+                cursor.execute("discard all")
+                if credentials.role:
+                    cursor.execute("set role {}".format(credentials.role))
+            finally:
+                handle.autocommit = False
+        except psycopg2.Error as e:
+            logger.debug("Could not reset the connection, closing it: '{}'".format(e))
+            return False
+
+        connection.transaction_open = False
+        return True
+
     def cancel(self, connection):
         connection_name = connection.name
         try:
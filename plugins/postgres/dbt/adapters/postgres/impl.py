@@ -1,6 +1,9 @@
+import csv
+import io
+import threading
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, Set, List, Any
+from typing import Optional, Set, List, Any, Tuple
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.impl import AdapterConfig
 from dbt.adapters.sql import SQLAdapter
@@ -63,6 +66,12 @@ class PostgresAdapter(SQLAdapter):
 
     AdapterSpecificConfigs = PostgresConfig
 
+    def __init__(self, config):
+        super().__init__(config)
+        # the dependencies between relations, when the cache is filled lazily
+        self._relation_dependencies: Optional[List[Tuple[str, str, str, str]]] = None
+        self._relation_dependencies_lock = threading.Lock()
+
     @classmethod
     def date_function(cls):
         return "now()"
@@ -130,5 +139,55 @@ class PostgresAdapter(SQLAdapter):
         super()._relations_cache_for_schemas(manifest, cache_schemas)
         self._link_cached_relations(manifest)
 
+    def _defer_relations_cache_for_schemas(self, manifest, cache_schemas=None):
+        super()._defer_relations_cache_for_schemas(manifest, cache_schemas)
+        with self._relation_dependencies_lock:
+            self._relation_dependencies = None
+
+    def _get_relation_dependencies(self) -> List[Tuple[str, str, str, str]]:
+        """Return the rows of postgres_get_relations. They're queried when the
+        first schema is cached lazily, and kept until the cache is set up again.
+        """
+        with self._relation_dependencies_lock:
+            if self._relation_dependencies is None:
+                table = self.execute_macro(GET_RELATIONS_MACRO_NAME)
+                self._relation_dependencies = [(row[0], row[1], row[2], row[3]) for row in table]
+            return self._relation_dependencies
+
+    def _cache_schema_lazily(self, schema_relation):
+        relations = super()._cache_schema_lazily(schema_relation)
+        self.verify_database(schema_relation.database)
+        database = self.config.credentials.database
+        schema = schema_relation.schema.lower()
+
+        for (dep_schema, dep_name, refed_schema, refed_name) in self._get_relation_dependencies():
+            # only link relations in schemas that are both cached already, so a
+            # schema that is still waiting isn't added to the cache half-filled.
+            # The link is made when the second of the two schemas is cached.
+            if schema not in (dep_schema.lower(), refed_schema.lower()):
+                continue
+            if (database, dep_schema) not in self.cache:
+                continue
+            if (database, refed_schema) not in self.cache:
+                continue
+            dependent = self.Relation.create(
+                database=database, schema=dep_schema, identifier=dep_name
+            )
+            referenced = self.Relation.create(
+                database=database, schema=refed_schema, identifier=refed_name
+            )
+            self.cache.add_link(referenced, dependent)
+        return relations
+
+    def _csv_bulk_load_sql(self, relation, column_names_sql, binding_char, num_columns):
+        return f"copy {relation} ({column_names_sql}) from stdin with (format csv)"
+
+    def _load_csv_chunk(self, cursor, sql, rows):
+        # nulls are written as unquoted empty values, which copy reads as null
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         return f"{add_to} + interval '{number} {interval}'"
@@ -0,0 +1,4 @@
+{% macro postgres__use_csv_bulk_load() %}
+  {#-- seeds are streamed into the table with copy, see PostgresAdapter._load_csv_chunk --#}
+  {{ return(true) }}
+{% endmacro %}
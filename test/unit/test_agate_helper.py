@@ -6,9 +6,11 @@ from datetime import datetime
 from decimal import Decimal
 from isodate import tzinfo
 import os
+import random
 from shutil import rmtree
 from tempfile import mkdtemp
 from dbt.clients import agate_helper
+from dbt.exceptions import RuntimeException
 
 SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
 1,n,test,3.2,20180806T11:33:29.320Z,True,NULL
@@ -71,6 +73,100 @@ class TestAgateHelper(unittest.TestCase):
         for expected, row in zip(EXPECTED_STRINGS, tbl):
             self.assertEqual(list(row), expected)
 
+    def test_from_csv_sample(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write((SAMPLE_CSV_DATA + '\n3,z,x,1.5,not a date,maybe,\n').encode('utf-8'))
+        tbl = agate_helper.from_csv(path, (), sample_size=2)
+        # the types are inferred from the rows after the sample too
+        self.assertEqual([list(row) for row in tbl], [
+            [1, 'n', 'test', Decimal('3.2'), '20180806T11:33:29.320Z', 'True', None],
+            [2, 'y', 'asdf', Decimal('900'), '20180806T11:35:29.320Z', 'False', 'a string'],
+        ])
+        full = agate_helper.from_csv(path, ())
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in full.column_types]
+        )
+        self.assertIsInstance(tbl.column_types[4], agate.data_types.Text)
+
+    def test_read_csv_chunks(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write((SAMPLE_CSV_BOM_DATA + '\n3,z,x\n').encode('utf-8'))
+        column_types = agate_helper.from_csv(path, (), sample_size=2).column_types
+        chunks = list(agate_helper.read_csv_chunks(path, column_types, 2))
+        self.assertEqual(
+            chunks, [EXPECTED, [[3, 'z', 'x', None, None, None, None]]]
+        )
+
+    def test_read_csv_chunks_mismatch(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write((SAMPLE_CSV_DATA + '\n3,z,x,1,,,\n').encode('utf-8'))
+        column_types = agate_helper.from_csv(path, (), sample_size=2).column_types
+
+        # the file changed after its types were inferred
+        with open(path, 'wb') as fp:
+            fp.write((SAMPLE_CSV_DATA + '\nthree,z,x,1,,,\n').encode('utf-8'))
+        with self.assertRaisesRegex(RuntimeException, 'Row 3 of'):
+            list(agate_helper.read_csv_chunks(path, column_types, 10))
+
+        with open(path, 'wb') as fp:
+            fp.write((SAMPLE_CSV_DATA + '\n3,z,x,1,,,,extra\n').encode('utf-8'))
+        with self.assertRaisesRegex(RuntimeException, 'has 8 values'):
+            list(agate_helper.read_csv_chunks(path, column_types, 10))
+
+    def test_columnar_type_tester_matches_agate(self):
+        rng = random.Random(0)
+        values = [
+            '1', '2.5', '-3', '2018-08-06', '2018-08-06 11:33:29', '20180806T11:33:29Z',
+            'true', 'false', 'True', '', 'null', 'NULL', ' 4 ', 'text', '1,000', '$5', '0',
+        ]
+        for _ in range(200):
+            num_columns = rng.randint(1, 6)
+            column_names = [f'c{i}' for i in range(num_columns)]
+            # a few values per column, so some columns keep more than one type
+            pools = [rng.sample(values, rng.randint(1, 4)) for _ in range(num_columns)]
+            rows = [
+                [rng.choice(pools[i]) for i in range(rng.randint(0, num_columns))]
+                for _ in range(rng.randint(0, 30))
+            ]
+            text_columns = rng.sample(column_names, rng.randint(0, 1))
+            expected = agate.TypeTester(
+                force=agate_helper.build_type_tester(text_columns).force,
+                types=agate_helper.build_type_tester(text_columns).types,
+            ).run(rows, column_names)
+            result = agate_helper.build_type_tester(text_columns).run(iter(rows), column_names)
+            self.assertEqual(
+                [type(t) for t in result], [type(t) for t in expected], (rows, text_columns)
+            )
+
+    def test_columnar_type_tester_stops_reading(self):
+        rows = iter([['a', '1'], ['b', 'x'], ['c', '2']])
+        tester = agate_helper.build_type_tester(())
+        types = tester.run(rows, ['name', 'value'])
+        self.assertEqual([type(t) for t in types], [agate.data_types.Text] * 2)
+        # both columns were text after the second row
+        self.assertEqual(list(rows), [['c', '2']])
+
+    def test_columnar_type_tester_falls_back_to_text(self):
+        number = agate.data_types.Number()
+        boolean = agate.data_types.Boolean()
+        tester = agate_helper.ColumnarTypeTester(force={}, types=[number, boolean])
+        types = tester.run([['1', 'true'], ['x', 'false']], ['a', 'b'])
+        self.assertIsInstance(types[0], agate.data_types.Text)
+        self.assertIs(types[1], boolean)
+
+    def test_infer_csv_column_types(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        types = agate_helper.infer_csv_column_types(path, ('b',))
+        expected = agate.Table.from_csv(
+            path, column_types=agate_helper.build_type_tester(('b',)), encoding='utf-8-sig'
+        ).column_types
+        self.assertEqual([type(t) for t in types], [type(t) for t in expected])
+
     def test_from_data(self):
         column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
         data = [
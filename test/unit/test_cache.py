@@ -1,12 +1,15 @@
-from unittest import TestCase
-from dbt.adapters.cache import RelationsCache
+from unittest import TestCase, mock
+from dbt.adapters.cache import PartitionedRelationsCache, RelationsCache
 from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
 
 import random
+import threading
 import time
 
+from .mock_adapter import adapter_factory
+
 
 def make_relation(database, schema, identifier):
     return BaseRelation.create(database=database, schema=schema,
@@ -19,8 +22,10 @@ def make_mock_relationship(database, schema, identifier):
 
 
 class TestCache(TestCase):
+    cache_cls = RelationsCache
+
     def setUp(self):
-        self.cache = RelationsCache()
+        self.cache = self.cache_cls()
 
     def assert_relations_state(self, database, schema, identifiers):
         relations = self.cache.get_relations(database, schema)
@@ -264,8 +269,10 @@ class TestAdd(TestCache):
 
 
 class TestLikeDbt(TestCase):
+    cache_cls = RelationsCache
+
     def setUp(self):
-        self.cache = RelationsCache()
+        self.cache = self.cache_cls()
         self._sleep = True
 
         # add a bunch of cache entries
@@ -395,8 +402,10 @@ class TestLikeDbt(TestCase):
 
 
 class TestComplexCache(TestCase):
+    cache_cls = RelationsCache
+
     def setUp(self):
-        self.cache = RelationsCache()
+        self.cache = self.cache_cls()
         inputs = [
             ('dbt', 'foo', 'table1'),
             ('dbt', 'foo', 'table3'),
@@ -489,3 +498,229 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+# the same tests, against the cache that's partitioned by schema
+class TestPartitionedEmpty(TestEmpty):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedDrop(TestDrop):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedAddLink(TestAddLink):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedRename(TestRename):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedGetRelations(TestGetRelations):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedAdd(TestAdd):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedLikeDbt(TestLikeDbt):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedComplexCache(TestComplexCache):
+    cache_cls = PartitionedRelationsCache
+
+
+class TestPartitionedStress(TestCase):
+    schemas = ['schema_{}'.format(i) for i in range(8)]
+
+    def populate(self, cache):
+        for schema in self.schemas:
+            for ident in ('base', 'a', 'b', 'moved'):
+                cache.add(make_relation('dbt', schema, ident))
+            # b is a view on a
+            cache.add_link(make_relation('dbt', schema, 'a'), make_relation('dbt', schema, 'b'))
+        # and every base has a view on it in the next schema
+        for index, schema in enumerate(self.schemas):
+            other = self.schemas[(index + 1) % len(self.schemas)]
+            view = make_relation('dbt', other, 'view_on_' + schema)
+            cache.add(view)
+            cache.add_link(make_relation('dbt', schema, 'base'), view)
+
+    def work(self, cache, schema, repeat):
+        other = self.schemas[(self.schemas.index(schema) + 1) % len(self.schemas)]
+        for _ in range(repeat):
+            # what a table materialization does, in one schema
+            cache.add(make_relation('dbt', schema, 'a__tmp'))
+            cache.rename(make_relation('dbt', schema, 'a'),
+                         make_relation('dbt', schema, 'a__backup'))
+            cache.rename(make_relation('dbt', schema, 'a__tmp'),
+                         make_relation('dbt', schema, 'a'))
+            # this drops b as well
+            cache.drop(make_relation('dbt', schema, 'a__backup'))
+            cache.add(make_relation('dbt', schema, 'b'))
+            cache.add_link(make_relation('dbt', schema, 'a'), make_relation('dbt', schema, 'b'))
+            # renames of a relation with a view in another schema, and
+            # renames to another schema
+            cache.rename(make_relation('dbt', schema, 'base'),
+                         make_relation('dbt', schema, 'base__renamed'))
+            cache.rename(make_relation('dbt', schema, 'base__renamed'),
+                         make_relation('dbt', schema, 'base'))
+            cache.rename(make_relation('dbt', schema, 'moved'),
+                         make_relation('dbt', other, 'moved_from_' + schema))
+            cache.rename(make_relation('dbt', other, 'moved_from_' + schema),
+                         make_relation('dbt', schema, 'moved'))
+            cache.get_relations('dbt', schema)
+        return schema
+
+    def assert_consistent(self, cache):
+        partitioned = {
+            key: relation
+            for schema, relations in cache.partitions.items()
+            for key, relation in relations.items()
+        }
+        self.assertEqual(partitioned, cache.relations)
+        for schema, relations in cache.partitions.items():
+            for key in relations:
+                self.assertEqual((key.database, key.schema), schema)
+        for key, relation in cache.relations.items():
+            self.assertEqual(relation.key(), key)
+            for dependent_key in relation.referenced_by:
+                self.assertIn(dependent_key, cache.relations)
+                self.assertIn(key, cache._references[dependent_key])
+        for dependent_key, referenced_keys in cache._references.items():
+            for referenced_key in referenced_keys:
+                self.assertIn(dependent_key, cache.relations[referenced_key].referenced_by)
+
+    def test_threaded_updates_are_consistent(self):
+        cache = PartitionedRelationsCache()
+        self.populate(cache)
+        pool = ThreadPool(len(self.schemas))
+        done = list(pool.imap_unordered(lambda schema: self.work(cache, schema, 50), self.schemas))
+        pool.close()
+        pool.join()
+        self.assertEqual(sorted(done), self.schemas)
+
+        self.assert_consistent(cache)
+        # the same updates, one at a time, on a cache with a single lock
+        expected = RelationsCache()
+        self.populate(expected)
+        for schema in self.schemas:
+            self.work(expected, schema, 50)
+        self.assertEqual(cache.dump_graph(), expected.dump_graph())
+        self.assertEqual(cache.schemas, expected.schemas)
+
+    def test_lock_excludes_other_threads(self):
+        cache = PartitionedRelationsCache()
+        with cache.lock:
+            # the thread holding the lock can still update the cache
+            cache.add(make_relation('dbt', 'schema', 'a'))
+            thread = threading.Thread(
+                target=cache.add, args=(make_relation('dbt', 'schema', 'b'),)
+            )
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            self.assertNotIn(('dbt', 'schema', 'b'), cache.relations)
+        thread.join()
+        self.assertIn(('dbt', 'schema', 'b'), cache.relations)
+
+
+class TestLazyAdapterCache(TestCase):
+    def setUp(self):
+        config = mock.MagicMock()
+        config.quoting = {'database': True, 'schema': True, 'identifier': True}
+        self.adapter = adapter_factory()(config)
+        self.responder = self.adapter.responder
+        self.tables = {
+            schema: [make_relation('dbt', schema, name) for name in ('a', 'b')]
+            for schema in ('one', 'two', 'three')
+        }
+        self.responder.list_relations_without_caching.side_effect = self.list_relations
+        self.schema_relations = {
+            make_relation('dbt', schema, None).without_identifier()
+            for schema in ('one', 'two')
+        }
+
+    def list_relations(self, schema_relation):
+        return list(self.tables[schema_relation.schema])
+
+    def listed_schemas(self):
+        return [
+            call.args[0].schema
+            for call in self.responder.list_relations_without_caching.call_args_list
+        ]
+
+    def test_schemas_are_cached_on_first_lookup(self):
+        self.adapter.set_relations_cache(None, required_schemas=self.schema_relations, lazy=True)
+        self.assertEqual(self.listed_schemas(), [])
+
+        self.assertIsNone(self.adapter.get_relation('dbt', 'one', 'c'))
+        self.assertEqual(len(self.adapter.list_relations('dbt', 'one')), 2)
+        self.assertEqual(self.listed_schemas(), ['one'])
+        self.assertIn(('dbt', 'one'), self.adapter.cache)
+        self.assertNotIn(('dbt', 'two'), self.adapter.cache)
+
+        # schemas that aren't part of the run are queried on every lookup
+        self.adapter.list_relations('dbt', 'three')
+        self.adapter.list_relations('dbt', 'three')
+        self.assertEqual(self.listed_schemas(), ['one', 'three', 'three'])
+        self.assertNotIn(('dbt', 'three'), self.adapter.cache)
+
+    def test_cache_updates_fill_the_schema_first(self):
+        self.adapter.set_relations_cache(None, required_schemas=self.schema_relations, lazy=True)
+        self.adapter.cache_added(make_relation('dbt', 'two', 'c'))
+        self.assertEqual(self.listed_schemas(), ['two'])
+        identifiers = {r.identifier for r in self.adapter.list_relations('dbt', 'two')}
+        self.assertEqual(identifiers, {'a', 'b', 'c'})
+        self.assertEqual(self.listed_schemas(), ['two'])
+
+    def test_eager_cache_clears_waiting_schemas(self):
+        self.adapter.set_relations_cache(None, required_schemas=self.schema_relations, lazy=True)
+        self.adapter.set_relations_cache(None, required_schemas=self.schema_relations)
+        self.assertEqual(sorted(self.listed_schemas()), ['one', 'two'])
+        self.adapter.list_relations('dbt', 'one')
+        self.assertEqual(len(self.listed_schemas()), 2)
+
+    def test_concurrent_lookups_query_once(self):
+        self.adapter.set_relations_cache(None, required_schemas=self.schema_relations, lazy=True)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_list_relations(schema_relation):
+            started.set()
+            release.wait()
+            return self.list_relations(schema_relation)
+
+        self.responder.list_relations_without_caching.side_effect = slow_list_relations
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(len(self.adapter.list_relations('dbt', 'one')))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        # give the other threads time to wait on the lookup under way
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [2] * 8)
+        self.assertEqual(self.listed_schemas(), ['one'])
+
+    def test_failed_lookup_is_retried(self):
+        self.adapter.set_relations_cache(None, required_schemas=self.schema_relations, lazy=True)
+        self.responder.list_relations_without_caching.side_effect = dbt.exceptions.RuntimeException(
+            'connection lost'
+        )
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            self.adapter.list_relations('dbt', 'one')
+        self.responder.list_relations_without_caching.side_effect = self.list_relations
+        self.assertEqual(len(self.adapter.list_relations('dbt', 'one')), 2)
+        self.assertIn(('dbt', 'one'), self.adapter.cache)
@@ -0,0 +1,95 @@
+import random
+from unittest import mock
+
+import networkx as nx
+import pytest
+
+from dbt.graph import CompactGraph, Graph, GraphQueue
+
+
+def _random_dag(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 60)
+    dag = nx.gnp_random_graph(size, rng.random() / 4, seed=seed, directed=True)
+    dag = nx.DiGraph([(f'node.{u}', f'node.{v}') for u, v in dag.edges() if u < v])
+    dag.add_nodes_from(f'node.{i}' for i in range(size))
+    return dag
+
+
+def _manifest():
+    manifest = mock.MagicMock()
+    manifest.expect.side_effect = lambda n: mock.MagicMock(unique_id=n)
+    return manifest
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_traversals_match_networkx(seed):
+    dag = _random_dag(seed)
+    compact = CompactGraph.from_networkx(dag)
+    nx_graph = Graph(dag)
+    compact_graph = Graph(compact)
+
+    assert compact_graph.nodes() == nx_graph.nodes()
+    assert set(compact_graph.edges()) == set(nx_graph.edges())
+    assert dict(compact.in_degree()) == dict(dag.in_degree())
+    for node in dag:
+        assert set(compact.successors(node)) == set(dag.successors(node))
+        assert set(compact.predecessors(node)) == set(dag.predecessors(node))
+        assert compact_graph.get_dependent_nodes(node) == nx_graph.get_dependent_nodes(node)
+        for depth in (None, 1, 2):
+            assert compact_graph.ancestors(node, depth) == nx_graph.ancestors(node, depth)
+            assert compact_graph.descendants(node, depth) == nx_graph.descendants(node, depth)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_subgraphs_match_networkx(seed):
+    dag = _random_dag(seed)
+    rng = random.Random(seed)
+    selected = {node for node in dag if rng.random() < 0.3}
+    compact_graph = Graph(CompactGraph.from_networkx(dag))
+    nx_graph = Graph(dag)
+
+    subgraph = compact_graph.subgraph(selected)
+    assert subgraph.nodes() == nx_graph.subgraph(selected).nodes()
+    assert set(subgraph.edges()) == set(nx_graph.subgraph(selected).edges())
+
+    subset = compact_graph.get_subset_graph(selected)
+    assert isinstance(subset.graph, CompactGraph)
+    assert subset.nodes() == nx_graph.get_subset_graph(selected).nodes()
+    assert set(subset.edges()) == set(nx_graph.get_subset_graph(selected).edges())
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_queue_scores_match_networkx(seed):
+    dag = _random_dag(seed)
+    compact = CompactGraph.from_networkx(dag)
+    nodes = set(dag.nodes())
+
+    compact_queue = GraphQueue(compact, _manifest(), nodes)
+    nx_queue = GraphQueue(dag, _manifest(), nodes)
+    assert compact_queue._scores == nx_queue._scores
+
+    timings = {node: random.Random(node).random() for node in nodes}
+    assert (
+        GraphQueue(compact, _manifest(), nodes, timings)._scores
+        == GraphQueue(dag, _manifest(), nodes, timings)._scores
+    )
+
+    order = []
+    while not compact_queue.empty():
+        node = compact_queue.get(block=False).unique_id
+        order.append(node)
+        compact_queue.mark_done(node)
+    assert sorted(order) == sorted(nodes)
+    for source, target in dag.edges():
+        assert order.index(source) < order.index(target)
+
+
+def test_grouped_topological_sort():
+    compact = CompactGraph(['a', 'b', 'c', 'd'], [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd')])
+    assert [sorted(level) for level in compact.grouped_topological_sort()] == [
+        ['a'], ['b', 'c'], ['d']
+    ]
+    assert [sorted(c) for c in CompactGraph(['a', 'b'], []).weakly_connected_components()] == [
+        ['a'], ['b']
+    ]
@@ -0,0 +1,223 @@
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+import dbt.flags as flags
+from dbt.adapters.base.connections import BaseConnectionManager, ConnectionPool
+from dbt.contracts.connection import ConnectionState
+from dbt.events.types import PooledConnectionReused
+
+
+class FakeCursor:
+    def __init__(self, handle):
+        self.handle = handle
+
+    def execute(self, sql):
+        if self.handle.broken:
+            raise FakeDriver.Error('server closed the connection')
+        self.handle.statements.append(sql)
+        if sql.startswith('set role '):
+            self.handle.role = sql[len('set role '):]
+        elif sql == 'begin':
+            self.handle.in_transaction = True
+
+
+class FakeHandle:
+    """A DB-API connection that records what it's asked to do."""
+    def __init__(self, driver):
+        self.driver = driver
+        self.closed = False
+        self.broken = False
+        self.role = None
+        self.in_transaction = False
+        self.statements = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        if self.broken:
+            raise FakeDriver.Error('server closed the connection')
+        self.in_transaction = False
+
+    def commit(self):
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+        self.driver.closed += 1
+
+
+class FakeDriver:
+    class Error(Exception):
+        pass
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.closed = 0
+
+    def connect(self):
+        with self.lock:
+            self.opened += 1
+        return FakeHandle(self)
+
+
+class FakeConnectionManager(BaseConnectionManager):
+    TYPE = 'fake'
+    driver = None
+
+    @contextmanager
+    def exception_handler(self, sql):
+        yield
+
+    def cancel_open(self):
+        return []
+
+    @classmethod
+    def open(cls, connection):
+        connection.handle = cls.driver.connect()
+        connection.state = ConnectionState.OPEN
+        return connection
+
+    @classmethod
+    def reset(cls, connection):
+        handle = connection.handle
+        try:
+            handle.rollback()
+            handle.cursor().execute('set role dbt')
+        except FakeDriver.Error:
+            return False
+        connection.transaction_open = False
+        return True
+
+    def begin(self):
+        connection = self.get_thread_connection()
+        connection.handle.cursor().execute('begin')
+        connection.transaction_open = True
+
+    def commit(self):
+        connection = self.get_thread_connection()
+        connection.handle.commit()
+        connection.transaction_open = False
+
+    def execute(self, sql, auto_begin=False, fetch=False):
+        self.get_thread_connection().handle.cursor().execute(sql)
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.driver = FakeDriver()
+        self.profile = mock.MagicMock(threads=4)
+        self.connections = self.make_manager(FakeConnectionManager)
+        self.reuse = flags.REUSE_CONNECTIONS
+        flags.REUSE_CONNECTIONS = True
+
+    def tearDown(self):
+        flags.REUSE_CONNECTIONS = self.reuse
+
+    def make_manager(self, manager_cls):
+        manager_cls = type('Manager', (manager_cls,), {'driver': self.driver})
+        return manager_cls(self.profile)
+
+    def run_node(self, connections, name, sql='select 1'):
+        connections.set_connection_name(name)
+        connections.begin()
+        connections.execute(sql)
+        connections.release()
+
+    def run_nodes(self, connections, count):
+        names = iter(f'model.test.model_{index}' for index in range(count))
+        lock = threading.Lock()
+
+        def work():
+            while True:
+                with lock:
+                    name = next(names, None)
+                if name is None:
+                    return
+                self.run_node(connections, name)
+
+        threads = [threading.Thread(target=work) for _ in range(self.profile.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        connections.cleanup_all()
+
+    def test_handles_are_reused_across_threads(self):
+        self.run_nodes(self.connections, 200)
+        pool = self.connections.pool
+        self.assertLessEqual(self.driver.opened, self.profile.threads)
+        self.assertEqual(pool.opened, self.driver.opened)
+        self.assertEqual(pool.opened + pool.reused, 200)
+        # every handle is closed once the run is cleaned up
+        self.assertEqual(self.driver.closed, self.driver.opened)
+
+    def test_no_reuse_without_reset(self):
+        class NoResetManager(FakeConnectionManager):
+            @classmethod
+            def reset(cls, connection):
+                return False
+
+        connections = self.make_manager(NoResetManager)
+        self.run_nodes(connections, 20)
+        self.assertEqual(self.driver.opened, 20)
+        self.assertEqual(connections.pool.reused, 0)
+
+    def test_no_reuse_with_flag_disabled(self):
+        flags.REUSE_CONNECTIONS = False
+        self.run_nodes(self.connections, 20)
+        self.assertEqual(self.driver.opened, 20)
+        self.assertEqual(self.connections.pool.reused, 0)
+
+    def test_released_handle_is_reset(self):
+        connection = self.connections.set_connection_name('model.test.a')
+        self.connections.begin()
+        handle = connection.handle
+        handle.role = 'other'
+        self.connections.release()
+        self.assertIsNone(connection._handle)
+        self.assertEqual(connection.state, ConnectionState.CLOSED)
+        self.assertFalse(handle.in_transaction)
+        self.assertEqual(handle.role, 'dbt')
+
+        with mock.patch('dbt.adapters.base.connections.fire_event') as fire_event:
+            connection = self.connections.set_connection_name('model.test.b')
+            self.assertIs(connection.handle, handle)
+        self.assertEqual(connection.state, ConnectionState.OPEN)
+        events = [call.args[0] for call in fire_event.call_args_list]
+        self.assertIn(PooledConnectionReused(conn_name='model.test.b'), events)
+
+    def test_broken_handle_is_closed(self):
+        connection = self.connections.set_connection_name('model.test.a')
+        handle = connection.handle
+        handle.broken = True
+        self.connections.release()
+        self.assertTrue(handle.closed)
+
+        connection = self.connections.set_connection_name('model.test.b')
+        self.assertIsNot(connection.handle, handle)
+        self.assertEqual(self.driver.opened, 2)
+
+    def test_idle_handle_is_evicted(self):
+        self.connections.pool.max_idle = -1
+        connection = self.connections.set_connection_name('model.test.a')
+        handle = connection.handle
+        self.connections.release()
+        self.assertFalse(handle.closed)
+
+        connection = self.connections.set_connection_name('model.test.b')
+        self.assertIsNot(connection.handle, handle)
+        self.assertTrue(handle.closed)
+        self.assertEqual(self.connections.pool.reused, 0)
+
+    def test_pool_is_bounded(self):
+        pool = ConnectionPool(max_size=2, max_idle=60)
+        handles = [FakeHandle(self.driver) for _ in range(3)]
+        self.assertEqual([pool.put(handle) for handle in handles], [True, True, False])
+        self.assertIs(pool.take(), handles[1])
+        self.assertIs(pool.take(), handles[0])
+        self.assertIsNone(pool.take())
+        self.assertEqual(pool.reused, 2)
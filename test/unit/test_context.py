@@ -9,7 +9,7 @@ import pytest
 from dbt.adapters import postgres
 from dbt.adapters import factory
 from dbt.adapters.base import AdapterConfig
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import MacroGenerator, MacroStack, get_rendered
 from dbt.contracts.graph.parsed import (
     ParsedModelNode,
     NodeConfig,
@@ -477,3 +477,75 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result["dbt"]["some_macro"].macro is pg_macro
         assert result["root"]["some_macro"].macro is package_macro
         assert result["some_macro"].macro is package_macro
+
+
+def real_macro(name, package_name, macro_sql):
+    return ParsedMacro(
+        name=name,
+        resource_type=NodeType.Macro,
+        unique_id=f"macro.{package_name}.{name}",
+        package_name=package_name,
+        original_file_path="macros/macro.sql",
+        root_path="/usr/src/app",
+        path="macros/macro.sql",
+        macro_sql=macro_sql,
+    )
+
+
+@pytest.fixture
+def real_manifest_fx(config_postgres):
+    from dbt.contracts.graph.manifest import Manifest
+
+    macro_list = [
+        real_macro("macro_a", "root", "{% macro macro_a() %}a{{ macro_b() }}{% endmacro %}"),
+        real_macro("macro_b", "root", "{% macro macro_b() %}b{% endmacro %}"),
+        real_macro("macro_c", "dbt", "{% macro macro_c() %}c{% endmacro %}"),
+    ]
+    return Manifest(macros={macro.unique_id: macro for macro in macro_list})
+
+
+def test_shared_macro_namespace(config_postgres, real_manifest_fx, get_adapter, get_include_paths):
+    model_one, model_two = mock_model(), mock_model()
+    ctx_one = providers.generate_runtime_model_context(
+        model_one, config_postgres, real_manifest_fx
+    )
+    ctx_two = providers.generate_runtime_model_context(
+        model_two, config_postgres, real_manifest_fx
+    )
+    # both contexts use the same shared macros, and no macro is bound yet
+    assert isinstance(ctx_one["macro_a"], macros.SharedMacro)
+    assert ctx_one["macro_a"] is ctx_two["macro_a"]
+    assert ctx_one["root"] is ctx_two["root"]
+    assert ctx_one.macro_namespace._bound == {}
+
+    rendered = get_rendered("{{ macro_a() }}{{ dbt.macro_c() }}", ctx_one, model_one)
+    assert rendered == "abc"
+    # macros are bound to the context they're called from, and only calls
+    # from the node itself are its dependencies
+    assert model_one.depends_on.macros == ["macro.root.macro_a", "macro.dbt.macro_c"]
+    assert model_two.depends_on.macros == []
+    assert set(ctx_one.macro_namespace._bound) == {
+        "macro.root.macro_a",
+        "macro.root.macro_b",
+        "macro.dbt.macro_c",
+    }
+    assert ctx_two.macro_namespace._bound == {}
+
+    # dispatch looks macros up in the namespace, which binds them
+    macro_func = ctx_two.macro_namespace.get_from_package("dbt", "macro_c")
+    assert isinstance(macro_func, MacroGenerator)
+    assert macro_func.context is ctx_two
+    assert macro_func.node is model_two
+
+
+def test_shared_macro_namespace_cache(config_postgres, real_manifest_fx):
+    namespace = macros.get_shared_namespace(real_manifest_fx, "root", "root", ["dbt"])
+    assert macros.get_shared_namespace(real_manifest_fx, "root", "root", ["dbt"]) is namespace
+    assert macros.get_shared_namespace(real_manifest_fx, "root", "other", ["dbt"]) is not namespace
+
+    # adding a macro invalidates the cached namespaces
+    new_macro = real_macro("macro_d", "root", "{% macro macro_d() %}d{% endmacro %}")
+    real_manifest_fx.add_macro(mock.MagicMock(macros=[]), new_macro)
+    rebuilt = macros.get_shared_namespace(real_manifest_fx, "root", "root", ["dbt"])
+    assert rebuilt is not namespace
+    assert "macro_d" in rebuilt.flat
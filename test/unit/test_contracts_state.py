@@ -0,0 +1,77 @@
+import json
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dbt.contracts.graph.manifest import WritableManifest
+from dbt.contracts.state import HydratingMapping, PreviousState
+from dbt.exceptions import IncompatibleSchemaException
+
+from .test_parallel_parser import ExampleProjectMixin
+
+
+class PreviousStateTest(ExampleProjectMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.state_path = Path(self.root) / 'state'
+        os.makedirs(self.state_path)
+        self.manifest_path = str(self.state_path / 'manifest.json')
+        self.manifest = self.load()
+        self.manifest.writable_manifest().write(self.manifest_path)
+
+    def test_artifacts_are_read_on_first_access(self):
+        with mock.patch.object(
+            WritableManifest, 'read_versioned_dict',
+            wraps=WritableManifest.read_versioned_dict,
+        ) as read, mock.patch('dbt.contracts.state.fire_event') as fire_event:
+            state = PreviousState(self.state_path, self.state_path)
+            read.assert_not_called()
+            manifest = state.manifest
+            self.assertIs(state.manifest, manifest)
+        read.assert_called_once_with(self.manifest_path)
+        self.assertEqual(
+            [call.args[0].path for call in fire_event.call_args_list], [self.manifest_path]
+        )
+        # the other artifacts don't exist
+        self.assertIsNone(state.results)
+        self.assertIsNone(state.sources)
+        self.assertIsNone(state.sources_current)
+        self.assertIsNone(state.catalog)
+
+    def test_entries_are_deserialized_on_first_access(self):
+        state = PreviousState(self.state_path, self.state_path)
+        nodes = state.manifest.nodes
+        self.assertIsInstance(nodes, HydratingMapping)
+        self.assertEqual(list(nodes), list(self.manifest.nodes))
+        self.assertEqual(nodes._values, {})
+
+        unique_id = 'model.test_parse_workers.model_3'
+        node = nodes[unique_id]
+        self.assertIs(nodes[unique_id], node)
+        self.assertEqual(list(nodes._values), [unique_id])
+        self.assertEqual(node.to_dict(), self.manifest.nodes[unique_id].to_dict())
+
+        macro_id = 'macro.dbt.run_query'
+        self.assertEqual(
+            state.manifest.macros.peek(macro_id, 'macro_sql'),
+            self.manifest.macros[macro_id].macro_sql,
+        )
+        self.assertEqual(state.manifest.macros._values, {})
+
+    def test_lazy_manifest_matches_eager_manifest(self):
+        state = PreviousState(self.state_path, self.state_path)
+        eager = WritableManifest.read_and_check_versions(self.manifest_path)
+        self.assertEqual(state.manifest.to_dict(), eager.to_dict())
+
+    def test_incompatible_manifest(self):
+        with open(self.manifest_path) as fp:
+            data = json.load(fp)
+        data['metadata']['dbt_schema_version'] = 'https://schemas.getdbt.com/dbt/manifest/v1.json'
+        with open(self.manifest_path, 'w') as fp:
+            json.dump(data, fp)
+
+        state = PreviousState(self.state_path, self.state_path)
+        with self.assertRaises(IncompatibleSchemaException) as exc:
+            state.manifest
+        self.assertIn(self.manifest_path, str(exc.exception))
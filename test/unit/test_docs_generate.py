@@ -1,11 +1,23 @@
-from datetime import datetime
+import copy
+import os
+import tempfile
+from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 from unittest import mock
 import unittest
 
+import agate
+
 import dbt.flags
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.results import CatalogArtifact, RunResultsArtifact
+from dbt.contracts.state import PreviousState
 from dbt.task import generate
 
+from .test_graph_selector_methods import make_model, make_source
+
 
 class GenerateTest(unittest.TestCase):
     def setUp(self):
@@ -352,3 +364,176 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+
+CATALOG_COLUMNS = (
+    'table_database', 'table_schema', 'table_name', 'table_type', 'table_comment',
+    'table_owner', 'column_name', 'column_index', 'column_type', 'column_comment',
+)
+
+
+def catalog_rows(tables, column_type='integer'):
+    return [
+        (database, schema, name, 'BASE TABLE', None, 'dbt', 'id', Decimal('1'), column_type, None)
+        for database, schema, name in tables
+    ]
+
+
+class IncrementalCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.model_a = make_model('pkg', 'model_a', 'select 1')
+        self.model_b = make_model('pkg', 'model_b', 'select 1').replace(schema='schema_b')
+        self.source = make_source('pkg', 'raw', 'source_c').replace(schema='schema_c')
+        self.manifest = self.make_manifest([self.model_a, self.model_b], [self.source])
+
+        self.state = PreviousState(
+            path=Path('/path/does/not/exist'), current_path=Path('/path/does/not/exist')
+        )
+        self.state.manifest = copy.deepcopy(self.manifest).writable_manifest()
+        self.generated_at = datetime(2022, 1, 1)
+        self.previous = self.make_full_catalog(
+            [('dbt', 'dbt_schema', 'model_a'), ('dbt', 'schema_b', 'model_b'),
+             ('dbt', 'schema_c', 'source_c')],
+            column_type='text',
+        )
+
+        self.task = generate.GenerateTask.__new__(generate.GenerateTask)
+        self.task.manifest = self.manifest
+        self.task.previous_state = self.state
+
+        self.adapter = mock.MagicMock()
+        self.adapter.get_catalog_for_schemas.side_effect = self.get_catalog_for_schemas
+
+    @staticmethod
+    def make_manifest(nodes, sources):
+        return Manifest(
+            nodes={n.unique_id: n for n in nodes},
+            sources={s.unique_id: s for s in sources},
+            macros={}, docs={}, files={}, exposures={}, metrics={}, disabled=[], selectors={},
+        )
+
+    def make_full_catalog(self, tables, column_type='integer'):
+        catalog = generate.Catalog([
+            dict(zip(CATALOG_COLUMNS, row)) for row in catalog_rows(tables, column_type)
+        ])
+        nodes, sources = catalog.make_unique_id_map(self.manifest)
+        artifact = CatalogArtifact.from_results(
+            generated_at=self.generated_at, nodes=nodes, sources=sources,
+            compile_results=None, errors=None,
+        )
+        # as read from catalog.json
+        return CatalogArtifact.from_dict(artifact.to_dict(omit_none=False))
+
+    def get_catalog_for_schemas(self, manifest, schemas):
+        # every relation in the database now has an integer id
+        tables = [
+            ('dbt', 'dbt_schema', 'model_a'), ('dbt', 'schema_b', 'model_b'),
+            ('dbt', 'schema_c', 'source_c'),
+        ]
+        rows = catalog_rows([t for t in tables if (t[0], t[1]) in schemas])
+        return agate.Table(rows, CATALOG_COLUMNS), []
+
+    def make_run_results(self, unique_ids, which='run', generated_at=None):
+        if generated_at is None:
+            generated_at = self.generated_at + timedelta(hours=1)
+        return RunResultsArtifact.from_dict({
+            'metadata': {
+                'dbt_schema_version': str(RunResultsArtifact.dbt_schema_version),
+                'generated_at': generated_at.isoformat() + 'Z',
+            },
+            'results': [
+                {
+                    'unique_id': unique_id, 'status': 'success', 'timing': [],
+                    'thread_id': 'Thread-1', 'execution_time': 1.0, 'adapter_response': {},
+                    'message': None, 'failures': None,
+                }
+                for unique_id in unique_ids
+            ],
+            'elapsed_time': 1.0,
+            'args': {'which': which},
+        })
+
+    def build(self, run_results=()):
+        catalog, exceptions = self.task._get_catalog(
+            self.adapter, self.previous, list(run_results)
+        )
+        self.assertEqual(exceptions, [])
+        nodes, sources = catalog.make_unique_id_map(self.manifest)
+        return {
+            unique_id: table.to_dict(omit_none=False)
+            for unique_id, table in {**nodes, **sources}.items()
+        }
+
+    def queried_schemas(self):
+        return self.adapter.get_catalog_for_schemas.call_args[0][1]
+
+    def column_types(self, catalog):
+        return {unique_id: table['columns']['id']['type'] for unique_id, table in catalog.items()}
+
+    def test_nothing_changed(self):
+        catalog = self.build()
+        self.assertEqual(self.queried_schemas(), set())
+        previous = {
+            unique_id: table.to_dict(omit_none=False)
+            for unique_id, table in {**self.previous.nodes, **self.previous.sources}.items()
+        }
+        self.assertEqual(catalog, previous)
+
+    def test_modified_node(self):
+        self.manifest.nodes[self.model_b.unique_id] = self.model_b.replace(raw_sql='select 2')
+        catalog = self.build()
+        self.assertEqual(self.queried_schemas(), {('dbt', 'schema_b')})
+        self.assertEqual(self.column_types(catalog), {
+            'model.pkg.model_a': 'text',
+            'model.pkg.model_b': 'integer',
+            'source.pkg.raw.source_c': 'text',
+        })
+
+    def test_new_node(self):
+        model_d = make_model('pkg', 'model_d', 'select 1').replace(schema='schema_c')
+        self.manifest.nodes[model_d.unique_id] = model_d
+        self.build()
+        self.assertEqual(self.queried_schemas(), {('dbt', 'schema_c')})
+
+    def test_relation_missing_from_previous_catalog(self):
+        del self.previous.sources[self.source.unique_id]
+        catalog = self.build()
+        self.assertEqual(self.queried_schemas(), {('dbt', 'schema_c')})
+        self.assertEqual(catalog[self.source.unique_id]['columns']['id']['type'], 'integer')
+
+    def test_run_results(self):
+        catalog = self.build([self.make_run_results([self.model_a.unique_id]), None])
+        self.assertEqual(self.queried_schemas(), {('dbt', 'dbt_schema')})
+        self.assertEqual(self.column_types(catalog), {
+            'model.pkg.model_a': 'integer',
+            'model.pkg.model_b': 'text',
+            'source.pkg.raw.source_c': 'text',
+        })
+
+    def test_run_results_not_since_previous_catalog(self):
+        self.build([
+            self.make_run_results([self.model_a.unique_id], generated_at=self.generated_at),
+            self.make_run_results([self.model_b.unique_id], which='compile'),
+        ])
+        self.assertEqual(self.queried_schemas(), set())
+
+    def test_adapter_overriding_get_catalog(self):
+        class Adapter(PostgresAdapter):
+            def get_catalog(self, manifest):
+                rows = catalog_rows([('dbt', 'schema_b', 'model_b')])
+                return agate.Table(rows, CATALOG_COLUMNS), []
+
+        adapter = Adapter.__new__(Adapter)
+        with mock.patch.object(Adapter, 'get_catalog_for_schemas') as get_catalog_for_schemas:
+            catalog, _ = self.task._get_catalog(adapter, self.previous, [])
+        get_catalog_for_schemas.assert_not_called()
+        # the previous catalog isn't reused
+        self.assertEqual(list(catalog), [generate.CatalogKey('dbt', 'schema_b', 'model_b')])
+
+    def test_unreadable_run_results(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            self.task.config = mock.MagicMock(target_path=target_path)
+            path = os.path.join(target_path, 'run_results.json')
+            with open(path, 'w') as fp:
+                fp.write('{"metadata": {"dbt_schema_version": ')
+            self.assertIsNone(self.task._read_run_results())
@@ -2,6 +2,7 @@ from dbt.adapters.reference_keys import _ReferenceKey
 from dbt.events.test_types import UnitTestInfo
 from dbt.events import AdapterLogger
 from dbt.events.functions import event_to_serializable_dict
+from dbt.events.history import EventHistory, EventRecord, read_event_history
 from dbt.events.base_types import NodeInfo
 from dbt.events.types import *
 from dbt.events.test_types import *
@@ -11,9 +12,14 @@ from importlib import reload
 import dbt.events.functions as event_funcs
 import dbt.flags as flags
 from dbt.helper_types import Lazy
+from datetime import datetime
 import inspect
 import json
-from unittest import TestCase
+import logging
+import os
+import tempfile
+import threading
+from unittest import TestCase, mock
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn
 )
@@ -119,9 +125,9 @@ class TestEventBuffer(TestCase):
         self.assertTrue(
             event_funcs.EVENT_HISTORY.count(event_full) == 1
         )
-        self.assertTrue(
-             event_funcs.EVENT_HISTORY.count(UnitTestInfo(msg='Test Event 1', code='T006')) == 0
-         )
+        records = [(record.code, record.msg) for record in event_funcs.EVENT_HISTORY]
+        self.assertNotIn(('T006', 'Unit Test: Test Event 1'), records)
+        self.assertEqual(records[0], ('T006', 'Unit Test: Test Event 2'))
 
 def MockNode():
     return ParsedModelNode(
@@ -193,6 +199,7 @@ sample_values = [
     MacroEventDebug(msg=""),
     NewConnection(conn_type="", conn_name=""),
     ConnectionReused(conn_name=""),
+    PooledConnectionReused(conn_name=""),
     ConnectionLeftOpen(conn_name=""),
     ConnectionClosed(conn_name=""),
     RollbackFailed(conn_name=""),
@@ -201,6 +208,8 @@ sample_values = [
     Rollback(conn_name=""),
     CacheMiss(conn_name="", database="", schema=""),
     ListRelations(database="", schema="", relations=[]),
+    CacheSchemaLazily(conn_name="", database="", schema="", num_relations=0),
+    ConnectionCounts(opened=0, reused=0),
     ConnectionUsed(conn_type="", conn_name=""),
     SQLQuery(conn_name="", sql=""),
     SQLQueryStatus(status="", elapsed=0.1),
@@ -285,6 +294,8 @@ sample_values = [
     PartialParsingDeletedExposure(unique_id=''),
     InvalidDisabledSourceInTestNode(msg=''),
     InvalidRefInTestNode(msg=''),
+    ParseWorkersFallback(parser='', reason=''),
+    StateArtifactLoaded(path='', elapsed=0.0),
     RunningOperationCaughtError(exc=''),
     RunningOperationUncaughtError(exc=Exception('')),
     DbtProjectError(),
@@ -318,6 +329,9 @@ sample_values = [
     CatalogWritten(path=''),
     CannotGenerateDocs(),
     BuildingCatalog(),
+    BuildingCatalogIncrementally(num_schemas=0, num_reused=0),
+    IncrementalCatalogFallback(reason=""),
+    FreshnessBatchFailed(num_sources=0, exc=""),
     CompileComplete(),
     FreshnessCheckComplete(),
     ServingDocsPort(address='', port=0),
@@ -368,6 +382,7 @@ sample_values = [
     NodeFinished(unique_id='', node_info={}, run_result={}),
     QueryCancelationUnsupported(type=''),
     ConcurrencyLine(num_threads=0, target_name=''),
+    CriticalPathMakespan(predicted=0.0, actual=0.0, untimed_nodes=0),
     StarterProjectPath(dir=''),
     ConfigFolderDirectory(dir=''),
     NoSampleProfileFound(adapter=''),
@@ -425,6 +440,250 @@ sample_values = [
 ]
 
 
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestEventLogWriter(TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger('test_event_log_writer')
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.handler = ListHandler()
+        self.logger.handlers = [self.handler]
+
+    def lines(self):
+        return [line for r in self.handler.records for line in r.getMessage().split('\n')]
+
+    def test_secret_scrubber(self):
+        scrubber = event_funcs.SecretScrubber(['abc', 'abcdef', ''])
+        self.assertEqual(scrubber('x abcdef abc a.c'), 'x ***** ***** a.c')
+        self.assertEqual(event_funcs.SecretScrubber([])('abc'), 'abc')
+
+    def test_events_from_many_threads(self):
+        scrubber = event_funcs.SecretScrubber(['hunter2'])
+        writer = event_funcs.EventLogWriter(self.logger, scrubber)
+
+        def fire(name):
+            for n in range(50):
+                writer.put(SQLQuery(conn_name=name, sql=f'select {n} -- hunter2'))
+
+        threads = [threading.Thread(target=fire, args=(f'worker-{i}',), name=f'worker-{i}') for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        lines = self.lines()
+        self.assertEqual(len(lines), 200)
+        for i in range(4):
+            name = f'worker-{i}'
+            fired = [line for line in lines if f'On {name}:' in line]
+            # the thread name is the one the event was fired on
+            self.assertTrue(all(f'[{name}  ]:' in line for line in fired))
+            self.assertEqual(
+                [line.split('On ')[1] for line in fired],
+                [f'{name}: select {n} -- *****' for n in range(50)]
+            )
+
+    def test_queued_events_are_written_together(self):
+        writing = threading.Event()
+        release = threading.Event()
+        emit = self.handler.emit
+
+        def blocking_emit(record):
+            writing.set()
+            release.wait()
+            emit(record)
+
+        self.handler.emit = blocking_emit
+        writer = event_funcs.EventLogWriter(self.logger, event_funcs.SecretScrubber([]))
+        writer.put(SQLQuery(conn_name='main', sql='select 0'))
+        writing.wait()
+        for n in range(1, 11):
+            writer.put(SQLQuery(conn_name='main', sql=f'select {n}'))
+        release.set()
+        writer.flush()
+
+        self.assertEqual(len(self.handler.records), 2)
+        self.assertEqual(len(self.lines()), 11)
+        writer.close()
+
+
+class TestAsyncLogging(TestCase):
+
+    def setUp(self):
+        self.file_log = event_funcs.FILE_LOG
+        self.stdout_log = event_funcs.STDOUT_LOG
+        self.handlers = (list(self.file_log.handlers), list(self.stdout_log.handlers))
+        self.log_path = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        event_funcs.close_event_log_writer()
+        for handler in event_funcs.FILE_LOG.handlers:
+            handler.close()
+        event_funcs.FILE_LOG.handlers = []
+        event_funcs.STDOUT_LOG.handlers = []
+        event_funcs.FILE_LOG = self.file_log
+        event_funcs.STDOUT_LOG = self.stdout_log
+        self.file_log.handlers, self.stdout_log.handlers = self.handlers
+        self.log_path.cleanup()
+
+    def read_log(self):
+        with open(os.path.join(self.log_path.name, 'dbt.log')) as fp:
+            return fp.read()
+
+    @mock.patch.dict(os.environ, {'DBT_ENV_SECRET_PASSWORD': 'hunter2'})
+    @mock.patch.object(flags, 'ASYNC_LOGGING', True)
+    def test_file_log_is_written_by_writer(self):
+        event_funcs.setup_event_logger(self.log_path.name)
+        writer = event_funcs.EVENT_LOG_WRITER
+        self.assertIsInstance(writer, event_funcs.EventLogWriter)
+
+        with mock.patch.object(writer, 'flush', wraps=writer.flush) as flush:
+            event_funcs.fire_event(SQLQuery(conn_name='main', sql='select hunter2'))
+            flush.assert_not_called()
+            # errors are written right away
+            event_funcs.fire_event(RunResultError(msg='failed'))
+            flush.assert_called_once()
+        log = self.read_log()
+        self.assertIn('On main: select *****', log)
+        self.assertIn('failed', log)
+
+        event_funcs.fire_event(SQLQuery(conn_name='main', sql='select 2'))
+        event_funcs.close_event_log_writer()
+        self.assertIsNone(event_funcs.EVENT_LOG_WRITER)
+        self.assertIn('On main: select 2', self.read_log())
+
+    @mock.patch.object(flags, 'ASYNC_LOGGING', False)
+    def test_file_log_is_written_synchronously(self):
+        event_funcs.setup_event_logger(self.log_path.name)
+        self.assertIsNone(event_funcs.EVENT_LOG_WRITER)
+        event_funcs.fire_event(SQLQuery(conn_name='main', sql='select 1'))
+        self.assertIn('On main: select 1', self.read_log())
+
+    @mock.patch.dict(os.environ, {'DBT_ENV_SECRET_PASSWORD': 'hunter2'})
+    @mock.patch.object(flags, 'WRITE_EVENT_HISTORY', True)
+    @mock.patch.object(flags, 'EVENT_BUFFER_SIZE', 2)
+    def test_event_history_is_written_to_target(self):
+        target_path = os.path.join(self.log_path.name, 'target')
+        event_funcs.setup_event_logger(self.log_path.name, target_path=target_path)
+        for n in range(3):
+            event_funcs.fire_event(SQLQuery(conn_name='main', sql=f'select {n} -- hunter2'))
+        event_funcs.close_event_history()
+
+        codes = [record.code for record in event_funcs.EVENT_HISTORY]
+        self.assertEqual(codes, ['Z048', 'E016'])
+        records = list(read_event_history(os.path.join(target_path, 'event_history.jsonl')))
+        # every event is written, including the ones dropped from the buffer
+        self.assertEqual([r.code for r in records], ['E016', 'E016', 'Z048', 'E016'])
+        self.assertEqual(records[0].msg, 'On main: select 0 -- *****')
+        self.assertEqual(records[0].data, {'conn_name': 'main', 'sql': 'select 0 -- *****'})
+
+
+class TestEventHistory(TestCase):
+
+    def event(self, n):
+        return event_to_serializable_dict(SQLQuery(conn_name='main', sql=f'select {n}'))
+
+    def append(self, history, event, on_full):
+        history.append(event)
+        history.flush()
+        return on_full.call_count
+
+    def test_oldest_events_are_dropped(self):
+        events = [self.event(n) for n in range(5)]
+        sizes = [len(json.dumps(event, separators=(',', ':'))) for event in events]
+        on_full = mock.Mock()
+        history = EventHistory(max_events=100, max_bytes=sum(sizes[:3]), on_full=on_full)
+        self.assertEqual([self.append(history, event, on_full) for event in events],
+                         [0, 0, 1, 1, 1])
+        self.assertEqual([record.msg for record in history],
+                         ['On main: select 2', 'On main: select 3', 'On main: select 4'])
+        self.assertEqual(history.size, sum(sizes[2:]))
+        self.assertEqual(history[-1], EventRecord(json.dumps(events[4], separators=(',', ':')).encode()))
+        self.assertEqual(history.count(history[0]), 1)
+
+        on_full = mock.Mock()
+        history = EventHistory(max_events=2, max_bytes=1000, on_full=on_full)
+        self.assertEqual([self.append(history, self.event(n), on_full) for n in range(3)], [0, 1, 1])
+        self.assertEqual(len(history), 2)
+
+    def test_events_are_serialized_on_history_thread(self):
+        threads = []
+
+        def serialize(e, ts, thread_name):
+            threads.append(threading.current_thread().name)
+            return event_to_serializable_dict(e, ts, thread_name)
+
+        history = EventHistory(100, 10000, serialize=serialize)
+        fired_at = datetime(2022, 1, 1)
+        history.append_event(SQLQuery(conn_name='main', sql='select 1'), fired_at, 'Thread-1')
+        (record,) = history
+        history.close()
+        self.assertEqual(threads, ['EventHistory'])
+        self.assertEqual(record.msg, 'On main: select 1')
+        self.assertEqual(record.to_dict()['thread_name'], 'Thread-1')
+        self.assertEqual(record.to_dict()['ts'], '2022-01-01T00:00:00.000000Z')
+
+    def test_full_queue_serializes_on_firing_thread(self):
+        threads = []
+        serializing = threading.Event()
+        serialized_by_firing_thread = threading.Event()
+        release = threading.Event()
+
+        def serialize(e, ts, thread_name):
+            name = threading.current_thread().name
+            threads.append(name)
+            if name == 'EventHistory':
+                serializing.set()
+                release.wait()
+            else:
+                serialized_by_firing_thread.set()
+            return event_to_serializable_dict(e, ts, thread_name)
+
+        def fire(n):
+            history.append_event(SQLQuery(conn_name='main', sql=f'select {n}'), datetime(2022, 1, 1), 'Thread-1')
+
+        with mock.patch.object(EventHistory, 'MAX_QUEUED_EVENTS', 2):
+            history = EventHistory(100, 10000, serialize=serialize)
+        fire(0)
+        serializing.wait()
+        fire(1)
+        fire(2)
+        # the queue is full, so this event is serialized before it's queued
+        firing = threading.Thread(target=fire, args=(3,), name='Firing')
+        firing.start()
+        serialized_by_firing_thread.wait()
+        release.set()
+        firing.join()
+        self.assertEqual([record.msg for record in history], [f'On main: select {n}' for n in range(4)])
+        history.close()
+        self.assertEqual(threads, ['EventHistory', 'Firing', 'EventHistory', 'EventHistory'])
+
+    def test_events_are_written_to_file(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            path = os.path.join(target_path, 'event_history.jsonl')
+            history = EventHistory(1, 1000, lambda msg: msg.replace('select', '******'), path)
+            for n in range(3):
+                history.append(self.event(n))
+            history.close()
+            # a process that didn't exit cleanly may have written part of a line
+            with open(path, 'ab') as fp:
+                fp.write(b'{"code": ')
+
+            records = list(read_event_history(path))
+        self.assertEqual([r.msg for r in records], [f'On main: ****** {n}' for n in range(3)])
+        self.assertEqual(list(history), records[2:])
+
+
 class TestEventJSONSerialization(TestCase):
 
     # attempts to test that every event is serializable to json.
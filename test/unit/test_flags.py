@@ -94,6 +94,21 @@ class TestFlags(TestCase):
         delattr(self.args, 'partial_parse')
         self.user_config.partial_parse = False
 
+        # partial_parse_file_stat
+        self.user_config.partial_parse_file_stat = False
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARTIAL_PARSE_FILE_STAT, False)
+        os.environ['DBT_PARTIAL_PARSE_FILE_STAT'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARTIAL_PARSE_FILE_STAT, True)
+        setattr(self.args, 'partial_parse_file_stat', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARTIAL_PARSE_FILE_STAT, False)
+        # cleanup
+        os.environ.pop('DBT_PARTIAL_PARSE_FILE_STAT')
+        delattr(self.args, 'partial_parse_file_stat')
+        self.user_config.partial_parse_file_stat = None
+
         # use_colors
         self.user_config.use_colors = True
         flags.set_from_args(self.args, self.user_config)
@@ -201,6 +216,43 @@ class TestFlags(TestCase):
         delattr(self.args, 'printer_width')
         self.user_config.printer_width = None
 
+        # event_buffer_bytes
+        os.environ['DBT_EVENT_BUFFER_BYTES'] = '1024'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_BUFFER_BYTES, 1024)
+        setattr(self.args, 'event_buffer_bytes', '2048')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_BUFFER_BYTES, 2048)
+        # cleanup
+        os.environ.pop('DBT_EVENT_BUFFER_BYTES')
+        delattr(self.args, 'event_buffer_bytes')
+
+        # write_event_history
+        os.environ['DBT_WRITE_EVENT_HISTORY'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.WRITE_EVENT_HISTORY, True)
+        setattr(self.args, 'write_event_history', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.WRITE_EVENT_HISTORY, False)
+        # cleanup
+        os.environ.pop('DBT_WRITE_EVENT_HISTORY')
+        delattr(self.args, 'write_event_history')
+
+        # parse_workers
+        self.user_config.parse_workers = 4
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 4)
+        os.environ['DBT_PARSE_WORKERS'] = '2'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 2)
+        setattr(self.args, 'parse_workers', '8')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 8)
+        # cleanup
+        os.environ.pop('DBT_PARSE_WORKERS')
+        delattr(self.args, 'parse_workers')
+        self.user_config.parse_workers = None
+
         # indirect_selection
         self.user_config.indirect_selection = 'eager'
         flags.set_from_args(self.args, self.user_config)
@@ -250,3 +302,78 @@ class TestFlags(TestCase):
         os.environ.pop('DBT_CACHE_SELECTED_ONLY')
         delattr(self.args, 'cache_selected_only')
         self.user_config.cache_selected_only = False
+
+        # lazy_relation_cache
+        self.user_config.lazy_relation_cache = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LAZY_RELATION_CACHE, True)
+        os.environ['DBT_LAZY_RELATION_CACHE'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LAZY_RELATION_CACHE, False)
+        setattr(self.args, 'lazy_relation_cache', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LAZY_RELATION_CACHE, True)
+        # cleanup
+        os.environ.pop('DBT_LAZY_RELATION_CACHE')
+        delattr(self.args, 'lazy_relation_cache')
+        self.user_config.lazy_relation_cache = False
+
+        # reuse_connections
+        self.user_config.reuse_connections = False
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.REUSE_CONNECTIONS, False)
+        os.environ['DBT_REUSE_CONNECTIONS'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.REUSE_CONNECTIONS, True)
+        setattr(self.args, 'reuse_connections', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.REUSE_CONNECTIONS, False)
+        # cleanup
+        os.environ.pop('DBT_REUSE_CONNECTIONS')
+        delattr(self.args, 'reuse_connections')
+        self.user_config.reuse_connections = None
+
+        # batch_source_freshness
+        self.user_config.batch_source_freshness = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BATCH_SOURCE_FRESHNESS, True)
+        os.environ['DBT_BATCH_SOURCE_FRESHNESS'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BATCH_SOURCE_FRESHNESS, False)
+        setattr(self.args, 'batch_source_freshness', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BATCH_SOURCE_FRESHNESS, True)
+        # cleanup
+        os.environ.pop('DBT_BATCH_SOURCE_FRESHNESS')
+        delattr(self.args, 'batch_source_freshness')
+        self.user_config.batch_source_freshness = None
+
+        # prioritize_critical_path
+        self.user_config.prioritize_critical_path = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PRIORITIZE_CRITICAL_PATH, True)
+        os.environ['DBT_PRIORITIZE_CRITICAL_PATH'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PRIORITIZE_CRITICAL_PATH, False)
+        setattr(self.args, 'prioritize_critical_path', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PRIORITIZE_CRITICAL_PATH, True)
+        # cleanup
+        os.environ.pop('DBT_PRIORITIZE_CRITICAL_PATH')
+        delattr(self.args, 'prioritize_critical_path')
+        self.user_config.prioritize_critical_path = False
+
+        # async_logging
+        self.user_config.async_logging = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, True)
+        os.environ['DBT_ASYNC_LOGGING'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        setattr(self.args, 'async_logging', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, True)
+        # cleanup
+        os.environ.pop('DBT_ASYNC_LOGGING')
+        delattr(self.args, 'async_logging')
+        self.user_config.async_logging = False
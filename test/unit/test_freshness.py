@@ -0,0 +1,103 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pytz
+
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.unparsed import FreshnessThreshold, Time, TimePeriod
+from dbt.exceptions import DatabaseException
+from dbt.task import freshness
+
+from .test_graph_selector_methods import make_source
+
+
+def make_fresh_source(table_name, schema='raw', loaded_at_field='loaded_at', filter=None):
+    return make_source('pkg', 'raw', table_name).replace(
+        schema=schema,
+        loaded_at_field=loaded_at_field,
+        freshness=FreshnessThreshold(
+            warn_after=Time(count=1, period=TimePeriod.hour), filter=filter
+        ),
+    )
+
+
+def freshness_of(age):
+    snapshotted_at = datetime(2022, 1, 1, tzinfo=pytz.UTC)
+    return {'max_loaded_at': snapshotted_at, 'snapshotted_at': snapshotted_at, 'age': age}
+
+
+class FreshnessBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.sources = [
+            make_fresh_source('a'),
+            make_fresh_source('b', filter='id > 0'),
+            make_fresh_source('c', schema='RAW'),
+            make_fresh_source('d', loaded_at_field='updated_at'),
+            make_fresh_source('e', schema='other'),
+            make_source('pkg', 'raw', 'no_freshness').replace(schema='raw'),
+        ]
+        self.manifest = Manifest(
+            nodes={},
+            sources={s.unique_id: s for s in self.sources},
+            macros={}, docs={}, files={}, exposures={}, metrics={}, disabled=[], selectors={},
+        )
+
+        self.task = freshness.FreshnessTask.__new__(freshness.FreshnessTask)
+        self.task.manifest = self.manifest
+        self.task.config = mock.MagicMock(threads=4)
+        self.task.config.args.single_threaded = True
+        self.task.batched_freshness = {}
+
+        self.adapter = mock.MagicMock()
+        self.adapter.Relation.create_from_source.side_effect = lambda source: source.name
+        self.adapter.calculate_freshness_batch.side_effect = self.calculate_freshness_batch
+        self.failing = set()
+
+    def calculate_freshness_batch(self, sources, manifest=None):
+        names = [relation for relation, _, _ in sources]
+        if self.failing.intersection(names):
+            raise DatabaseException('relation "raw.{}" does not exist'.format(names[0]))
+        return [freshness_of(len(name)) for name in names]
+
+    def unique_ids(self, *names):
+        return {f'source.pkg.raw.{name}' for name in names}
+
+    def test_batches(self):
+        batches = self.task.get_freshness_batches(set(self.manifest.sources))
+        # d has another loaded_at_field and e another schema, so they're
+        # checked on their own
+        self.assertEqual([[s.name for s in batch] for batch in batches], [['a', 'b', 'c']])
+
+    def test_batches_are_bounded(self):
+        with mock.patch.object(freshness, 'MAX_BATCH_SIZE', 2):
+            batches = self.task.get_freshness_batches(set(self.manifest.sources))
+        self.assertEqual([[s.name for s in batch] for batch in batches], [['a', 'b']])
+
+    def test_results_are_fanned_out(self):
+        batched = self.task.check_freshness_in_batches(self.adapter, set(self.manifest.sources))
+        self.assertEqual(set(batched), self.unique_ids('a', 'b', 'c'))
+        self.assertEqual(batched['source.pkg.raw.b'], freshness_of(1))
+        sources = self.adapter.calculate_freshness_batch.call_args[0][0]
+        self.assertEqual(sources, [('a', 'loaded_at', None), ('b', 'loaded_at', 'id > 0'),
+                                   ('c', 'loaded_at', None)])
+
+    def test_failed_batch_falls_back_to_single_queries(self):
+        self.failing.add('b')
+        batched = self.task.check_freshness_in_batches(self.adapter, set(self.manifest.sources))
+        self.assertEqual(batched, {})
+
+    def test_runner_uses_batched_freshness(self):
+        source = self.sources[0]
+        runner = freshness.FreshnessRunner(self.task.config, self.adapter, source, 1, 1)
+        runner.batched_freshness = freshness_of(7200)
+        result = runner.execute(source, self.manifest)
+        self.adapter.calculate_freshness.assert_not_called()
+        self.assertEqual(result.status, 'warn')
+        self.assertEqual(result.age, 7200)
+
+        runner.batched_freshness = None
+        self.adapter.calculate_freshness.return_value = freshness_of(0)
+        result = runner.execute(source, self.manifest)
+        self.adapter.calculate_freshness.assert_called_once()
+        self.assertEqual(result.status, 'pass')
@@ -28,8 +28,8 @@ from .utils import config_from_parts_or_dicts, generate_name_macros, inject_plug
 class GraphTest(unittest.TestCase):
 
     def tearDown(self):
-        self.mock_filesystem_search.stop()
-        self.mock_hook_constructor.stop()
+        self.filesystem_search.stop()
+        self.hook_patcher.stop()
         self.load_state_check.stop()
         self.load_source_file_patcher.stop()
         reset_adapters()
@@ -69,10 +69,8 @@ class GraphTest(unittest.TestCase):
         self.mock_filesystem_search.side_effect = mock_filesystem_search
 
         # Create HookParser patcher
-        self.hook_patcher = patch.object(
-            dbt.parser.hooks.HookParser, '__new__'
-        )
-        def create_hook_patcher(cls, project, manifest, root_project):
+        self.hook_patcher = patch('dbt.parser.manifest.HookParser', __name__='HookParser')
+        def create_hook_patcher(project, manifest, root_project):
             result = MagicMock(project=project, manifest=manifest, root_project=root_project)
             result.__iter__.side_effect = lambda: iter([])
             return result
@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+import random
 import string
 import dbt.exceptions
 import dbt.graph.selector as graph_selector
@@ -195,3 +196,56 @@ invalid_specs = [
 def test_invalid_specs(invalid):
     with pytest.raises(dbt.exceptions.RuntimeException):
         graph_selector.SelectionCriteria.from_single_spec(invalid)
+
+
+def _reference_subset_graph(graph, selected):
+    """The original implementation of Graph.get_subset_graph, which removes
+    every unselected node from a copy of the full graph.
+    """
+    new_graph = graph.copy()
+    for node in graph:
+        if node not in selected:
+            source_nodes = [x for x, _ in new_graph.in_edges(node)]
+            target_nodes = [x for _, x in new_graph.out_edges(node)]
+            new_graph.add_edges_from(
+                (source, target)
+                for source in source_nodes
+                for target in target_nodes
+                if source != target
+            )
+            new_graph.remove_node(node)
+    return new_graph
+
+
+def test_subset_graph_preserves_transitive_edges():
+    # Edges: [(X.a, Y.b), (X.a, X.c), (Y.b, Y.d), (Y.b, X.e), (X.c, Y.f), (X.c, X.g)]
+    subset = _get_graph().get_subset_graph(['m.X.a', 'm.Y.d', 'm.X.g'])
+    assert subset.nodes() == {'m.X.a', 'm.Y.d', 'm.X.g'}
+    assert set(subset.edges()) == {('m.X.a', 'm.Y.d'), ('m.X.a', 'm.X.g')}
+
+
+def test_subset_graph_keeps_graph_order():
+    graph = _get_graph()
+    for selected in (['m.X.g', 'm.Y.d', 'm.X.a'], ['m.X.a', 'm.X.g', 'm.Y.d']):
+        subset = graph.get_subset_graph(selected)
+        assert list(subset) == [node for node in graph if node in selected]
+
+
+def test_subset_graph_missing_node():
+    with pytest.raises(ValueError):
+        _get_graph().get_subset_graph(['m.X.a', 'm.X.missing'])
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_subset_graph_matches_reference(seed):
+    rng = random.Random(seed)
+    dag = nx.gnp_random_graph(rng.randint(1, 60), rng.random() / 4, seed=seed, directed=True)
+    dag = nx.DiGraph([(u, v) for u, v in dag.edges() if u < v])
+    dag.add_nodes_from(range(max(dag.nodes(), default=0) + 1))
+    selected = {node for node in dag if rng.random() < 0.3}
+
+    subset = graph_selector.Graph(dag).get_subset_graph(selected)
+    expected = _reference_subset_graph(dag, selected)
+
+    assert subset.nodes() == set(expected.nodes())
+    assert set(subset.edges()) == set(expected.edges())
@@ -616,6 +616,17 @@ def manifest(seed, source, ephemeral_model, view_model, table_model, ext_source,
     return manifest
 
 
+@pytest.fixture(autouse=True, params=['indexed', 'scanned'])
+def selector_index(request):
+    # every selector method test runs with the selector indexes, and with the
+    # methods scanning all nodes instead
+    if request.param == 'indexed':
+        yield
+    else:
+        with mock.patch('dbt.graph.selector_methods.SelectorIndex', return_value=None):
+            yield
+
+
 def search_manifest_using_method(manifest, method, selection):
     selected = method.search(set(manifest.nodes) | set(
         manifest.sources) | set(manifest.exposures) | set(manifest.metrics), selection)
@@ -1121,4 +1132,54 @@ def test_select_state_changed_test_macros_with_upstream_change(manifest, previou
         manifest, method, 'modified') == {'model1', 'model2'}
     assert search_manifest_using_method(
         manifest, method, 'modified.macros') == {'model1', 'model2'}
-    assert not search_manifest_using_method(manifest, method, 'new')
\ No newline at end of file
+    assert not search_manifest_using_method(manifest, method, 'new')
+
+
+def test_select_state_changed_macro_chain(manifest, previous_state):
+    changed_macro = make_macro('dbt', 'changed_macro', 'blablabla')
+    add_macro(manifest, changed_macro)
+    add_macro(previous_state.manifest, changed_macro.replace(macro_sql='something different'))
+
+    # model1 calls a chain of macros that ends in the changed macro, model2
+    # calls a separate chain
+    for chain, last in (('calls_changed', changed_macro), ('unchanged', None)):
+        depends_on_macros = [last.unique_id] if last else []
+        for index in range(5):
+            macro = make_macro(
+                'dbt', f'{chain}_{index}', 'blablabla', depends_on_macros=depends_on_macros
+            )
+            add_macro(manifest, macro)
+            add_macro(previous_state.manifest, macro)
+            depends_on_macros = [macro.unique_id]
+
+    model1 = make_model(
+        'dbt', 'model1', 'blablabla', depends_on_macros=['macro.dbt.calls_changed_4']
+    )
+    model2 = make_model(
+        'dbt', 'model2', 'blablabla', depends_on_macros=['macro.dbt.unchanged_4']
+    )
+    for model in (model1, model2):
+        add_node(manifest, model)
+        add_node(previous_state.manifest, model)
+
+    method = statemethod(manifest, previous_state)
+
+    assert search_manifest_using_method(manifest, method, 'modified.macros') == {'model1'}
+    assert method.affected_macros == {changed_macro.unique_id} | {
+        f'macro.dbt.calls_changed_{index}' for index in range(5)
+    }
+
+
+def test_select_index_is_built_once(manifest):
+    methods = MethodManager(manifest, None)
+    if methods.index is None:
+        pytest.skip('the selector methods scan all nodes')
+    method = methods.get_method('tag', [])
+    with mock.patch.object(
+        methods.index, '_all_targets', wraps=methods.index._all_targets
+    ) as all_targets:
+        assert search_manifest_using_method(manifest, method, 'uses_ephemeral') == {
+            'view_model', 'table_model'}
+        assert not search_manifest_using_method(manifest, method, 'missing')
+        assert methods.get_method('tag', []).index is methods.index
+    all_targets.assert_called_once()
@@ -1,10 +1,14 @@
 from contextlib import contextmanager
+import os
 import pytest
+import tempfile
 import unittest
+from unittest import mock
 import yaml
 
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
+from dbt.clients.jinja import MacroFuzzEnvironment, set_bytecode_cache_path
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException, JinjaRenderingException
 
@@ -791,3 +795,63 @@ if_you_do_this_you_are_awful = '''
 hi
 {% endmaterialization %}
 '''
+
+
+class TestBytecodeCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        set_bytecode_cache_path(self.tempdir.name)
+        self.cache_dir = os.path.join(self.tempdir.name, 'jinja_bytecode')
+
+    def tearDown(self):
+        set_bytecode_cache_path(None)
+        self.tempdir.cleanup()
+
+    def entries(self):
+        return sorted(name for name in os.listdir(self.cache_dir) if name.endswith('.cache'))
+
+    def test_compiled_templates_are_reused(self):
+        source = '{% set doubled = value * 2 %}{{ doubled }}'
+        self.assertEqual(get_rendered(source, {'value': 2}), '4')
+        self.assertEqual(len(self.entries()), 1)
+
+        with mock.patch.object(
+            MacroFuzzEnvironment, '_compile', autospec=True,
+            side_effect=MacroFuzzEnvironment._compile,
+        ) as compile_code:
+            self.assertEqual(get_rendered(source, {'value': 3}), '6')
+            # native rendering compiles differently, so it's cached separately
+            self.assertEqual(get_rendered(source, {'value': 3}, native=True), 6)
+        self.assertEqual(compile_code.call_count, 1)
+        self.assertEqual(len(self.entries()), 2)
+
+    def test_other_versions_are_not_used(self):
+        get_template('{{ 1 }}', {})
+        with mock.patch('dbt.clients.jinja.dbt_version', '0.0.1'):
+            get_template('{{ 1 }}', {})
+        self.assertEqual(len(self.entries()), 2)
+
+    def test_corrupt_entries_are_recompiled(self):
+        get_template('{{ 1 + 1 }}', {})
+        (entry,) = self.entries()
+        with open(os.path.join(self.cache_dir, entry), 'wb') as fp:
+            fp.write(b'not bytecode')
+        self.assertEqual(get_template('{{ 1 + 1 }}', {}).render(), '2')
+
+    def test_least_recently_used_entries_are_evicted(self):
+        def entry(index):
+            return MacroFuzzEnvironment().bytecode_cache_key(f'{{{{ {index} }}}}') + '.cache'
+
+        for index in range(3):
+            get_template(f'{{{{ {index} }}}}', {})
+        for index, mtime in enumerate([500, 1000, 2000]):
+            os.utime(os.path.join(self.cache_dir, entry(index)), (mtime, mtime))
+        entry_size = os.path.getsize(os.path.join(self.cache_dir, entry(0)))
+        set_bytecode_cache_path(None)
+        set_bytecode_cache_path(self.tempdir.name, max_size=int(entry_size * 3.5))
+
+        # using the oldest entry makes it the most recently used one, so a
+        # fourth entry evicts the other two
+        get_template('{{ 0 }}', {})
+        get_template('{{ 3 }}', {})
+        self.assertEqual(self.entries(), sorted([entry(0), entry(3)]))
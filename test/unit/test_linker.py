@@ -1,8 +1,11 @@
 import os
+import random
 import tempfile
 import unittest
 from unittest import mock
 
+import networkx as nx
+
 from dbt import compilation
 try:
     from queue import Empty
@@ -11,6 +14,7 @@ except ImportError:
 
 from dbt.graph.selector import NodeSelector
 from dbt.graph.cli import parse_difference
+from dbt.node_types import NodeType
 
 
 def _mock_manifest(nodes):
@@ -63,11 +67,11 @@ class LinkerTest(unittest.TestCase):
         """test join() without timeout risk"""
         self.assertEqual(queue.inner.unfinished_tasks, 0)
 
-    def _get_graph_queue(self, manifest, include=None, exclude=None):
+    def _get_graph_queue(self, manifest, include=None, exclude=None, timings=None):
         graph = compilation.Graph(self.linker.graph)
         selector = NodeSelector(graph, manifest)
         spec = parse_difference(include, exclude)
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, timings=timings)
 
     def test_linker_add_dependency(self):
         actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'C')]
@@ -165,6 +169,60 @@ class LinkerTest(unittest.TestCase):
         queue_2.mark_done('A')
         self.assert_would_join(queue_2)
 
+    def test_linker_diamond_waits_for_all_parents(self):
+        actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self._get_graph_queue(_mock_manifest('ABCD'))
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'D')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        queue.mark_done('D')
+
+        second = queue.get(block=False)
+        third = queue.get(block=False)
+        self.assertEqual({second.unique_id, third.unique_id}, {'B', 'C'})
+        queue.mark_done(second.unique_id)
+        # A still has an unfinished parent
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        self.assertFalse(queue.empty())
+        queue.mark_done(third.unique_id)
+
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'A')
+        self.assertTrue(queue.empty())
+        queue.mark_done('A')
+        self.assert_would_join(queue)
+
+    def test_linker_critical_path_priority(self):
+        actual_deps = [('A', 'B')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node('Y')
+        self.linker.add_node('Z')
+
+        # Z is slow and has no children, but outweighs the B -> A chain
+        timings = {'A': 1.0, 'B': 2.0, 'Z': 10.0}
+        queue = self._get_graph_queue(_mock_manifest('ABYZ'), timings=timings)
+        self.assertEqual(queue.predict_makespan(1), 13.0)
+        self.assertEqual(queue.predict_makespan(2), 10.0)
+
+        got = [queue.get(block=False).unique_id for _ in range(3)]
+        # Y has no history, so it falls back to its depth behind the others
+        self.assertEqual(got, ['Z', 'B', 'Y'])
+        for unique_id in got:
+            queue.mark_done(unique_id)
+
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'A')
+        queue.mark_done('A')
+        self.assert_would_join(queue)
+
     def test__find_cycles__cycles(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'A')]
 
@@ -179,4 +237,116 @@ class LinkerTest(unittest.TestCase):
         for (l, r) in actual_deps:
             self.linker.dependency(l, r)
 
-        self.assertIsNone(self.linker.find_cycles())
\ No newline at end of file
+        self.assertIsNone(self.linker.find_cycles())
+
+
+def _reference_add_test_edges(linker, manifest):
+    """The original implementation of Compiler.add_test_edges, which walks
+    everything upstream of every node.
+    """
+    for node_id in linker.graph:
+        if (
+            node_id in manifest.nodes
+            and manifest.nodes[node_id].resource_type != NodeType.Test
+        ):
+            all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
+            upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
+            upstream_tests = []
+            for upstream_node in upstream_nodes:
+                upstream_tests += compilation._get_tests_for_node(manifest, upstream_node)
+            for upstream_test in upstream_tests:
+                test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
+                if test_depends_on.issubset(upstream_nodes):
+                    linker.graph.add_edge(upstream_test, node_id)
+
+
+def _random_project(seed):
+    """Build a random linked graph of sources, models and tests, returning
+    the linker and a manifest with nodes and a child map.
+    """
+    rng = random.Random(seed)
+    sources = [f'source.pkg.s{i}' for i in range(rng.randint(0, 5))]
+    models = [f'model.pkg.m{i}' for i in range(rng.randint(1, 40))]
+    nodes = {}
+    depends_on = {}
+    for index, model in enumerate(models):
+        candidates = sources + models[:index]
+        depends_on[model] = rng.sample(candidates, min(len(candidates), rng.randint(0, 3)))
+        nodes[model] = mock.MagicMock(resource_type=NodeType.Model)
+    for index in range(rng.randint(0, 40)):
+        test = f'test.pkg.t{index}'
+        depends_on[test] = rng.sample(sources + models, min(len(models), rng.randint(1, 3)))
+        nodes[test] = mock.MagicMock(resource_type=NodeType.Test)
+    for unique_id, deps in depends_on.items():
+        nodes[unique_id].depends_on_nodes = deps
+
+    linker = compilation.Linker()
+    child_map = {unique_id: [] for unique_id in sources + list(nodes)}
+    for source in sources:
+        linker.add_node(source)
+    for unique_id, deps in depends_on.items():
+        linker.add_node(unique_id)
+        for dep in deps:
+            linker.dependency(unique_id, dep)
+            child_map[dep].append(unique_id)
+
+    manifest = mock.MagicMock(nodes=nodes, child_map=child_map)
+    return linker, manifest
+
+
+class AddTestEdgesTest(unittest.TestCase):
+    def test_add_test_edges_example(self):
+        linker = compilation.Linker()
+        linker.dependency('model.pkg.model2', 'model.pkg.model1')
+        linker.dependency('model.pkg.model3', 'model.pkg.model2')
+        linker.dependency('test.pkg.test1', 'model.pkg.model1')
+        linker.dependency('test.pkg.test2', 'model.pkg.model2')
+        manifest = mock.MagicMock(
+            nodes={
+                'model.pkg.model1': mock.MagicMock(resource_type=NodeType.Model),
+                'model.pkg.model2': mock.MagicMock(resource_type=NodeType.Model),
+                'model.pkg.model3': mock.MagicMock(resource_type=NodeType.Model),
+                'test.pkg.test1': mock.MagicMock(
+                    resource_type=NodeType.Test, depends_on_nodes=['model.pkg.model1']
+                ),
+                'test.pkg.test2': mock.MagicMock(
+                    resource_type=NodeType.Test, depends_on_nodes=['model.pkg.model2']
+                ),
+            },
+            child_map={
+                'model.pkg.model1': ['model.pkg.model2', 'test.pkg.test1'],
+                'model.pkg.model2': ['model.pkg.model3', 'test.pkg.test2'],
+                'model.pkg.model3': [],
+                'test.pkg.test1': [],
+                'test.pkg.test2': [],
+            },
+        )
+
+        compilation.Compiler(mock.MagicMock()).add_test_edges(linker, manifest)
+
+        self.assertEqual(
+            set(linker.edges()),
+            {
+                ('model.pkg.model1', 'model.pkg.model2'),
+                ('model.pkg.model2', 'model.pkg.model3'),
+                ('model.pkg.model1', 'test.pkg.test1'),
+                ('model.pkg.model2', 'test.pkg.test2'),
+                ('test.pkg.test1', 'model.pkg.model2'),
+                ('test.pkg.test1', 'model.pkg.model3'),
+                ('test.pkg.test2', 'model.pkg.model3'),
+            },
+        )
+
+    def test_add_test_edges_matches_reference(self):
+        compiler = compilation.Compiler(mock.MagicMock())
+        for seed in range(50):
+            linker, manifest = _random_project(seed)
+            reference_linker = compilation.Linker()
+            reference_linker.graph = linker.graph.copy()
+
+            compiler.add_test_edges(linker, manifest)
+            _reference_add_test_edges(reference_linker, manifest)
+
+            self.assertEqual(
+                set(linker.edges()), set(reference_linker.edges()), f'seed {seed}'
+            )
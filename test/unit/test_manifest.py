@@ -1,4 +1,6 @@
+import json
 import os
+import tempfile
 import unittest
 from unittest import mock
 
@@ -10,10 +12,11 @@ from datetime import datetime
 import pytest
 
 import dbt.flags
+import dbt.utils
 import dbt.version
 from dbt import tracking
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import Manifest, ManifestMetadata, WritableManifest
 from dbt.contracts.graph.parsed import (
     ParsedModelNode,
     DependsOn,
@@ -389,6 +392,32 @@ class ManifestTest(unittest.TestCase):
             []
         )
 
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test_write(self):
+        nodes = copy.copy(self.nested_nodes)
+        nodes['model.root.dep'].config_call_dict = {'materialized': 'ephemeral'}
+        disabled = {'model.root.disabled': [copy.copy(nodes['model.root.sibling'])]}
+        manifest = Manifest(
+            nodes=nodes, sources={}, macros={}, docs={}, disabled=disabled, files={},
+            exposures=copy.copy(self.exposures), metrics=copy.copy(self.metrics), selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        writable = manifest.writable_manifest()
+        with tempfile.TemporaryDirectory() as target_path:
+            path = os.path.join(target_path, 'manifest.json')
+            with mock.patch.object(
+                WritableManifest, 'to_dict', autospec=True, side_effect=WritableManifest.to_dict
+            ) as to_dict:
+                writable.write(path)
+            # only the metadata and the other small fields were serialized at once
+            to_dict.assert_called_once()
+            self.assertEqual(to_dict.call_args[0][0].nodes, {})
+            with open(path) as fp:
+                written = fp.read()
+        expected = json.dumps(writable.to_dict(omit_none=False), cls=dbt.utils.JSONEncoder)
+        self.assertEqual(written, expected)
+        self.assertNotIn('config_call_dict', json.loads(written)['nodes']['model.root.dep'])
+
     def test__build_flat_graph(self):
         exposures = copy.copy(self.exposures)
         metrics = copy.copy(self.metrics)
@@ -0,0 +1,172 @@
+import json
+import os
+import tempfile
+import types
+import unittest
+from contextlib import nullcontext
+from unittest import mock
+
+import yaml
+
+import dbt.flags
+from dbt import tracking
+from dbt.adapters.factory import register_adapter, reset_adapters
+from dbt.adapters.postgres import Plugin as PostgresPlugin
+from dbt.exceptions import CompilationException
+from dbt.parser.manifest import ManifestLoader
+from dbt.parser.parallel import parse_files_in_processes
+
+from .utils import config_from_parts_or_dicts, inject_plugin
+
+
+def _model_sql(index):
+    if index == 0:
+        return 'select 0 as id'
+    return f"select {index} as id from {{{{ ref('model_{index - 1}') }}}}"
+
+
+def _schema_yml(index):
+    models = [
+        {
+            'name': f'model_{i}',
+            'description': f'model {i}',
+            'columns': [{'name': 'id', 'tests': ['unique', 'not_null']}],
+        }
+        for i in range(index * 5, index * 5 + 5)
+    ]
+    sources = [
+        {
+            'name': f'source_{index}',
+            'tables': [{'name': 'table', 'columns': [{'name': 'id', 'tests': ['not_null']}]}],
+        }
+    ]
+    return yaml.safe_dump({'version': 2, 'models': models, 'sources': sources})
+
+
+class ExampleProjectMixin:
+    """Writes a small project with models, tests, snapshots and schema files
+    to a temporary directory, and loads its manifest."""
+
+    def setUp(self):
+        tracking.do_not_track()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = self.tempdir.name
+        contents = {f'models/model_{i}.sql': _model_sql(i) for i in range(30)}
+        contents.update({f'models/schema_{i}.yml': _schema_yml(i) for i in range(6)})
+        contents.update({
+            'models/disabled.sql': '{{ config(enabled=false) }} select 1 as id',
+            'models/env.sql': "select '{{ env_var(\"DBT_TEST_PARSE_WORKERS\", \"x\") }}' as id",
+            'snapshots/snap.sql': (
+                "{% snapshot snap %}{{ config(target_schema='s', unique_key='id', "
+                "strategy='check', check_cols='all') }} select 1 as id {% endsnapshot %}"
+            ),
+            'snapshots/snap_2.sql': (
+                "{% snapshot snap_2 %}{{ config(target_schema='s', unique_key='id', "
+                "strategy='check', check_cols='all') }} select 2 as id {% endsnapshot %}"
+            ),
+            'tests/test_0.sql': "select * from {{ ref('model_0') }} where false",
+            'tests/test_1.sql': "select * from {{ ref('model_1') }} where false",
+        })
+        self.write_files(contents)
+
+        profile = {
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'threads': 4,
+                    'host': 'thishostshouldnotexist',
+                    'port': 5432,
+                    'user': 'root',
+                    'pass': 'password',
+                    'dbname': 'dbt',
+                    'schema': 'dbt_test'
+                }
+            },
+            'target': 'test'
+        }
+        project = {
+            'name': 'test_parse_workers',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': self.root,
+            'config-version': 2,
+            'target-path': os.path.join(self.root, 'target'),
+        }
+        self.write_files({
+            'dbt_project.yml': yaml.safe_dump(project),
+            'profiles.yml': yaml.safe_dump({'test': profile}),
+        })
+        self.config = config_from_parts_or_dicts(project=project, profile=profile)
+        dbt.flags.set_from_args(types.SimpleNamespace(profiles_dir=self.root), self.config)
+        dbt.flags.PARTIAL_PARSE = False
+        inject_plugin(PostgresPlugin)
+        # an adapter registered by an earlier test would keep its own config
+        reset_adapters()
+        register_adapter(self.config)
+
+    def tearDown(self):
+        dbt.flags.PARSE_WORKERS = 0
+        reset_adapters()
+        self.tempdir.cleanup()
+
+    def write_files(self, contents):
+        for path, text in contents.items():
+            full_path = os.path.join(self.root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as fp:
+                fp.write(text)
+
+    def load(self, parse_workers=0, freeze_time=True):
+        dbt.flags.PARSE_WORKERS = parse_workers
+        # nodes record when they were created, so freeze the clock to make
+        # separate parses comparable
+        with mock.patch('time.time', return_value=1000.0) if freeze_time else nullcontext():
+            loader = ManifestLoader(self.config, self.config.load_dependencies())
+            loader.load()
+        return loader.manifest
+
+    def serialize(self, manifest):
+        writable = manifest.writable_manifest().to_dict()
+        del writable['metadata']
+        files = {file_id: source_file.to_dict() for file_id, source_file in manifest.files.items()}
+        return json.dumps(writable), json.dumps(files), manifest.env_vars
+
+
+class ParseWorkersTest(ExampleProjectMixin, unittest.TestCase):
+    def test_parse_workers_match_serial(self):
+        calls = []
+
+        def record(parser, file_ids, max_workers):
+            result = parse_files_in_processes(parser, file_ids, max_workers)
+            calls.append((type(parser).__name__, result))
+            return result
+
+        with mock.patch('dbt.parser.manifest.parse_files_in_processes', side_effect=record):
+            parallel = self.load(parse_workers=3)
+        self.assertEqual(calls, [
+            ('ModelParser', True),
+            ('SnapshotParser', True),
+            ('SingularTestParser', True),
+            ('SchemaParser', True),
+        ])
+
+        serial = self.load(parse_workers=0)
+        self.assertEqual(self.serialize(parallel), self.serialize(serial))
+        self.assertIn('model.test_parse_workers.model_29', parallel.nodes)
+        self.assertIn('model.test_parse_workers.disabled', parallel.disabled)
+        self.assertEqual(len(parallel.sources), 6)
+
+    def test_conflicting_shards_fall_back_to_serial(self):
+        # two schema files patching the same model is an error in a serial
+        # parse, and must be the same error with parse workers
+        self.write_files({'models/schema_6.yml': _schema_yml(0)})
+        with self.assertRaises(CompilationException) as serial:
+            self.load(parse_workers=0)
+        with self.assertRaises(CompilationException) as parallel:
+            self.load(parse_workers=3)
+        self.assertEqual(str(parallel.exception), str(serial.exception))
+
+    def test_no_fork_parses_serially(self):
+        with mock.patch('multiprocessing.get_all_start_methods', return_value=['spawn']):
+            manifest = self.load(parse_workers=3)
+        self.assertEqual(self.serialize(manifest), self.serialize(self.load(parse_workers=0)))
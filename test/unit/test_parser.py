@@ -3,10 +3,12 @@ import unittest
 from unittest import mock
 
 import os
+import tempfile
 import yaml
 
 from copy import deepcopy
 import dbt.flags
+from dbt.clients.system import load_file_contents
 import dbt.parser
 from dbt import tracking
 from dbt.context.context_config import ContextConfig
@@ -21,6 +23,9 @@ from dbt.parser.schemas import (
 from dbt.parser.search import FileBlock
 from dbt.parser.generic_test_builders import YamlBlock
 from dbt.parser.sources import SourcePatcher
+from dbt.parser.read_files import (
+    PROJECT_FILE_TYPES, load_deferred_contents, read_files, read_files_for_parser
+)
 
 from dbt.node_types import NodeType
 from dbt.contracts.files import SourceFile, FileHash, FilePath, SchemaSourceFile
@@ -1116,3 +1121,112 @@ class AnalysisParserTest(BaseParserTest):
         self.assertEqual(self.parser.manifest.files[file_id].nodes, ['analysis.snowplow.analysis_1'])
 
 
+
+
+class ReadFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        root = self.tempdir.name
+        contents = {
+            'models/a.sql': 'select 1 as id',
+            'models/sub/b.sql': 'select * from {{ ref("a") }}',
+            'models/empty.yml': '# nothing here\n',
+            'models/schema.yml': 'version: 2\nmodels:\n  - name: a\n',
+            'models/other.yaml': 'version: 2\nmodels:\n  - name: b\n',
+            'macros/m.sql': '{% macro m() %}1{% endmacro %}',
+            'seeds/s.csv': 'id,name\n1,a\n',
+            'tests/t.sql': 'select 1 where false',
+            'tests/generic/g.sql': '{% test g(model) %}select 1{% endtest %}',
+            'docs/d.md': '{% docs d %}doc{% enddocs %}',
+        }
+        for path, text in contents.items():
+            full_path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as fp:
+                fp.write(text)
+        self.project = mock.MagicMock(
+            project_root=root,
+            project_name='root',
+            macro_paths=['macros'],
+            model_paths=['models'],
+            snapshot_paths=['snapshots'],
+            analysis_paths=['analyses'],
+            test_paths=['tests'],
+            generic_test_paths=['tests/generic'],
+            seed_paths=['seeds'],
+            docs_paths=['models', 'docs'],
+            all_source_paths=['models', 'seeds', 'snapshots', 'analyses', 'macros'],
+        )
+        self.file_stat_patcher = mock.patch.object(dbt.flags, 'PARTIAL_PARSE_FILE_STAT', True)
+        self.file_stat_patcher.start()
+
+    def tearDown(self):
+        self.file_stat_patcher.stop()
+        self.tempdir.cleanup()
+
+    def test_concurrent_read_matches_serial(self):
+        files, parser_files = {}, {}
+        read_files(self.project, files, parser_files, {})
+
+        serial_files, serial_parser_files = {}, {}
+        for parser_name, paths_attr, extension, parse_ft in PROJECT_FILE_TYPES:
+            file_ids = read_files_for_parser(
+                self.project,
+                serial_files,
+                getattr(self.project, paths_attr),
+                extension,
+                parse_ft,
+                {},
+            )
+            serial_parser_files.setdefault(parser_name, []).extend(file_ids)
+
+        self.assertEqual(parser_files, {'root': serial_parser_files})
+        self.assertEqual(list(files), list(serial_files))
+        self.assertEqual(files, serial_files)
+        self.assertEqual(len(serial_parser_files['SchemaParser']), 2)
+        self.assertEqual(len(serial_parser_files['SingularTestParser']), 1)
+        self.assertEqual(files['root://seeds/s.csv'].checksum, FileHash.from_contents('id,name\n1,a\n'))
+
+    def test_unchanged_files_are_not_read(self):
+        saved_files, parser_files = {}, {}
+        read_files(self.project, saved_files, parser_files, {})
+
+        files = {}
+        with mock.patch(
+            'dbt.parser.read_files.load_file_contents', wraps=load_file_contents
+        ) as patched:
+            read_files(self.project, files, {}, saved_files)
+        # empty.yml has no yaml content, so it was never saved and is read again
+        read_paths = [call.args[0] for call in patched.call_args_list]
+        self.assertEqual(read_paths, [os.path.join(self.tempdir.name, 'models', 'empty.yml')])
+        self.assertEqual(list(files), list(saved_files))
+        for file_id, source_file in files.items():
+            self.assertEqual(source_file.checksum, saved_files[file_id].checksum)
+        model = files['root://models/a.sql']
+        self.assertIsNone(model.contents)
+        self.assertEqual(files['root://models/schema.yml'].dfy, {'version': 2, 'models': [{'name': 'a'}]})
+
+        load_deferred_contents(files.values())
+        self.assertEqual(model.contents, 'select 1 as id')
+
+    def test_changed_files_are_read(self):
+        saved_files = {}
+        read_files(self.project, saved_files, {}, {})
+        path = os.path.join(self.tempdir.name, 'models', 'a.sql')
+        with open(path, 'w') as fp:
+            fp.write('select 2 as id, 3 as other')
+
+        files = {}
+        read_files(self.project, files, {}, saved_files)
+        model = files['root://models/a.sql']
+        self.assertEqual(model.contents, 'select 2 as id, 3 as other')
+        self.assertNotEqual(model.checksum, saved_files['root://models/a.sql'].checksum)
+
+    def test_file_stat_opt_out(self):
+        saved_files = {}
+        read_files(self.project, saved_files, {}, {})
+
+        files = {}
+        with mock.patch.object(dbt.flags, 'PARTIAL_PARSE_FILE_STAT', False):
+            read_files(self.project, files, {}, saved_files)
+        self.assertEqual(files['root://models/a.sql'].contents, 'select 1 as id')
@@ -0,0 +1,217 @@
+import copy
+import json
+import os
+import unittest
+from unittest import mock
+
+from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.manifest import _warn_for_unused_resource_config_paths
+from dbt.parser.partial_parse_file import (
+    FLAT_GRAPH_COLLECTIONS,
+    LazyMapping,
+    PartialParseStore,
+    build_flat_graph,
+    read_partial_parse_file,
+)
+
+from .test_parallel_parser import ExampleProjectMixin
+
+
+class PartialParseFileTest(ExampleProjectMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.root, 'target', 'partial_parse.msgpack')
+        self.store = PartialParseStore(self.path)
+
+    def segments(self):
+        target = os.path.dirname(self.path)
+        return sorted(name for name in os.listdir(target) if name.endswith('.data'))
+
+    def segment_size(self):
+        (name,) = self.segments()
+        return os.path.getsize(os.path.join(os.path.dirname(self.path), name))
+
+    def test_round_trip(self):
+        manifest = self.load()
+        saved = read_partial_parse_file(self.path)
+
+        self.assertIsInstance(saved.nodes, LazyMapping)
+        self.assertIsInstance(saved.files, LazyMapping)
+        self.assertEqual(list(saved.nodes), list(manifest.nodes))
+        self.assertEqual(saved.state_check, manifest.state_check)
+        self.assertEqual(self.serialize(saved), self.serialize(manifest))
+        # the legacy format serializes the manifest the same way
+        self.assertEqual(
+            Manifest.from_msgpack(saved.to_msgpack()).to_dict(), manifest.to_dict()
+        )
+
+    def test_nodes_are_deserialized_on_first_access(self):
+        manifest = self.load()
+        saved = read_partial_parse_file(self.path)
+        unique_id = 'model.test_parse_workers.model_3'
+
+        with mock.patch.object(saved.nodes, '_decode', wraps=saved.nodes._decode) as decode:
+            self.assertIn(unique_id, saved.nodes)
+            self.assertEqual(len(saved.nodes), len(manifest.nodes))
+            decode.assert_not_called()
+            node = saved.nodes[unique_id]
+            self.assertEqual(node.to_dict(), manifest.nodes[unique_id].to_dict())
+            self.assertIs(saved.nodes[unique_id], node)
+            self.assertEqual(decode.call_count, 1)
+            # everything else is deserialized at once when iterating over values
+            self.assertEqual(
+                [node.to_dict() for node in saved.nodes.values()],
+                [node.to_dict() for node in manifest.nodes.values()],
+            )
+            self.assertEqual(decode.call_count, len(manifest.nodes))
+
+        del saved.nodes[unique_id]
+        saved.nodes[unique_id] = node
+        self.assertEqual(list(saved.nodes)[-1], unique_id)
+        self.assertNotIn(unique_id, saved.nodes.locations)
+        copied = copy.deepcopy(saved.nodes)
+        self.assertIs(type(copied), dict)
+        self.assertEqual(list(copied), list(saved.nodes))
+
+    def test_header_only(self):
+        manifest = self.load()
+        header = self.store.read_header()
+        self.assertEqual(header.state_check, manifest.state_check)
+        self.assertEqual(header.metadata.dbt_version, manifest.metadata.dbt_version)
+        self.assertEqual(header.nodes, {})
+
+    def test_not_a_partial_parse_file(self):
+        manifest = self.load()
+        with open(self.path, 'wb') as fp:
+            fp.write(manifest.to_msgpack())
+        with self.assertRaises(Exception):
+            self.store.read_header()
+
+    def test_saved_manifest_is_used(self):
+        with mock.patch('dbt.flags.PARTIAL_PARSE', True):
+            manifest = self.load(freeze_time=False)
+            with mock.patch.object(
+                PartialParseStore, 'read_manifest', autospec=True,
+                side_effect=PartialParseStore.read_manifest,
+            ) as read_manifest:
+                reloaded = self.load(freeze_time=False)
+        read_manifest.assert_called_once()
+        # env.sql uses an env var, so partial parsing parses it again
+        expected, actual = (json.loads(self.serialize(m)[0]) for m in (manifest, reloaded))
+        env_model = 'model.test_parse_workers.env'
+        self.assertGreater(
+            actual['nodes'].pop(env_model)['created_at'],
+            expected['nodes'].pop(env_model)['created_at'],
+        )
+        self.assertEqual(actual, expected)
+        saved = read_partial_parse_file(self.path)
+        self.assertEqual(list(saved.nodes), list(reloaded.nodes))
+        self.assertEqual(self.serialize(saved), self.serialize(reloaded))
+
+    def test_unchanged_manifest_is_not_deserialized(self):
+        # env.sql uses an env var, which would make partial parsing parse it again
+        os.remove(os.path.join(self.root, 'models', 'env.sql'))
+        with mock.patch('dbt.flags.PARTIAL_PARSE', True):
+            manifest = self.load(freeze_time=False)
+            with mock.patch.object(
+                LazyMapping, '_hydrate', autospec=True, side_effect=LazyMapping._hydrate,
+            ) as hydrate:
+                reloaded = self.load(freeze_time=False)
+                build_flat_graph(reloaded)
+                _warn_for_unused_resource_config_paths(reloaded, self.config)
+
+        self.assertIsInstance(reloaded.nodes, LazyMapping)
+        hydrated = {id(call[0][0]) for call in hydrate.call_args_list}
+        for name in FLAT_GRAPH_COLLECTIONS:
+            self.assertNotIn(id(getattr(reloaded, name)), hydrated)
+        manifest.build_flat_graph()
+        self.assertEqual(reloaded.flat_graph, manifest.flat_graph)
+
+    def test_flat_graph_of_replaced_records(self):
+        self.load()
+        saved = read_partial_parse_file(self.path)
+        unique_id = 'model.test_parse_workers.model_5'
+        node = copy.deepcopy(saved.nodes[unique_id])
+        node.raw_sql = 'select 5 as id, 1 as changed'
+        saved.nodes[unique_id] = node
+
+        build_flat_graph(saved)
+        flat_graph = saved.flat_graph
+        self.assertEqual(flat_graph['nodes'][unique_id]['raw_sql'], node.raw_sql)
+        saved.build_flat_graph()
+        self.assertEqual(flat_graph, saved.flat_graph)
+
+    def test_only_changed_records_are_appended(self):
+        with mock.patch('dbt.flags.PARTIAL_PARSE', True):
+            self.load(freeze_time=False)
+            (segment,) = self.segments()
+            size = self.segment_size()
+
+            self.write_files({'models/model_5.sql': 'select 5 as id, 1 as changed'})
+            reloaded = self.load(freeze_time=False)
+
+        self.assertEqual(self.segments(), [segment])
+        saved = read_partial_parse_file(self.path)
+        appended = {
+            key
+            for name in ('files', 'nodes', 'macros', 'disabled')
+            for key, (offset, _) in getattr(saved, name).locations.items()
+            if offset >= size
+        }
+        # the changed model, the tests on it and the schema file that defines
+        # them, and env.sql, which uses an env var and is always reparsed
+        self.assertEqual(appended, {
+            'test_parse_workers://models/model_5.sql',
+            'model.test_parse_workers.model_5',
+            'test_parse_workers://models/schema_1.yml',
+            'test.test_parse_workers.not_null_model_5_id.5f0afa5bb5',
+            'test.test_parse_workers.unique_model_5_id.543874c6a9',
+            'test_parse_workers://models/env.sql',
+            'model.test_parse_workers.env',
+        })
+        self.assertIn('changed', saved.nodes['model.test_parse_workers.model_5'].raw_sql)
+        self.assertEqual(self.serialize(saved), self.serialize(reloaded))
+
+    def test_segment_is_compacted(self):
+        manifest = self.load()
+        saved = read_partial_parse_file(self.path)
+        (segment,) = self.segments()
+        size = self.segment_size()
+        # every write appends all the replaced nodes again, until more than
+        # half of the segment is unused
+        for unique_id, node in manifest.nodes.items():
+            saved.nodes[unique_id] = node
+        for _ in range(10):
+            self.store.write(saved)
+            if self.segments() != [segment]:
+                break
+            self.assertGreater(self.segment_size(), size)
+
+        self.assertEqual(len(self.segments()), 1)
+        self.assertNotEqual(self.segments(), [segment])
+        self.assertLessEqual(self.segment_size(), size)
+        self.assertEqual(
+            self.serialize(read_partial_parse_file(self.path)), self.serialize(manifest)
+        )
+
+    def test_uncommitted_records_are_ignored(self):
+        manifest = self.load()
+        saved = read_partial_parse_file(self.path)
+        size = self.segment_size()
+        # records appended by a write that didn't commit its index
+        with mock.patch('os.replace', side_effect=OSError('crashed')):
+            saved.nodes['model.test_parse_workers.model_0'] = copy.deepcopy(
+                manifest.nodes['model.test_parse_workers.model_1']
+            )
+            with self.assertRaises(OSError):
+                self.store.write(saved)
+        self.assertGreater(self.segment_size(), size)
+
+        reloaded = read_partial_parse_file(self.path)
+        self.assertEqual(self.serialize(reloaded), self.serialize(manifest))
+        # and the next write overwrites them
+        self.store.write(reloaded)
+        self.assertEqual(self.segment_size(), size)
+        self.assertEqual(
+            self.serialize(read_partial_parse_file(self.path)), self.serialize(manifest)
+        )
@@ -1,18 +1,25 @@
 import agate
+import datetime
 import decimal
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
+import pytz
+
 import dbt.flags as flags
 from dbt.task.debug import DebugTask
 
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import Plugin as PostgresPlugin
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.clients import agate_helper
-from dbt.exceptions import ValidationException, DbtConfigError
+from dbt.exceptions import CompilationException, ValidationException, DbtConfigError
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
 
@@ -209,6 +216,24 @@ class TestPostgresAdapter(unittest.TestCase):
 
         cursor.execute.assert_called_once_with('set role somerole')
 
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_released_connection_is_reused(self, psycopg2):
+        self.config.credentials = self.config.credentials.replace(role='somerole')
+        psycopg2.connect.return_value.closed = 0
+        with mock.patch.object(flags, 'REUSE_CONNECTIONS', True):
+            handle = self.adapter.acquire_connection('first').handle
+            self.adapter.release_connection()
+            connection = self.adapter.acquire_connection('second')
+            self.assertIs(connection.handle, handle)
+
+        psycopg2.connect.assert_called_once()
+        handle.rollback.assert_called_once()
+        handle.cursor.return_value.execute.assert_has_calls([
+            mock.call('set role somerole'),
+            mock.call('discard all'),
+            mock.call('set role somerole'),
+        ])
+
     @mock.patch('dbt.adapters.postgres.connections.psycopg2')
     def test_search_path(self, psycopg2):
         self.config.credentials = self.config.credentials.replace(search_path="test")
@@ -326,6 +351,99 @@ class TestPostgresAdapter(unittest.TestCase):
         )
         self.assertEqual(exceptions, [])
 
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_get_catalog_for_schemas(self, mock_get_schemas, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name']
+        mock_execute.return_value = agate.Table(rows=[('dbt', 'quux', 'bar')],
+                                                column_names=column_names)
+        info = mock.MagicMock(database='dbt')
+        mock_get_schemas.return_value = {info: {'foo', 'quux', 'skip'}}
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('dbt', 'foo'),
+                                                       ('dbt', 'quux')}
+
+        catalog, exceptions = self.adapter.get_catalog_for_schemas(
+            mock_manifest, {('dbt', 'quux'), ('other', 'foo')}
+        )
+        mock_execute.assert_called_once()
+        self.assertEqual(mock_execute.call_args[1]['kwargs']['schemas'], {'quux'})
+        self.assertEqual(set(map(tuple, catalog)), {('dbt', 'quux', 'bar')})
+        self.assertEqual(exceptions, [])
+
+        # nothing is queried when no schemas are wanted
+        mock_execute.reset_mock()
+        catalog, exceptions = self.adapter.get_catalog_for_schemas(mock_manifest, set())
+        mock_execute.assert_not_called()
+        self.assertEqual(len(catalog), 0)
+
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_calculate_freshness_batch(self, mock_execute):
+        column_names = ['source_index', 'max_loaded_at', 'snapshotted_at']
+        snapshotted_at = datetime.datetime(2022, 1, 1, 12)
+        sources = [
+            (self.adapter.Relation.create(schema='raw', identifier=name), 'loaded_at', None)
+            for name in ('a', 'b', 'c')
+        ]
+        # the rows can come back in any order
+        mock_execute.return_value = agate.Table(rows=[
+            (decimal.Decimal(2), None, snapshotted_at),
+            (decimal.Decimal(0), datetime.datetime(2022, 1, 1, 11), snapshotted_at),
+            (decimal.Decimal(1), datetime.datetime(2022, 1, 1, 10), snapshotted_at),
+        ], column_names=column_names)
+
+        results = self.adapter.calculate_freshness_batch(sources)
+        kwargs = mock_execute.call_args[1]['kwargs']
+        self.assertEqual([s['relation'] for s in kwargs['sources']], [s[0] for s in sources])
+        self.assertEqual(results[0]['age'], 3600)
+        self.assertEqual(results[1]['age'], 7200)
+        self.assertEqual(results[2]['max_loaded_at'].year, 1)
+        self.assertEqual(results[2]['snapshotted_at'], snapshotted_at.replace(tzinfo=pytz.UTC))
+
+        # a missing row is an error
+        mock_execute.return_value = agate.Table(rows=[
+            (decimal.Decimal(0), None, snapshotted_at),
+            (decimal.Decimal(0), None, snapshotted_at),
+            (decimal.Decimal(2), None, snapshotted_at),
+        ], column_names=column_names)
+        with self.assertRaises(CompilationException):
+            self.adapter.calculate_freshness_batch(sources)
+
+    @mock.patch.object(PostgresAdapter, 'list_relations_without_caching')
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_lazy_cache_queries_dependencies_once(self, mock_execute, mock_list_relations):
+        mock_list_relations.side_effect = lambda schema_relation: [
+            self.adapter.Relation.create(
+                database='postgres', schema=schema_relation.schema, identifier=name
+            )
+            for name in ('a', 'b')
+        ]
+        mock_execute.return_value = agate.Table(rows=[
+            ('one', 'a', 'two', 'a'),
+            ('two', 'b', 'two', 'a'),
+            ('three', 'a', 'one', 'b'),
+        ], column_names=['dependent_schema', 'dependent_name', 'referenced_schema', 'referenced_name'])
+        schemas = {
+            self.adapter.Relation.create(database='postgres', schema=schema)
+            for schema in ('one', 'two')
+        }
+        self.adapter.set_relations_cache(None, required_schemas=schemas, lazy=True)
+
+        self.adapter.list_relations('postgres', 'one')
+        self.adapter.list_relations('postgres', 'two')
+        mock_execute.assert_called_once()
+        dependents = self.adapter.cache.relations[('postgres', 'two', 'a')].referenced_by
+        self.assertEqual(
+            {(key.schema, key.identifier) for key in dependents}, {('one', 'a'), ('two', 'b')}
+        )
+
+        # the rows are queried again when the cache is set up for the next run
+        self.adapter.set_relations_cache(None, clear=True, required_schemas=schemas, lazy=True)
+        self.adapter.list_relations('postgres', 'one')
+        self.assertEqual(mock_execute.call_count, 2)
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -398,6 +516,55 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
         self.load_state_check.stop()
         clear_plugin(PostgresPlugin)
 
+    def _seed_table(self):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        path = os.path.join(tempdir, 'seed.csv')
+        with open(path, 'w') as fp:
+            fp.write('id,name,"is ok"\n1,"a, b",true\n2,,false\n3,"c""d",\n')
+        table = agate_helper.from_csv(path, (), sample_size=1)
+        relation = self.adapter.Relation.create(
+            database='postgres', schema='test_schema', identifier='seed'
+        )
+        return relation, table, path
+
+    def test_load_csv_bulk(self):
+        relation, table, path = self._seed_table()
+        copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, fp: copied.append(fp.read())
+
+        sql, rows = self.adapter.load_csv_bulk(
+            relation, table, path, 'id, name, "is ok"', '%s', 2
+        )
+
+        self.assertEqual(rows, 3)
+        self.assertEqual(
+            sql,
+            'copy "postgres"."test_schema"."seed" (id, name, "is ok") from stdin with (format csv)',
+        )
+        self.assertEqual(self.cursor.copy_expert.call_count, 2)
+        self.assertEqual(copied, ['1,"a, b",True\r\n2,,False\r\n', '3,"c""d",\r\n'])
+        self.cursor.executemany.assert_not_called()
+
+    def test_load_csv_bulk_executemany(self):
+        relation, table, path = self._seed_table()
+        with mock.patch.object(
+            PostgresAdapter, '_csv_bulk_load_sql', SQLAdapter._csv_bulk_load_sql
+        ), mock.patch.object(PostgresAdapter, '_load_csv_chunk', SQLAdapter._load_csv_chunk):
+            sql, rows = self.adapter.load_csv_bulk(
+                relation, table, path, 'id, name, "is ok"', '%s', 2
+            )
+
+        self.assertEqual(rows, 3)
+        self.assertEqual(
+            sql,
+            'insert into "postgres"."test_schema"."seed" (id, name, "is ok") values (%s, %s, %s)',
+        )
+        self.cursor.executemany.assert_has_calls([
+            mock.call(sql, [[1, 'a, b', True], [2, None, False]]),
+            mock.call(sql, [[3, 'c"d', None]]),
+        ])
+
     def test_quoting_on_drop_schema(self):
         relation = self.adapter.Relation.create(
             database='postgres', schema='test_schema',
@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+import dbt.utils
+from dbt.contracts.results import (
+    CatalogArtifact,
+    CatalogTable,
+    ColumnMetadata,
+    RunResult,
+    RunResultsArtifact,
+    RunStatus,
+    StatsItem,
+    TableMetadata,
+    TimingInfo,
+)
+
+
+class TestWriteArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, 'artifact.json')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def assert_written_as_json(self, artifact):
+        artifact.write(self.path)
+        with open(self.path) as fp:
+            written = fp.read()
+        expected = json.dumps(artifact.to_dict(omit_none=False), cls=dbt.utils.JSONEncoder)
+        self.assertEqual(written, expected)
+
+    def test_run_results(self):
+        results = [
+            RunResult(
+                status=RunStatus.Success,
+                timing=[TimingInfo('compile', datetime(2022, 1, 1), datetime(2022, 1, 2))],
+                thread_id='Thread-1',
+                execution_time=1.5,
+                adapter_response={'rows_affected': Decimal(10), 'code': 'SELECT'},
+                message='SELECT 10',
+                failures=None,
+                node=mock.Mock(unique_id=f'model.root.model_{index}'),
+            )
+            for index in range(3)
+        ]
+        artifact = RunResultsArtifact.from_execution_results(
+            results=results, elapsed_time=2.0, generated_at=datetime.utcnow(), args={'which': 'run'}
+        )
+        self.assert_written_as_json(artifact)
+
+        artifact.results = []
+        self.assert_written_as_json(artifact)
+
+    def test_catalog(self):
+        table = CatalogTable(
+            metadata=TableMetadata(type='BASE TABLE', schema='analytics', name='model_0'),
+            columns={'id': ColumnMetadata(type='integer', index=1, name='id')},
+            stats={
+                'has_stats': StatsItem(
+                    id='has_stats', label='Has Stats?', value=False, include=False
+                ),
+            },
+            unique_id='model.root.model_0',
+        )
+        artifact = CatalogArtifact.from_results(
+            generated_at=datetime.utcnow(),
+            nodes={'model.root.model_0': table},
+            sources={},
+            compile_results=object(),
+            errors=None,
+        )
+        self.assert_written_as_json(artifact)
@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import dbt.flags as flags
+from dbt.contracts.results import RunResultsArtifact
+from dbt.task.run import RunTask
+
+
+def make_run_results(execution_times):
+    return RunResultsArtifact.from_dict({
+        'metadata': {
+            'dbt_schema_version': str(RunResultsArtifact.dbt_schema_version),
+            'generated_at': '2022-01-01T00:00:00Z',
+        },
+        'results': [
+            {
+                'unique_id': unique_id, 'status': 'success', 'timing': [],
+                'thread_id': 'Thread-1', 'execution_time': execution_time,
+                'adapter_response': {}, 'message': None, 'failures': None,
+            }
+            for unique_id, execution_time in execution_times.items()
+        ],
+        'elapsed_time': 1.0,
+        'args': {'which': 'run'},
+    })
+
+
+class NodeTimingsTest(unittest.TestCase):
+    def setUp(self):
+        self.target_path = tempfile.mkdtemp()
+        self.task = RunTask.__new__(RunTask)
+        self.task.config = mock.MagicMock(target_path=self.target_path)
+        self.task.previous_state = None
+        self.patcher = mock.patch.object(flags, 'PRIORITIZE_CRITICAL_PATH', True)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.target_path)
+
+    def write_run_results(self, contents):
+        with open(os.path.join(self.target_path, 'run_results.json'), 'w') as fp:
+            fp.write(contents)
+
+    def test_timings_from_target_path(self):
+        make_run_results({'model.pkg.a': 1.5, 'model.pkg.b': 3.0}).write(
+            os.path.join(self.target_path, 'run_results.json')
+        )
+        self.assertEqual(self.task.get_node_timings(), {'model.pkg.a': 1.5, 'model.pkg.b': 3.0})
+
+        with mock.patch.object(flags, 'PRIORITIZE_CRITICAL_PATH', False):
+            self.assertIsNone(self.task.get_node_timings())
+
+    def test_state_is_preferred(self):
+        make_run_results({'model.pkg.a': 1.5}).write(
+            os.path.join(self.target_path, 'run_results.json')
+        )
+        self.task.previous_state = mock.MagicMock(results=make_run_results({'model.pkg.a': 7.0}))
+        self.assertEqual(self.task.get_node_timings(), {'model.pkg.a': 7.0})
+
+    def test_unreadable_run_results(self):
+        self.assertIsNone(self.task.get_node_timings())
+        self.write_run_results('{"metadata": {"dbt_schema_v')
+        self.assertIsNone(self.task.get_node_timings())
+        self.write_run_results('{"metadata": {}, "results": [{}]}')
+        self.assertIsNone(self.task.get_node_timings())
@@ -51,6 +51,24 @@ class SystemClient(unittest.TestCase):
         self.assertTrue(written)
         self.assertEqual(self.get_profile_text(), 'NEW_TEXT')
 
+    def test__write_file_chunks(self):
+        self.set_up_profile()
+        dbt.clients.system.write_file_chunks(self.profiles_path, iter(['NEW', '_', 'TEXT']))
+        self.assertEqual(self.get_profile_text(), 'NEW_TEXT')
+        self.assertEqual(os.listdir(self.tmp_dir), ['profiles.yml'])
+
+    def test__write_file_chunks_failure(self):
+        self.set_up_profile()
+
+        def chunks():
+            yield 'NEW'
+            raise ValueError('not serializable')
+
+        with self.assertRaises(ValueError):
+            dbt.clients.system.write_file_chunks(self.profiles_path, chunks())
+        self.assertEqual(self.get_profile_text(), 'ORIGINAL_TEXT')
+        self.assertEqual(os.listdir(self.tmp_dir), ['profiles.yml'])
+
 
 class TestRunCmd(unittest.TestCase):
     """Test `run_cmd`.
@@ -158,6 +176,8 @@ class TestFindMatching(unittest.TestCase):
                 'absolute_path': named_file.name,
                 'relative_path': os.path.basename(named_file.name),
                 'modification_time': out[0]['modification_time'],
+                'file_size': 0,
+                'inode': os.stat(named_file.name).st_ino,
             }]
             self.assertEqual(out, expected_output)
 
@@ -173,6 +193,8 @@ class TestFindMatching(unittest.TestCase):
                 'absolute_path': named_file.name,
                 'relative_path': os.path.basename(named_file.name),
                 'modification_time': out[0]['modification_time'],
+                'file_size': 0,
+                'inode': os.stat(named_file.name).st_ino,
             }]
             self.assertEqual(out, expected_output)
 
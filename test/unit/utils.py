@@ -256,7 +256,7 @@ class TestAdapterConversions(TestCase):
         if column_type is agate.TimeDelta:  # dbt never makes this!
             return agate.TimeDelta()
 
-        for instance in agate_helper.DEFAULT_TYPE_TESTER._possible_types:
+        for instance in agate_helper.DEFAULT_TYPE_TESTER.types:
             if isinstance(instance, column_type):  # include child types
                 return instance
 
@@ -0,0 +1,3 @@
+from typing import Any, Iterable, Iterator, List
+
+def reader(f: Iterable[str], **kwargs: Any) -> Iterator[List[str]]: ...
@@ -6,7 +6,7 @@ class DataType:
     null_values: Any = ...
     def __init__(self, null_values: Any = ...) -> None: ...
     def test(self, d: Any): ...
-    def cast(self, d: Any) -> None: ...
+    def cast(self, d: Any) -> Any: ...
     def csvify(self, d: Any): ...
     def jsonify(self, d: Any): ...
 
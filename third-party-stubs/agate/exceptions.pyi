@@ -0,0 +1 @@
+class CastError(Exception): ...
@@ -0,0 +1,3 @@
+from typing import List, Sequence
+
+def deduplicate(values: Sequence[str], column_names: bool = ...) -> List[str]: ...
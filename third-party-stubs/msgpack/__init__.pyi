@@ -0,0 +1,23 @@
+from typing import Any, Callable, Optional
+
+def packb(
+    o: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = ...,
+    use_single_float: bool = ...,
+    use_bin_type: bool = ...,
+    strict_types: bool = ...,
+    datetime: bool = ...,
+    unicode_errors: Optional[str] = ...,
+) -> bytes: ...
+def unpackb(
+    packed: bytes,
+    *,
+    raw: bool = ...,
+    use_list: bool = ...,
+    strict_map_key: bool = ...,
+    object_hook: Optional[Callable[[Any], Any]] = ...,
+    list_hook: Optional[Callable[[Any], Any]] = ...,
+    unicode_errors: Optional[str] = ...,
+    max_buffer_size: int = ...,
+) -> Any: ...